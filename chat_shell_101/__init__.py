@@ -5,8 +5,22 @@ Chat Shell 101 - Simplified CLI chat tool with LangGraph and OpenAI.
 __version__ = "0.1.0"
 __author__ = "Chat Shell Team"
 
-from .cli import main
-from .agent import ChatAgent
-from .config import Config
+__all__ = ["main", "ChatAgent", "Config", "__version__"]
 
-__all__ = ["main", "ChatAgent", "Config", "__version__"]
\ No newline at end of file
+
+def __getattr__(name):
+    """Import the public names on first access.
+
+    Importing a submodule such as ``chat_shell_101.config`` then no longer
+    loads the CLI and the agent stack as a side effect.
+    """
+    if name == "main":
+        from .cli import main
+        return main
+    if name == "ChatAgent":
+        from .agent import ChatAgent
+        return ChatAgent
+    if name == "Config":
+        from .config import Config
+        return Config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
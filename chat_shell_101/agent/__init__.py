@@ -8,6 +8,7 @@ including configuration, building, context compression, and checkpointing.
 from .agent import ChatAgent, AgentState, ToolIterationLimitError
 from .builder import LangGraphAgentBuilder
 from .config import AgentConfig
+from .prompt import PromptManager, SessionPrompt
 from .compressor import (
     MessageCompressor,
     CompressionResult,
@@ -24,6 +25,9 @@ __all__ = [
     "LangGraphAgentBuilder",
     # Configuration
     "AgentConfig",
+    # Prompt caching
+    "PromptManager",
+    "SessionPrompt",
     # Compression
     "MessageCompressor",
     "CompressionResult",
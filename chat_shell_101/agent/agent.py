@@ -3,10 +3,12 @@ LangGraph ReAct agent for Chat Shell 101.
 """
 
 import asyncio
-from typing import Dict, List, Any, AsyncGenerator, Annotated, Optional
-from pydantic import BaseModel, Field
+import itertools
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, AsyncGenerator, Annotated, Optional, Tuple
 
-from langchain_core.messages import HumanMessage, AIMessage, SystemMessage, ToolMessage
+from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage, ToolMessage
 from langgraph.graph import StateGraph, END
 from langgraph.graph.message import add_messages
 from langgraph.checkpoint.base import BaseCheckpointSaver
@@ -14,10 +16,25 @@ from langgraph.checkpoint.base import BaseCheckpointSaver
 from ..config import config as global_config
 from ..tools.registry import tool_registry
 from ..tools.base import PromptModifierTool
-from ..utils import format_tool_call, format_tool_result, format_thinking
-from ..models import ModelFactory, ModelConfig, ProviderConfig
+from ..models import ModelFactory, ModelConfig, ModelProvider, ProviderConfig, ModelNotSupportedError
 from .config import AgentConfig
 from .compressor import MessageCompressor, CompressionStrategy
+from .prompt import PromptManager
+
+
+# Maximum number of converted message prefixes kept by ChatAgent
+LC_CACHE_SIZE = 128
+
+
+def _content_text(content: Any) -> str:
+    """Return the text of message content given as a string or content blocks."""
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block if isinstance(block, str) else block.get("text", "")
+        for block in content
+        if isinstance(block, str) or block.get("type") == "text"
+    )
 
 
 class ToolIterationLimitError(Exception):
@@ -25,18 +42,37 @@ class ToolIterationLimitError(Exception):
     pass
 
 
-class AgentState(BaseModel):
-    """State for the agent graph."""
-    messages: Annotated[List[Any], add_messages] = []
-    iteration_count: int = Field(default=0, description="Number of tool execution cycles")
-    system_prompt: str = Field(default="You are a helpful AI assistant.", description="Current system prompt")
+@dataclass
+class AgentState:
+    """State for the agent graph.
+
+    A plain dataclass rather than a Pydantic model, so LangGraph does not
+    re-validate every message on each node transition. Nodes return partial
+    updates and the ``add_messages`` reducer appends them.
+
+    Attributes:
+        messages: Conversation messages, merged with ``add_messages``
+        iteration_count: Number of tool execution cycles
+        system_prompt: Current system prompt
+    """
+    messages: Annotated[List[BaseMessage], add_messages] = field(default_factory=list)
+    iteration_count: int = 0
+    system_prompt: str = "You are a helpful AI assistant."
 
 
 class ChatAgent:
     """Chat agent with ReAct pattern using LangGraph."""
 
-    def __init__(self, config: Optional[AgentConfig] = None):
+    def __init__(self, config: Optional[AgentConfig] = None, http_client: Optional[Any] = None):
+        """Create an agent.
+
+        Args:
+            config: Agent configuration, defaults to ``AgentConfig()``
+            http_client: Async HTTP client shared with other agents to reuse
+                connections (OpenAI only). The caller owns and closes it.
+        """
         self.config = config or AgentConfig()
+        self.http_client = http_client
         self.llm = None
         self.tools = []
         self.tools_by_name = {}
@@ -55,6 +91,40 @@ class ChatAgent:
                 strategy=CompressionStrategy.WINDOW,
             )
 
+        # Converted LangChain messages keyed by rolling hash of (role, content)
+        self._lc_cache: "OrderedDict[int, Tuple[Tuple[Tuple[str, str], ...], List[BaseMessage]]]" = OrderedDict()
+
+        # Per-session byte-stable prompt prefixes for provider prompt caching
+        self.prompts = PromptManager(
+            system_prompt=self.config.system_prompt,
+            cache_control=self._uses_cache_control(),
+        )
+
+    def _uses_cache_control(self) -> bool:
+        """Check whether the provider needs explicit cache breakpoints.
+
+        Only Anthropic takes ``cache_control`` markers. OpenAI and DeepSeek
+        (served through the OpenAI-compatible client) cache byte-stable
+        prefixes automatically, so they get no markers.
+        """
+        if self.config.provider:
+            return self.config.provider.lower() == ModelProvider.ANTHROPIC.value
+        model = self.config.model or global_config.openai.model
+        if not model:
+            return False
+        try:
+            return ModelFactory.detect_provider(model) == ModelProvider.ANTHROPIC
+        except ModelNotSupportedError:
+            return False
+
+    def append_user(self, session_id: str, content: str) -> None:
+        """Queue a user message as the next turn of a session.
+
+        Use together with ``stream(session_id=...)``, which sends the cached
+        session prefix followed by this message.
+        """
+        self.prompts.append_user(session_id, content)
+
     def with_checkpointer(self, checkpointer: BaseCheckpointSaver) -> "ChatAgent":
         """Set the checkpointer for session persistence."""
         self._checkpointer = checkpointer
@@ -74,6 +144,7 @@ class ChatAgent:
             provider_config=ProviderConfig(
                 api_key=global_config.openai.api_key,
                 base_url=global_config.openai.base_url,
+                http_client=self.http_client,
             ),
         )
 
@@ -82,10 +153,12 @@ class ChatAgent:
         # Get internal tools from registry (for execution)
         all_tools = tool_registry.get_all_tools()
 
-        # Filter tools if specific tools are requested
-        if self.config.tools:
+        # Filter tools if specific tools are requested; the names are
+        # snapshotted into a set once for the three filters below
+        wanted = frozenset(self.config.tools or ())
+        if wanted:
             self.internal_tools = [
-                t for t in all_tools if t.name in self.config.tools
+                t for t in all_tools if t.name in wanted
             ]
         else:
             self.internal_tools = all_tools
@@ -94,12 +167,18 @@ class ChatAgent:
 
         # Get LangChain tools from registry (for LLM binding)
         self.tools = tool_registry.to_langchain_tools()
-        if self.config.tools:
+        if wanted:
             # Filter to only requested tools
-            self.tools = [t for t in self.tools if t.name in self.config.tools]
-
-        # Bind tools to LLM
-        self.llm_with_tools = self.llm.bind_tools(self.tools)
+            self.tools = [t for t in self.tools if t.name in wanted]
+
+        # Bind tools to LLM using the registry's cached JSON schemas
+        tool_specs = tool_registry.get_tool_specs()
+        if wanted:
+            tool_specs = [
+                spec for spec in tool_specs
+                if spec["function"]["name"] in wanted
+            ]
+        self.llm_with_tools = self.llm.bind_tools(tool_specs)
 
         # Build the graph
         self.graph = self._build_graph()
@@ -132,7 +211,9 @@ class ChatAgent:
             has_system = False
             for i, msg in enumerate(messages):
                 if isinstance(msg, SystemMessage):
-                    messages[i] = SystemMessage(content=system_prompt)
+                    # Keep a matching message so its cache_control survives
+                    if _content_text(msg.content) != system_prompt:
+                        messages[i] = SystemMessage(content=system_prompt)
                     has_system = True
                     break
 
@@ -154,31 +235,7 @@ class ChatAgent:
         async def tools_node(state: AgentState):
             """Node that executes tools."""
             last_message = state.messages[-1]
-
-            tool_calls = last_message.tool_calls
-            tool_messages = []
-
-            for tool_call in tool_calls:
-                tool_name = tool_call["name"]
-                tool_args = tool_call["args"]
-                tool_call_id = tool_call["id"]
-
-                try:
-                    # Execute the tool
-                    result = await self._execute_tool(tool_name, tool_args)
-                    tool_messages.append(
-                        ToolMessage(
-                            content=str(result),
-                            tool_call_id=tool_call_id,
-                        )
-                    )
-                except Exception as e:
-                    tool_messages.append(
-                        ToolMessage(
-                            content=f"Error: {e}",
-                            tool_call_id=tool_call_id,
-                        )
-                    )
+            tool_messages = await self._run_tool_calls(last_message.tool_calls)
 
             # Increment iteration count
             new_count = state.iteration_count + 1
@@ -224,12 +281,49 @@ class ChatAgent:
         else:
             return workflow.compile()
 
+    async def _run_tool_calls(self, tool_calls: List[Dict[str, Any]]) -> List[ToolMessage]:
+        """Execute tool calls once each and wrap the outcomes as ToolMessages.
+
+        Calls from the same model turn are independent, so they run
+        concurrently. The messages are returned in call order.
+        """
+        return list(
+            await asyncio.gather(*(self._run_tool_call(tool_call) for tool_call in tool_calls))
+        )
+
+    async def _run_tool_call(self, tool_call: Dict[str, Any]) -> ToolMessage:
+        """Execute one tool call and wrap the outcome as a ToolMessage.
+
+        The raw result is kept as the message artifact. A failed call gets
+        ``status="error"`` and an artifact with the error message and code.
+        """
+        try:
+            result = await self._execute_tool(tool_call["name"], tool_call["args"])
+        except Exception as e:
+            return ToolMessage(
+                content=f"Error: {e}",
+                name=tool_call["name"],
+                tool_call_id=tool_call["id"],
+                status="error",
+                artifact={
+                    "message": str(e),
+                    "error_code": self._classify_error(e),
+                },
+            )
+
+        return ToolMessage(
+            content=str(result),
+            name=tool_call["name"],
+            tool_call_id=tool_call["id"],
+            artifact=result,
+        )
+
     async def _execute_tool(self, tool_name: str, tool_args: Dict[str, Any]) -> Any:
         """Execute a tool by name with the given arguments."""
-        if tool_name not in self.tools_by_name:
+        tool = self.tools_by_name.get(tool_name)
+        if tool is None:
             raise ValueError(f"Tool not found: {tool_name}")
 
-        tool = self.tools_by_name[tool_name]
         input_data = tool.input_schema(**tool_args)
         result = await tool.execute(input_data)
 
@@ -240,144 +334,184 @@ class ChatAgent:
 
     async def stream(
         self,
-        messages: List[Dict[str, str]],
+        messages: Optional[List[Dict[str, str]]] = None,
         show_thinking: bool = False,
         thread_id: Optional[str] = None,
         cancellation_event: Optional[asyncio.Event] = None,
+        session_id: Optional[str] = None,
+        dynamic_context: Optional[List[BaseMessage]] = None,
     ) -> AsyncGenerator[Dict[str, Any], None]:
-        """Stream agent responses with token-level streaming.
+        """Stream agent responses by running the ReAct graph.
+
+        LLM tokens are forwarded as they arrive via ``astream_events``, and
+        tool calls/results are reported from the graph's agent and tools
+        nodes, so every tool runs exactly once.
+
+        Either pass the full ``messages`` list, or pass ``session_id`` after
+        ``append_user`` to reuse the session's cached prompt prefix. In session
+        mode the assistant reply is committed to the prefix once the turn
+        finishes.
+
+        With a checkpointer and ``thread_id``, earlier turns are already in
+        the checkpoint, so only the messages after the last assistant reply
+        are sent to the graph.
 
         Args:
             messages: List of messages in {"role": str, "content": str} format
             show_thinking: Whether to emit thinking events for tool calls
             thread_id: Optional thread ID for checkpointing
             cancellation_event: Optional asyncio.Event for external cancellation
+            session_id: Optional session whose cached prefix is used as input
+            dynamic_context: Optional per-turn messages placed after the prefix
 
         Yields:
             Dict with "type" and "data" keys, with optional "offset" for ordering
         """
+        if messages is None and session_id is None:
+            raise ValueError("Either messages or session_id is required")
+
         if not self._initialized:
             await self.initialize()
 
-        # Convert messages to LangChain format
-        lc_messages = []
-        for msg in messages:
-            if msg["role"] == "system":
-                lc_messages.append(SystemMessage(content=msg["content"]))
-            elif msg["role"] == "user":
-                lc_messages.append(HumanMessage(content=msg["content"]))
-            elif msg["role"] == "assistant":
-                lc_messages.append(AIMessage(content=msg["content"]))
+        if messages is None:
+            lc_messages = self.prompts.build(session_id, dynamic_context)
+        else:
+            lc_messages = self._to_langchain_messages(messages)
 
         # Prepare config for checkpointing
         run_config = {"configurable": {"thread_id": thread_id}} if thread_id else None
 
-        # Track offset for event ordering
-        current_offset = 0
-
-        def get_next_offset() -> int:
-            nonlocal current_offset
-            offset = current_offset
-            current_offset += 1
-            return offset
+        # Offsets for event ordering
+        offsets = itertools.count()
 
         # Check for cancellation helper
         def check_cancellation():
             if cancellation_event and cancellation_event.is_set():
                 raise asyncio.CancelledError("Stream cancelled by external event")
 
-        # Accumulate the full response for tool call handling
-        full_response = None
+        # Use a caller-provided system message as the graph's system prompt
+        system_prompt = next(
+            (
+                _content_text(msg.content) for msg in lc_messages
+                if isinstance(msg, SystemMessage)
+            ),
+            self.config.system_prompt,
+        )
+
+        if self._checkpointer and run_config:
+            # The checkpoint already holds earlier turns; replaying them
+            # through add_messages would append duplicates
+            snapshot = await self.graph.aget_state(run_config)
+            if snapshot.values.get("messages"):
+                last_reply = max(
+                    (i for i, msg in enumerate(lc_messages) if isinstance(msg, AIMessage)),
+                    default=-1,
+                )
+                lc_messages = lc_messages[last_reply + 1:]
+
+        # add_messages assigns ids in place, so hand it copies rather than
+        # the cached prefix messages
+        initial_state = {
+            "messages": [msg.model_copy() for msg in lc_messages],
+            "system_prompt": system_prompt,
+            # A checkpoint restores the previous turn's count; tool cycles
+            # are limited per turn
+            "iteration_count": 0,
+        }
+
+        reply_parts: List[str] = []
+        # Whether the current agent step produced token-level chunks
+        step_streamed = False
 
         try:
-            # Stream from LLM
-            async for chunk in self.llm_with_tools.astream(lc_messages):
-                # Check for cancellation
+            async for ev in self.graph.astream_events(
+                initial_state, config=run_config, version="v2"
+            ):
                 check_cancellation()
 
-                # Accumulate chunks to build the full message
-                if full_response is None:
-                    full_response = chunk
-                else:
-                    full_response += chunk
-
-                # Stream content tokens as they arrive
-                if chunk.content:
-                    yield {
-                        "type": "content",
-                        "data": {"text": chunk.content},
-                        "offset": get_next_offset(),
-                    }
-
-            # Handle complete tool calls after streaming finishes
-            if full_response and full_response.tool_calls:
-                for tool_call in full_response.tool_calls:
-                    # Check for cancellation before each tool
-                    check_cancellation()
-
-                    tool_name = tool_call.get("name", "")
-                    tool_args = tool_call.get("args", {})
-                    tool_call_id = tool_call.get("id", "")
-
-                    # Skip incomplete tool calls
-                    if not tool_name or not tool_call_id:
-                        continue
-
-                    if show_thinking:
+                kind = ev["event"]
+                node = ev.get("metadata", {}).get("langgraph_node")
+
+                if kind == "on_chat_model_stream":
+                    text = _content_text(ev["data"]["chunk"].content)
+                    if text:
+                        step_streamed = True
+                        reply_parts.append(text)
                         yield {
-                            "type": "thinking",
-                            "data": {"text": f"Calling tool {tool_name}"},
-                            "offset": get_next_offset(),
+                            "type": "content",
+                            "data": {"text": text},
+                            "offset": next(offsets),
                         }
+                    continue
 
-                    yield {
-                        "type": "tool_call",
-                        "data": {
-                            "tool": tool_name,
-                            "input": tool_args,
-                            "tool_call_id": tool_call_id,
-                        },
-                        "offset": get_next_offset(),
-                    }
-
-                    try:
-                        result = await self._execute_tool(tool_name, tool_args)
+                # Only node-level start/end events carry agent/tool results
+                if ev["name"] != node:
+                    continue
+
+                if kind == "on_chain_start" and node == "agent":
+                    step_streamed = False
+
+                elif kind == "on_chain_end" and node == "agent":
+                    response = ev["data"]["output"]["messages"][-1]
+
+                    # Models that do not stream still deliver their content
+                    text = _content_text(response.content)
+                    if text and not step_streamed:
+                        reply_parts.append(text)
                         yield {
-                            "type": "tool_result",
-                            "data": {
-                                "tool": tool_name,
-                                "tool_call_id": tool_call_id,
-                                "result": result,
-                            },
-                            "offset": get_next_offset(),
+                            "type": "content",
+                            "data": {"text": text},
+                            "offset": next(offsets),
                         }
 
-                        # Get follow-up response after tool execution
-                        lc_messages.append(full_response)
-                        lc_messages.append(ToolMessage(content=str(result), tool_call_id=tool_call_id))
-
-                        # Stream the follow-up response token by token
-                        async for followup in self.llm_with_tools.astream(lc_messages):
-                            check_cancellation()
-                            if followup.content:
-                                yield {
-                                    "type": "content",
-                                    "data": {"text": followup.content},
-                                    "offset": get_next_offset(),
-                                }
-                    except Exception as e:
-                        error_code = self._classify_error(e)
+                    for tool_call in response.tool_calls:
+                        if show_thinking:
+                            yield {
+                                "type": "thinking",
+                                "data": {"text": f"Calling tool {tool_call['name']}"},
+                                "offset": next(offsets),
+                            }
+
                         yield {
-                            "type": "error",
+                            "type": "tool_call",
                             "data": {
-                                "message": str(e),
-                                "error_code": error_code,
-                                "tool_name": tool_name,
-                                "tool_call_id": tool_call_id,
+                                "tool": tool_call["name"],
+                                "input": tool_call.get("args", {}),
+                                "tool_call_id": tool_call["id"],
                             },
-                            "offset": get_next_offset(),
+                            "offset": next(offsets),
                         }
 
+                elif kind == "on_chain_end" and node == "tools":
+                    # Report the results the tools node already computed
+                    for tool_message in ev["data"]["output"]["messages"]:
+                        tool_name = tool_message.name
+                        if tool_message.status == "error":
+                            yield {
+                                "type": "error",
+                                "data": {
+                                    "message": tool_message.artifact["message"],
+                                    "error_code": tool_message.artifact["error_code"],
+                                    "tool_name": tool_name,
+                                    "tool_call_id": tool_message.tool_call_id,
+                                },
+                                "offset": next(offsets),
+                            }
+                        else:
+                            yield {
+                                "type": "tool_result",
+                                "data": {
+                                    "tool": tool_name,
+                                    "tool_call_id": tool_message.tool_call_id,
+                                    "result": tool_message.artifact,
+                                },
+                                "offset": next(offsets),
+                            }
+
+            # Grow the session prefix only once the turn has finished
+            if messages is None:
+                self.prompts.commit(session_id, "".join(reply_parts))
+
         except asyncio.CancelledError:
             # Re-raise cancellation for proper cleanup
             raise
@@ -391,10 +525,51 @@ class ChatAgent:
                     "error_code": error_code,
                     "error_type": type(e).__name__,
                 },
-                "offset": get_next_offset(),
+                "offset": next(offsets),
             }
             raise
 
+    def _to_langchain_messages(self, messages: List[Dict[str, str]]) -> List[BaseMessage]:
+        """Convert dict messages to LangChain messages, reusing cached prefixes.
+
+        Each prefix of ``messages`` is looked up by a rolling hash of its
+        (role, content) pairs, and a hit is only used if the stored pairs
+        match exactly. The longest previously converted prefix is reused by
+        reference and only the remaining suffix is converted.
+        """
+        pairs = tuple((msg["role"], msg["content"]) for msg in messages)
+        prefix_hashes = []
+        running = 0
+        for pair in pairs:
+            running = hash((running, pair))
+            prefix_hashes.append(running)
+
+        # Find the longest cached prefix
+        start = 0
+        lc_messages: List[BaseMessage] = []
+        for i in range(len(prefix_hashes) - 1, -1, -1):
+            entry = self._lc_cache.get(prefix_hashes[i])
+            if entry is not None and entry[0] == pairs[:i + 1]:
+                self._lc_cache.move_to_end(prefix_hashes[i])
+                lc_messages = list(entry[1])
+                start = i + 1
+                break
+
+        for msg in messages[start:]:
+            if msg["role"] == "system":
+                lc_messages.append(SystemMessage(content=msg["content"]))
+            elif msg["role"] == "user":
+                lc_messages.append(HumanMessage(content=msg["content"]))
+            elif msg["role"] == "assistant":
+                lc_messages.append(AIMessage(content=msg["content"]))
+
+        if prefix_hashes and start < len(prefix_hashes):
+            self._lc_cache[prefix_hashes[-1]] = (pairs, list(lc_messages))
+            if len(self._lc_cache) > LC_CACHE_SIZE:
+                self._lc_cache.popitem(last=False)
+
+        return lc_messages
+
     def _classify_error(self, error: Exception) -> str:
         """Classify an error into a machine-readable error code."""
         error_type = type(error).__name__
@@ -417,10 +592,10 @@ class ChatAgent:
         thread_id: Optional[str] = None,
     ) -> str:
         """Invoke the agent and return the final response."""
-        full_response = ""
+        parts = []
         async for event in self.stream(messages, thread_id=thread_id):
             if event["type"] == "content":
-                full_response += event["data"]["text"]
-        return full_response
+                parts.append(event["data"]["text"])
+        return "".join(parts)
 
 
@@ -6,13 +6,16 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentConfig:
     """Configuration for the chat agent.
 
     This class provides flexible agent configuration separate from global config.
     It allows fine-grained control over agent behavior including model settings,
     tool execution limits, context management, and checkpointing.
+
+    Instances use ``__slots__``, so they carry no per-instance ``__dict__``
+    and unknown attributes cannot be set by accident.
     """
 
     # Model settings
@@ -0,0 +1,189 @@
+"""
+Prompt prefix management for provider-side prompt caching.
+
+Providers such as Anthropic, DeepSeek and OpenAI cache prompts on byte-stable
+prefixes. This module keeps a per-session static prefix (system prompt plus
+committed turns) that is only ever appended to, and places the per-turn
+dynamic content after it so the cached prefix is reused verbatim.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+)
+
+
+CACHE_CONTROL_EPHEMERAL = {"type": "ephemeral"}
+
+# Default number of sessions a PromptManager keeps
+MAX_SESSIONS = 1024
+
+
+@dataclass
+class SessionPrompt:
+    """Prompt layout for a single session.
+
+    Attributes:
+        prefix_messages: System prompt and committed turns, append-only
+        pending_user: User message of the in-flight turn, if any
+    """
+
+    prefix_messages: List[BaseMessage] = field(default_factory=list)
+    pending_user: Optional[HumanMessage] = None
+
+
+class PromptManager:
+    """Per-session static-prefix / dynamic-suffix prompt builder.
+
+    The prefix message objects are never modified or rebuilt, so the
+    serialized prompt prefix stays identical from one turn to the next.
+
+    At most ``max_sessions`` sessions are kept; the least recently used one
+    is dropped beyond that and starts again from the system prompt, so
+    callers should re-seed it with ``load_history``.
+
+    Example:
+        prompts = PromptManager(system_prompt="You are helpful.")
+        prompts.append_user("s1", "Hello")
+        messages = prompts.build("s1")
+        # ... call the LLM ...
+        prompts.commit("s1", "Hi there!")
+    """
+
+    def __init__(
+        self,
+        system_prompt: Optional[str] = None,
+        cache_control: bool = False,
+        max_sessions: int = MAX_SESSIONS,
+    ):
+        """Initialize the prompt manager.
+
+        Args:
+            system_prompt: System prompt placed at the start of every prefix
+            cache_control: Whether to mark the end of the prefix with an
+                Anthropic-style ``cache_control`` breakpoint
+            max_sessions: Maximum number of sessions kept in memory
+        """
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+
+        self.system_prompt = system_prompt
+        self.cache_control = cache_control
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, SessionPrompt]" = OrderedDict()
+
+    def _new_session(self) -> SessionPrompt:
+        """Create a session seeded with the system prompt."""
+        session = SessionPrompt()
+        if self.system_prompt:
+            session.prefix_messages.append(SystemMessage(content=self.system_prompt))
+        return session
+
+    def get_session(self, session_id: str) -> SessionPrompt:
+        """Get the prompt layout for a session, creating it if needed."""
+        session = self._sessions.get(session_id)
+        if session is None:
+            session = self._new_session()
+            self._store(session_id, session)
+        else:
+            self._sessions.move_to_end(session_id)
+        return session
+
+    def _store(self, session_id: str, session: SessionPrompt) -> None:
+        """Store a session, dropping the least recently used beyond the cap."""
+        self._sessions[session_id] = session
+        self._sessions.move_to_end(session_id)
+        if len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+
+    def has_session(self, session_id: str) -> bool:
+        """Check whether a session has a prompt layout."""
+        return session_id in self._sessions
+
+    def load_history(self, session_id: str, messages: List[Dict[str, str]]) -> None:
+        """Seed a session prefix from stored history.
+
+        Args:
+            session_id: Session identifier
+            messages: List of messages in {"role": str, "content": str} format
+        """
+        session = self._new_session()
+        for msg in messages:
+            if msg["role"] == "user":
+                session.prefix_messages.append(HumanMessage(content=msg["content"]))
+            elif msg["role"] == "assistant":
+                session.prefix_messages.append(AIMessage(content=msg["content"]))
+        self._store(session_id, session)
+
+    def append_user(self, session_id: str, content: str) -> None:
+        """Set the user message for the next turn of a session."""
+        self.get_session(session_id).pending_user = HumanMessage(content=content)
+
+    def build(
+        self,
+        session_id: str,
+        dynamic_context: Optional[List[BaseMessage]] = None,
+    ) -> List[BaseMessage]:
+        """Build the LLM input as prefix + dynamic context + pending user turn.
+
+        Args:
+            session_id: Session identifier
+            dynamic_context: Optional per-turn messages that must not become
+                part of the cached prefix
+
+        Returns:
+            List of LangChain messages for the LLM call
+        """
+        session = self.get_session(session_id)
+        messages = list(session.prefix_messages)
+
+        if self.cache_control and messages:
+            messages[-1] = self._with_cache_control(messages[-1])
+        if dynamic_context:
+            messages.extend(dynamic_context)
+        if session.pending_user is not None:
+            messages.append(session.pending_user)
+
+        return messages
+
+    def commit(self, session_id: str, assistant_content: str) -> None:
+        """Commit the finished turn into the session prefix.
+
+        Args:
+            session_id: Session identifier
+            assistant_content: Final assistant reply for the turn
+        """
+        session = self.get_session(session_id)
+        if session.pending_user is None:
+            return
+
+        session.prefix_messages.append(session.pending_user)
+        session.prefix_messages.append(AIMessage(content=assistant_content))
+        session.pending_user = None
+
+    def reset(self, session_id: str) -> None:
+        """Drop all committed turns for a session."""
+        self._sessions.pop(session_id, None)
+
+    @staticmethod
+    def _with_cache_control(message: BaseMessage) -> BaseMessage:
+        """Return a copy of a message with a cache breakpoint on its content."""
+        content = message.content
+        if isinstance(content, str):
+            blocks = [{"type": "text", "text": content}]
+        else:
+            blocks = [
+                dict(block) if isinstance(block, dict) else {"type": "text", "text": block}
+                for block in content
+            ]
+        if not blocks:
+            return message
+
+        blocks[-1]["cache_control"] = CACHE_CONTROL_EPHEMERAL
+        return message.model_copy(update={"content": blocks})
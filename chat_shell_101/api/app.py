@@ -4,7 +4,6 @@ FastAPI application for HTTP mode.
 
 import time
 from contextlib import asynccontextmanager
-from typing import Dict
 
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
@@ -13,21 +12,14 @@ from ..config import config
 from ..agent.agent import ChatAgent
 from ..agent.config import AgentConfig
 from .routes import router
-
-
-# Global state
-app_state: Dict = {
-    "agent": None,
-    "start_time": None,
-    "active_sessions": {},
-}
+from .state import app_state
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup
-    app_state["start_time"] = time.time()
+    app_state["start_time"] = time.monotonic()
 
     # Initialize agent
     agent_config = AgentConfig(
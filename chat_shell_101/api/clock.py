@@ -0,0 +1,28 @@
+"""
+Coarse wall clock for request handlers and streamed events.
+
+Session bookkeeping and event timestamps only need second-level precision,
+so they reuse a datetime for up to ``CLOCK_INTERVAL`` seconds instead of
+calling ``datetime.now()`` on every request or event. The cached value is
+refreshed lazily on read, so there is no background task to start or stop.
+"""
+
+import time
+from datetime import datetime
+
+
+# Seconds a cached time is reused for
+CLOCK_INTERVAL = 1.0
+
+_cached_now = datetime.now()
+_expires_at = 0.0
+
+
+def now_cached() -> datetime:
+    """Get the current time, accurate to about ``CLOCK_INTERVAL``."""
+    global _cached_now, _expires_at
+    now = time.monotonic()
+    if now >= _expires_at:
+        _cached_now = datetime.now()
+        _expires_at = now + CLOCK_INTERVAL
+    return _cached_now
@@ -2,15 +2,15 @@
 API routes for HTTP mode.
 """
 
+import time
 import uuid
-from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sse_starlette.sse import EventSourceResponse
 
 from ..agent.agent import ChatAgent
 from ..config import config
-from ..streaming import get_streaming_core, StreamConfig
+from ..streaming import get_streaming_core, StreamConfig, StreamNotFoundError
 from .schemas import (
     ChatRequest,
     ChatResponse,
@@ -23,11 +23,16 @@ from .schemas import (
     StreamRecoveryResponse,
     StreamStatusExtended,
 )
+from .clock import now_cached
 from .dependencies import get_agent, get_session_manager
+from .state import app_state
 from .sse import (
+    SSE_PING_INTERVAL,
     stream_chat_events,
     create_sse_stream,
     recover_sse_stream,
+    resume_sse_stream,
+    encode_sse,
     cancel_sse_stream,
     get_stream_status,
 )
@@ -55,15 +60,14 @@ async def start_chat(
     from a specific position in an existing stream.
     """
     subtask_id = str(uuid.uuid4())
-    session_id = request.session_id or f"session-{int(datetime.now().timestamp())}"
+    session_id = request.session_id or f"session-{int(time.time())}"
 
     # Store session info
-    from .app import app_state
     app_state["active_sessions"][subtask_id] = {
         "session_id": session_id,
         "status": "running",
-        "created_at": datetime.now(),
-        "messages": request.messages,
+        "created_at": now_cached(),
+        "message_count": len(request.messages),
     }
 
     # If streaming requested, return SSE stream
@@ -85,7 +89,7 @@ async def start_chat(
         # Create SSE stream and get generator
         client_id, event_generator = await create_sse_stream(
             agent=agent,
-            messages=[{"role": m.role, "content": m.content} for m in request.messages],
+            messages=request.to_agent_messages(),
             session_id=session_id,
             subtask_id=subtask_id,
             resume_from_offset=request.offset,
@@ -94,7 +98,8 @@ async def start_chat(
         )
 
         return EventSourceResponse(
-            event_generator,
+            encode_sse(event_generator),
+            ping=SSE_PING_INTERVAL,
             headers={
                 "X-Subtask-ID": subtask_id,
                 "X-Client-ID": client_id,
@@ -120,8 +125,6 @@ async def get_session_status(
 
     Used for polling when not using streaming.
     """
-    from .app import app_state
-
     session = app_state["active_sessions"].get(subtask_id)
     if not session:
         raise HTTPException(status_code=404, detail="Subtask not found")
@@ -131,8 +134,8 @@ async def get_session_status(
         session_id=session["session_id"],
         status=session["status"],
         created_at=session["created_at"],
-        updated_at=datetime.now(),
-        message_count=len(session.get("messages", [])),
+        updated_at=now_cached(),
+        message_count=session.get("message_count", 0),
     )
 
 
@@ -154,6 +157,47 @@ async def get_stream_status_endpoint(
         raise HTTPException(status_code=404, detail=str(e))
 
 
+@router.get("/response/{subtask_id}/stream")
+async def resume_stream(
+    subtask_id: str,
+    request: Request,
+    offset: int = Query(None, description="Last offset received, if no Last-Event-ID header"),
+):
+    """
+    Reconnect to a chat stream without re-running the agent.
+
+    EventSource clients send the id of the last event they received in the
+    Last-Event-ID header; events after it are replayed from the buffer and,
+    if the stream is still running, followed by live events. Without the
+    header or an offset the whole buffered stream is replayed.
+    """
+    last_event_id = request.headers.get("last-event-id")
+    if last_event_id is not None:
+        try:
+            offset = int(last_event_id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid Last-Event-ID")
+
+    try:
+        client_id, event_generator = await resume_sse_stream(
+            subtask_id, offset if offset is not None else -1
+        )
+    except StreamNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=410, detail=str(e))
+
+    headers = {"X-Subtask-ID": subtask_id}
+    if client_id:
+        headers["X-Client-ID"] = client_id
+
+    return EventSourceResponse(
+        encode_sse(event_generator),
+        ping=SSE_PING_INTERVAL,
+        headers=headers,
+    )
+
+
 @router.post("/response/{subtask_id}/recover", response_model=StreamRecoveryResponse)
 async def recover_stream_endpoint(
     subtask_id: str,
@@ -197,8 +241,6 @@ async def cancel_session(
     and updates the session status. Use this for explicit cancellation
     rather than just closing the connection.
     """
-    from .app import app_state
-
     if subtask_id not in app_state["active_sessions"]:
         raise HTTPException(status_code=404, detail="Subtask not found")
 
@@ -210,9 +252,8 @@ async def cancel_session(
         pass
 
     # Mark as cancelled in app state
-    app_state["active_sessions"][subtask_id]["status"] = "cancelled"
-    if reason:
-        app_state["active_sessions"][subtask_id]["cancellation_reason"] = reason
+    fields = {"cancellation_reason": reason} if reason else {}
+    app_state["active_sessions"].set_status(subtask_id, "cancelled", **fields)
 
     return {
         "status": "cancelled",
@@ -226,10 +267,7 @@ async def health_check() -> HealthResponse:
     """
     Health check endpoint.
     """
-    import time
-    from .app import app_state
-
-    uptime = time.time() - app_state["start_time"] if app_state["start_time"] else 0
+    uptime = time.monotonic() - app_state["start_time"] if app_state["start_time"] else 0
 
     # Get streaming stats if available
     streaming_stats = {}
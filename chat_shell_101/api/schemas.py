@@ -5,7 +5,9 @@ API schemas for HTTP mode.
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Literal, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from .clock import now_cached
 
 
 class MessageRole(str, Enum):
@@ -17,7 +19,13 @@ class MessageRole(str, Enum):
 
 
 class ChatMessage(BaseModel):
-    """A chat message."""
+    """A chat message.
+
+    The role is validated against MessageRole but stored as a plain string,
+    so messages convert to the agent's dict format without enum lookups.
+    """
+
+    model_config = ConfigDict(use_enum_values=True)
 
     role: MessageRole
     content: str
@@ -37,6 +45,10 @@ class ChatRequest(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(None, description="Optional metadata")
     offset: Optional[int] = Field(None, description="Offset to resume from for stream recovery")
 
+    def to_agent_messages(self) -> List[Dict[str, str]]:
+        """Get the messages in the agent's {"role", "content"} format."""
+        return [{"role": m.role, "content": m.content} for m in self.messages]
+
 
 class ChatResponse(BaseModel):
     """Response from chat session creation."""
@@ -61,7 +73,7 @@ class ChatEvent(BaseModel):
         "offset",  # Recovery checkpoint
     ]
     data: Dict[str, Any]
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=now_cached)
     offset: Optional[int] = Field(None, description="Event offset for ordering and recovery")
     sequence: Optional[int] = Field(None, description="Global sequence number")
 
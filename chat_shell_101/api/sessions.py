@@ -0,0 +1,127 @@
+"""
+Bounded session tracking for HTTP mode.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+# Session statuses after which a subtask no longer changes
+TERMINAL_STATUSES = frozenset({"completed", "error", "cancelled"})
+
+
+class SessionStore:
+    """TTL/size-bounded store for subtask sessions.
+
+    Running sessions live in an insertion-ordered map and expire ``ttl``
+    seconds after their last update, or are evicted oldest-first once
+    ``maxsize`` is exceeded. Sessions that reach a terminal status move to a
+    small ring of recently finished sessions so status polling keeps working
+    without pinning memory.
+
+    All methods are synchronous and never await, so they cannot interleave
+    on the event loop and need no lock.
+
+    Attributes:
+        maxsize: Maximum number of running sessions kept
+        ttl: Seconds a session is kept after its last update
+        completed_size: Maximum number of finished sessions kept
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        ttl: float = 3600.0,
+        completed_size: int = 1000,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.completed_size = completed_size
+        self._active: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._completed: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def _purge_expired(self, now: float) -> None:
+        """Drop running sessions whose TTL has passed."""
+        while self._active:
+            subtask_id, (expires_at, _) = next(iter(self._active.items()))
+            if expires_at > now:
+                break
+            del self._active[subtask_id]
+
+    def _remember_completed(self, subtask_id: str, session: Dict[str, Any]) -> None:
+        """Add a finished session to the completed ring."""
+        self._completed[subtask_id] = session
+        self._completed.move_to_end(subtask_id)
+        while len(self._completed) > self.completed_size:
+            self._completed.popitem(last=False)
+
+    def set(self, subtask_id: str, session: Dict[str, Any]) -> None:
+        """Store or replace a session."""
+        now = time.monotonic()
+        self._purge_expired(now)
+
+        if session.get("status") in TERMINAL_STATUSES:
+            self._active.pop(subtask_id, None)
+            self._remember_completed(subtask_id, session)
+            return
+
+        self._completed.pop(subtask_id, None)
+        self._active[subtask_id] = (now + self.ttl, session)
+        self._active.move_to_end(subtask_id)
+        while len(self._active) > self.maxsize:
+            self._active.popitem(last=False)
+
+    def get(self, subtask_id: str, default: Any = None) -> Optional[Dict[str, Any]]:
+        """Get a running or recently finished session."""
+        entry = self._active.get(subtask_id)
+        if entry is not None:
+            expires_at, session = entry
+            if expires_at > time.monotonic():
+                return session
+            del self._active[subtask_id]
+
+        return self._completed.get(subtask_id, default)
+
+    def set_status(self, subtask_id: str, status: str, **fields: Any) -> Dict[str, Any]:
+        """Update a session's status and extra fields.
+
+        Raises:
+            KeyError: If the session is not known
+        """
+        session = self.get(subtask_id)
+        if session is None:
+            raise KeyError(subtask_id)
+
+        session["status"] = status
+        session.update(fields)
+        self.set(subtask_id, session)
+        return session
+
+    def pop(self, subtask_id: str, default: Any = None) -> Optional[Dict[str, Any]]:
+        """Remove a session and return it."""
+        entry = self._active.pop(subtask_id, None)
+        if entry is not None:
+            return entry[1]
+        return self._completed.pop(subtask_id, default)
+
+    def __setitem__(self, subtask_id: str, session: Dict[str, Any]) -> None:
+        self.set(subtask_id, session)
+
+    def __getitem__(self, subtask_id: str) -> Dict[str, Any]:
+        session = self.get(subtask_id)
+        if session is None:
+            raise KeyError(subtask_id)
+        return session
+
+    def __contains__(self, subtask_id: object) -> bool:
+        return isinstance(subtask_id, str) and self.get(subtask_id) is not None
+
+    def __len__(self) -> int:
+        """Number of running (non-expired) sessions."""
+        self._purge_expired(time.monotonic())
+        return len(self._active)
+
+    def __iter__(self) -> Iterator[str]:
+        self._purge_expired(time.monotonic())
+        return iter(list(self._active))
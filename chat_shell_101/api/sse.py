@@ -22,11 +22,17 @@ from ..streaming import (
     CompleteEvent,
     CancelledEvent,
     BaseStreamEvent,
+    StreamCompletedError,
 )
 from ..streaming.events import EventType
+from ..utils import json_loads
 from .schemas import ChatEvent
 
 
+# Seconds between keepalive comments sent to idle SSE connections
+SSE_PING_INTERVAL = 15
+
+
 async def stream_chat_events(
     agent: ChatAgent,
     messages: list,
@@ -166,10 +172,25 @@ async def stream_chat_events(
         await streaming_core.disconnect_client(client.client_id, subtask_id)
 
 
+# Map streaming event types to legacy ChatEvent types
+_LEGACY_EVENT_TYPES = {
+    "chunk": "content",
+    "tool_start": "tool_call",
+    "tool_result": "tool_result",
+    "thinking": "thinking",
+    "error": "error",
+    "complete": "complete",
+    "cancelled": "cancelled",
+    "offset": "offset",
+}
+
+
 def _parse_sse_to_chat_event(sse_str: str) -> Optional[ChatEvent]:
-    """Parse an SSE formatted string to ChatEvent."""
-    import json
+    """Parse an SSE formatted string to ChatEvent.
 
+    The payload was produced by our own emitter, so the event is built with
+    ``model_construct`` and skips validation.
+    """
     lines = sse_str.strip().split("\n")
     event_type = None
     data_str = None
@@ -182,31 +203,16 @@ def _parse_sse_to_chat_event(sse_str: str) -> Optional[ChatEvent]:
 
     if event_type and data_str:
         try:
-            data = json.loads(data_str)
-            # Extract offset and sequence if present in payload
-            offset = data.get("offset")
-            sequence = data.get("sequence")
-
-            # Map new event types to legacy types
-            type_mapping = {
-                "chunk": "content",
-                "tool_start": "tool_call",
-                "tool_result": "tool_result",
-                "thinking": "thinking",
-                "error": "error",
-                "complete": "complete",
-                "cancelled": "cancelled",
-                "offset": "offset",
-            }
-
-            return ChatEvent(
-                event_type=type_mapping.get(event_type, event_type),
-                data=data.get("data", data),
-                offset=offset,
-                sequence=sequence,
-            )
-        except json.JSONDecodeError:
-            pass
+            data = json_loads(data_str)
+        except ValueError:
+            return None
+
+        return ChatEvent.model_construct(
+            event_type=_LEGACY_EVENT_TYPES.get(event_type, event_type),
+            data=data.get("data", data),
+            offset=data.get("offset"),
+            sequence=data.get("sequence"),
+        )
 
     return None
 
@@ -376,6 +382,71 @@ async def recover_sse_stream(
     return client.client_id, streaming_core.get_event_generator(client.client_id)
 
 
+async def resume_sse_stream(
+    stream_id: str,
+    last_event_id: int,
+    client_id: Optional[str] = None,
+) -> tuple[Optional[str], AsyncGenerator[str, None]]:
+    """
+    Resume an SSE stream after the last event a client received.
+
+    Active streams replay the buffered events after ``last_event_id`` and
+    then continue live. Finished streams are replayed from the buffer,
+    so the agent is never run again for a reconnecting client.
+
+    Args:
+        stream_id: The stream to resume
+        last_event_id: Offset of the last event the client received
+            (the SSE ``Last-Event-ID``), or -1 to start from the beginning
+        client_id: Optional client ID (generated if not provided)
+
+    Returns:
+        Tuple of (client_id, event_generator); client_id is None when a
+        finished stream is replayed
+
+    Raises:
+        StreamNotFoundError: If stream not found
+        ValueError: If events after ``last_event_id`` are no longer buffered
+    """
+    streaming_core = get_streaming_core()
+    context = await streaming_core.get_stream(stream_id)
+    offset = last_event_id + 1
+
+    min_offset = await context.buffer.get_min_offset()
+    if min_offset is not None and offset < min_offset:
+        raise ValueError(
+            f"Cannot resume stream {stream_id} from offset {offset}. "
+            f"Oldest buffered offset is {min_offset}"
+        )
+
+    if context.session.is_terminal():
+        return None, streaming_core.replay_stream(stream_id, offset)
+
+    try:
+        client = await streaming_core.connect_client(
+            stream_id=stream_id,
+            client_id=client_id,
+            resume_from_offset=offset,
+        )
+    except StreamCompletedError:
+        # Finished between the status check and connecting
+        return None, streaming_core.replay_stream(stream_id, offset)
+
+    return client.client_id, streaming_core.get_event_generator(client.client_id)
+
+
+async def encode_sse(events: AsyncGenerator[str, None]) -> AsyncGenerator[bytes, None]:
+    """
+    Pass pre-formatted SSE strings through EventSourceResponse unchanged.
+
+    EventSourceResponse wraps ``str`` items in a new ``data:`` field, which
+    would hide the emitter's ``event:`` and ``id:`` lines from the client.
+    Bytes are written as-is.
+    """
+    async for event_str in events:
+        yield event_str.encode("utf-8")
+
+
 async def cancel_sse_stream(stream_id: str, reason: Optional[str] = None):
     """
     Cancel a running SSE stream.
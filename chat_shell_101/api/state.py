@@ -0,0 +1,18 @@
+"""
+Shared application state for HTTP mode.
+
+Kept separate from ``app`` so routes and dependencies can import it at
+module level without a circular import.
+"""
+
+from typing import Dict
+
+from .sessions import SessionStore
+
+
+# Global state
+app_state: Dict = {
+    "agent": None,
+    "start_time": None,
+    "active_sessions": SessionStore(),
+}
@@ -4,8 +4,12 @@ CLI entry point for Chat Shell 101.
 
 import asyncio
 import json
+import sys
+import threading
 import time
+from datetime import datetime
 from pathlib import Path
+from typing import List, Optional
 
 import click
 
@@ -14,7 +18,7 @@ from .agent.config import AgentConfig
 from .config import config
 from .storage import JSONStorage, MemoryStorage, SQLiteStorage
 from .storage.interfaces import Message
-from .utils import format_thinking, format_tool_call, format_tool_result
+from .utils import format_thinking, format_tool_call, format_tool_result, run_async
 
 
 @click.group()
@@ -69,7 +73,7 @@ def chat(
     base_url: str,
 ):
     """Start interactive chat session."""
-    asyncio.run(
+    run_async(
         _chat_interactive(
             model=model,
             session=session,
@@ -127,7 +131,7 @@ def query(
         chat-shell query "What is the capital of France?"
         chat-shell query --format json "Explain quantum computing"
     """
-    asyncio.run(
+    run_async(
         _query_single(
             message=message,
             model=model,
@@ -159,7 +163,7 @@ def history(storage: str, session: str, limit: int, output_format: str):
         chat-shell history -s <session_id>    # Show specific session
         chat-shell history --format json      # JSON output
     """
-    asyncio.run(_view_history(storage, session, limit, output_format))
+    run_async(_view_history(storage, session, limit, output_format))
 
 
 @cli.group("config")
@@ -255,19 +259,28 @@ async def _chat_interactive(
     else:
         storage_provider = MemoryStorage()
 
-    await storage_provider.initialize()
-
     # Initialize agent with configuration
     agent_config = AgentConfig(
         model=model,
         temperature=temperature,
     )
     agent = ChatAgent(agent_config)
-    await agent.initialize()
 
     # Generate session ID if not provided
     session_id = session or f"cli-{int(time.time())}"
 
+    async def load_history():
+        await storage_provider.initialize()
+        return await storage_provider.history.get_history(session_id)
+
+    # Open storage and read stored history while the agent initializes
+    history, _ = await asyncio.gather(load_history(), agent.initialize())
+
+    # Seed the agent's cached prompt prefix from stored history once
+    agent.prompts.load_history(
+        session_id, [{"role": msg.role, "content": msg.content} for msg in history]
+    )
+
     # Print welcome message
     print("\n" + "=" * 50)
     print(f"Chat Shell 101 v0.1.0")
@@ -279,20 +292,39 @@ async def _chat_interactive(
     print("Type '/history' to show history.")
     print("=" * 50 + "\n")
 
+    writer = _ConsoleWriter()
+    writer.start()
+
+    # Saving a turn runs in the background while the user types the next one
+    pending_save: Optional[asyncio.Task] = None
+
     try:
         while True:
+            # Make sure the previous reply is on screen before prompting
+            await writer.drain()
+
             # Get user input
             try:
-                user_input = input("You: ")
+                user_input = await _read_input("You: ")
             except (EOFError, KeyboardInterrupt):
                 break
+            except asyncio.CancelledError:
+                # Ctrl+C at the prompt arrives as a cancellation of the main
+                # task, since input() runs in a separate thread
+                asyncio.current_task().uncancel()
+                break
 
             # Handle special commands
             if user_input.lower() in ("exit", "quit"):
                 break
 
+            if pending_save is not None:
+                await pending_save
+                pending_save = None
+
             if user_input.strip() == "/clear":
                 await storage_provider.history.clear_history(session_id)
+                agent.prompts.reset(session_id)
                 print("History cleared.")
                 continue
 
@@ -315,21 +347,17 @@ async def _chat_interactive(
             if not user_input.strip():
                 continue
 
-            # Load history
-            history = await storage_provider.history.get_history(session_id)
-            messages = []
-            for msg in history:
-                messages.append({"role": msg.role, "content": msg.content})
-            messages.append({"role": "user", "content": user_input})
+            # Queue the user turn after the session's cached prefix
+            agent.append_user(session_id, user_input)
 
             # Stream response
-            print("Assistant: ", end="", flush=True)
+            await writer.write("Assistant: ")
 
-            full_response = ""
+            response_parts: List[str] = []
 
             try:
                 async for event in agent.stream(
-                    messages=messages,
+                    session_id=session_id,
                     show_thinking=config.show_thinking,
                 ):
                     event_type = event.get("type", "")
@@ -337,52 +365,194 @@ async def _chat_interactive(
 
                     if event_type == "content":
                         text = data.get("text", "")
-                        print(text, end="", flush=True)
-                        full_response += text
+                        await writer.write(text)
+                        response_parts.append(text)
 
                     elif event_type == "thinking":
                         text = data.get("text", "")
-                        print(f"\n{format_thinking(text)}", end="", flush=True)
+                        await writer.write(f"\n{format_thinking(text)}")
 
                     elif event_type == "tool_call":
                         tool = data.get("tool", "")
                         tool_input = data.get("input", {})
-                        print(
-                            f"\n{format_tool_call(tool, tool_input)}",
-                            end="",
-                            flush=True,
-                        )
+                        await writer.write(f"\n{format_tool_call(tool, tool_input)}")
 
                     elif event_type == "tool_result":
                         result = data.get("result", "")
-                        print(
-                            f"\n{format_tool_result(result)}", end=". ", flush=True
-                        )
+                        await writer.write(f"\n{format_tool_result(result)}. ")
 
                     elif event_type == "error":
                         error_msg = data.get("message", "Unknown error")
-                        print(f"\nError: {error_msg}")
+                        await writer.write(f"\nError: {error_msg}\n")
 
             except Exception as e:
-                print(f"\nError: {e}")
+                await writer.write(f"\nError: {e}\n")
                 continue
 
-            print()  # Newline after response
-
-            # Save to history
-            await storage_provider.history.append_messages(
-                session_id,
-                [
-                    Message(role="user", content=user_input),
-                    Message(role="assistant", content=full_response),
-                ],
+            await writer.write("\n")  # Newline after response
+            full_response = "".join(response_parts)
+
+            # Save to history; both messages share one timestamp, and
+            # storage keeps them in insertion order on ties
+            now = datetime.now()
+            pending_save = asyncio.create_task(
+                storage_provider.history.append_messages(
+                    session_id,
+                    [
+                        Message(role="user", content=user_input, timestamp=now),
+                        Message(role="assistant", content=full_response, timestamp=now),
+                    ],
+                )
             )
 
     finally:
+        if pending_save is not None:
+            await pending_save
+        await writer.close()
         await storage_provider.close()
         print("\nSession ended.")
 
 
+class _ConsoleWriter:
+    """Single task that writes streamed output to stdout.
+
+    Chunks are put on a bounded queue. The writer task collects them until
+    ``flush_bytes`` characters are pending or ``flush_interval`` seconds
+    have passed since the first one, then issues a single write and flush,
+    so a token stream costs one flush per ~16ms frame instead of one per
+    token.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        flush_bytes: int = 64,
+        flush_interval: float = 0.016,
+    ):
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._task: Optional[asyncio.Task] = None
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+
+    def start(self) -> None:
+        """Start the writer task."""
+        self._task = asyncio.create_task(self._run())
+
+    def _check_task(self) -> None:
+        """Raise the writer task's error if it has stopped."""
+        if self._task is not None and self._task.done():
+            self._task.result()
+            raise RuntimeError("Console writer has stopped")
+
+    async def write(self, text: str) -> None:
+        """Queue text for output."""
+        self._check_task()
+        if text:
+            await self._queue.put(text)
+
+    async def drain(self) -> None:
+        """Wait until all queued text has been written.
+
+        Raises the writer task's error instead of waiting forever if the
+        task has died.
+        """
+        self._check_task()
+        if self._task is None:
+            await self._queue.join()
+            return
+
+        joined = asyncio.ensure_future(self._queue.join())
+        try:
+            await asyncio.wait({joined, self._task}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            joined.cancel()
+        self._check_task()
+
+    async def close(self) -> None:
+        """Write remaining text and stop the writer task."""
+        if self._task is None:
+            return
+        if not self._task.done():
+            try:
+                await self.drain()
+            except Exception:
+                pass
+            self._task.cancel()
+        try:
+            await self._task
+        except (asyncio.CancelledError, Exception):
+            # A write error has already been raised by write() or drain()
+            pass
+        self._task = None
+
+    async def _next_batch(self) -> List[str]:
+        """Wait for the first chunk, then collect until the size or time window."""
+        loop = asyncio.get_running_loop()
+        chunks = [await self._queue.get()]
+        size = len(chunks[0])
+        deadline = loop.time() + self.flush_interval
+
+        while size < self.flush_bytes:
+            if self._queue.empty():
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    chunk = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            else:
+                chunk = self._queue.get_nowait()
+            chunks.append(chunk)
+            size += len(chunk)
+
+        return chunks
+
+    async def _run(self) -> None:
+        while True:
+            chunks = await self._next_batch()
+
+            try:
+                sys.stdout.write("".join(chunks))
+                sys.stdout.flush()
+            finally:
+                for _ in chunks:
+                    self._queue.task_done()
+
+
+async def _read_input(prompt: str) -> str:
+    """Read a line from stdin without blocking the event loop.
+
+    A daemon thread is used instead of ``asyncio.to_thread`` so that an
+    interrupt at the prompt does not leave interpreter shutdown waiting on
+    a thread stuck in ``input()``.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def resolve(result: Optional[str], error: Optional[BaseException]) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def read() -> None:
+        try:
+            result, error = input(prompt), None
+        except Exception as e:
+            result, error = None, e
+        try:
+            loop.call_soon_threadsafe(resolve, result, error)
+        except RuntimeError:
+            # Event loop already closed
+            pass
+
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+
 async def _query_single(
     message: str, model: str, temperature: float, system_prompt: str, output_format: str
 ):
@@ -406,17 +576,18 @@ async def _query_single(
     messages.append({"role": "user", "content": message})
 
     # Get response
-    response = ""
+    response_parts = []
     try:
         async for event in agent.stream(messages):
             if event["type"] == "content":
-                response += event["data"]["text"]
+                text = event["data"]["text"]
+                response_parts.append(text)
                 if output_format == "text":
-                    print(event["data"]["text"], end="", flush=True)
+                    print(text, end="", flush=True)
 
         if output_format == "json":
             output = {
-                "response": response,
+                "response": "".join(response_parts),
                 "model": model,
             }
             print(json.dumps(output))
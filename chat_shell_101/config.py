@@ -6,7 +6,7 @@ import os
 from pathlib import Path
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -45,10 +45,19 @@ class Config(BaseModel):
         # Basic validation - key should start with 'sk-'
         return self.openai.api_key.startswith("sk-")
 
+    # Storage path already created by get_storage_path()
+    _created_storage_path: Optional[Path] = PrivateAttr(default=None)
+
     def get_storage_path(self) -> Path:
-        """Get the storage path, creating it if it doesn't exist."""
+        """Get the storage path, creating it if it doesn't exist.
+
+        The directory is only created on the first call for a given path;
+        later calls return it without touching the filesystem.
+        """
         path = self.storage.path
-        path.mkdir(parents=True, exist_ok=True)
+        if path != self._created_storage_path:
+            path.mkdir(parents=True, exist_ok=True)
+            self._created_storage_path = path
         return path
 
 
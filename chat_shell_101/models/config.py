@@ -18,6 +18,8 @@ class ProviderConfig:
         extra_headers: Additional headers to include in API requests
         organization: Organization ID (for OpenAI)
         project: Project ID (for OpenAI)
+        http_client: Shared async HTTP client (for OpenAI), so several models
+            reuse one connection pool
     """
 
     api_key: Optional[str] = None
@@ -27,6 +29,7 @@ class ProviderConfig:
     extra_headers: Optional[Dict[str, str]] = None
     organization: Optional[str] = None
     project: Optional[str] = None
+    http_client: Optional[Any] = None
 
     def __post_init__(self):
         if self.timeout < 1:
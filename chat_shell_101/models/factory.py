@@ -2,6 +2,7 @@
 Model factory for creating LLM instances from different providers.
 """
 
+import asyncio
 import os
 from enum import Enum
 from typing import Optional, Type, Dict, Any, List
@@ -272,6 +273,9 @@ class ModelFactory:
         if config.provider_config.extra_headers:
             kwargs["default_headers"] = config.provider_config.extra_headers
 
+        if config.provider_config.http_client is not None:
+            kwargs["http_async_client"] = config.provider_config.http_client
+
         # Remove None values
         kwargs = {k: v for k, v in kwargs.items() if v is not None}
 
@@ -470,8 +474,6 @@ class FallbackModelWrapper:
         Raises:
             FallbackError: If all models fail
         """
-        import asyncio
-
         try:
             loop = asyncio.get_event_loop()
             if loop.is_running():
@@ -2,6 +2,7 @@
 ChatInterface for Package Mode - direct Python API.
 """
 
+import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any, AsyncGenerator, Dict, List, Optional, Union
@@ -182,19 +183,17 @@ class DirectChatInterface(ChatInterface):
         messages = self._build_messages(chat_input, session_id)
 
         # Get response
-        response_text = ""
+        response_parts = []
         tool_calls = []
 
         async for event in self._agent.stream(messages, thread_id=session_id):
-            if event["type"] == "content":
-                response_text += event["data"]["text"]
-            elif event["type"] == "tool_call":
-                tool_calls.append(
-                    {
-                        "tool": event["data"]["tool"],
-                        "input": event["data"]["input"],
-                    }
-                )
+            event_type, data = event["type"], event["data"]
+            if event_type == "content":
+                response_parts.append(data["text"])
+            elif event_type == "tool_call":
+                tool_calls.append({"tool": data["tool"], "input": data["input"]})
+
+        response_text = "".join(response_parts)
 
         # Store in session
         self._store_messages(session_id, chat_input.message, response_text)
@@ -219,21 +218,22 @@ class DirectChatInterface(ChatInterface):
 
         messages = self._build_messages(chat_input, session_id)
 
-        full_response = ""
+        response_parts = []
 
         async for event in self._agent.stream(messages, thread_id=session_id):
-            if event["type"] == "content":
-                text = event["data"]["text"]
-                full_response += text
+            event_type, data = event["type"], event["data"]
+            if event_type == "content":
+                text = data["text"]
+                response_parts.append(text)
                 yield StreamingChatOutput(chunk=text)
-            elif event["type"] == "tool_call":
+            elif event_type == "tool_call":
                 yield StreamingChatOutput(
                     chunk="",
                     is_tool_call=True,
-                    tool_name=event["data"]["tool"],
+                    tool_name=data["tool"],
                 )
 
-        self._store_messages(session_id, chat_input.message, full_response)
+        self._store_messages(session_id, chat_input.message, "".join(response_parts))
         yield StreamingChatOutput(chunk="", is_complete=True)
 
     async def get_history(self, session_id: str) -> List[Dict[str, str]]:
@@ -257,8 +257,6 @@ class DirectChatInterface(ChatInterface):
 
     def _generate_session_id(self) -> str:
         """Generate unique session ID."""
-        import uuid
-
         return str(uuid.uuid4())
 
     def _build_messages(
@@ -277,8 +275,7 @@ class DirectChatInterface(ChatInterface):
         if chat_input.context:
             messages.extend(chat_input.context)
         elif session_id in self._sessions:
-            for msg in self._sessions[session_id]:
-                messages.append(msg)
+            messages.extend(self._sessions[session_id])
 
         # Add current message
         messages.append({"role": "user", "content": chat_input.message})
@@ -289,10 +286,9 @@ class DirectChatInterface(ChatInterface):
         self, session_id: str, user_msg: str, assistant_msg: str
     ) -> None:
         """Store messages in session."""
-        if session_id not in self._sessions:
-            self._sessions[session_id] = []
-
-        self._sessions[session_id].append({"role": "user", "content": user_msg})
-        self._sessions[session_id].append(
-            {"role": "assistant", "content": assistant_msg}
+        self._sessions.setdefault(session_id, []).extend(
+            (
+                {"role": "user", "content": user_msg},
+                {"role": "assistant", "content": assistant_msg},
+            )
         )
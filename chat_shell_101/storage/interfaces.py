@@ -9,7 +9,7 @@ from typing import List, Optional, Literal
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """A chat message."""
     role: Literal["user", "assistant", "system"]
@@ -25,8 +25,18 @@ class HistoryStorage(ABC):
     """Abstract base class for history storage."""
 
     @abstractmethod
-    async def get_history(self, session_id: str) -> List[Message]:
-        """Get all messages for a session."""
+    async def get_history(
+        self, session_id: str, limit: Optional[int] = None
+    ) -> List[Message]:
+        """Get messages for a session, oldest first.
+
+        The returned list is read-only: implementations may hand out their
+        own stored list rather than a copy, so callers must not modify it.
+
+        Args:
+            session_id: Session to read
+            limit: If given, return only the most recent ``limit`` messages
+        """
         pass
 
     @abstractmethod
@@ -1,123 +1,292 @@
 """
 JSON file storage implementation.
+
+Each session is stored as an append-only JSON Lines file, one message per
+line, so appending a turn only writes the new messages instead of rewriting
+the whole session.
 """
 
 import json
 import asyncio
+import logging
+import os
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 from .interfaces import Message, HistoryStorage, StorageProvider
 from ..config import config
+from ..utils import json_dumps, json_loads
+
+logger = logging.getLogger(__name__)
+
+# Default number of sessions whose history JSONHistoryStorage keeps in memory
+HISTORY_CACHE_SIZE = 128
+
+
+def _tail(messages: List[Message], limit: Optional[int]) -> List[Message]:
+    """Copy the last ``limit`` messages, or all of them if ``limit`` is None."""
+    if limit is None:
+        return list(messages)
+    return messages[-limit:] if limit > 0 else []
 
 
 class JSONHistoryStorage(HistoryStorage):
-    """JSON file-based history storage."""
+    """JSON Lines file-based history storage.
+
+    The ``cache_size`` most recently used sessions are cached in memory.
+    Appended messages are buffered and written to disk once ``flush_every``
+    messages are pending, or on ``flush()``.
+    """
+
+    def __init__(
+        self,
+        storage_path: Path,
+        flush_every: int = 1,
+        cache_size: int = HISTORY_CACHE_SIZE,
+    ):
+        if flush_every < 1:
+            raise ValueError("flush_every must be at least 1")
+        if cache_size < 1:
+            raise ValueError("cache_size must be at least 1")
 
-    def __init__(self, storage_path: Path):
         self.storage_path = storage_path
         self.sessions_path = storage_path / "sessions"
         self.sessions_path.mkdir(parents=True, exist_ok=True)
+        self.flush_every = flush_every
+        self.cache_size = cache_size
+
+        self._history_cache: "OrderedDict[str, List[Message]]" = OrderedDict()
+        self._pending: Dict[str, List[Message]] = {}
+        self._pending_count = 0
+        self._lock = asyncio.Lock()
 
     def _get_session_file(self, session_id: str) -> Path:
         """Get the session file path."""
+        return self.sessions_path / f"{session_id}.jsonl"
+
+    def _get_legacy_session_file(self, session_id: str) -> Path:
+        """Get the pre-JSONL single-document session file path."""
         return self.sessions_path / f"{session_id}.json"
 
-    async def get_history(self, session_id: str) -> List[Message]:
-        """Get all messages for a session."""
+    @staticmethod
+    def _message_to_dict(msg: Message) -> Dict[str, Any]:
+        """Convert a message to a serializable dict."""
+        return {
+            "role": msg.role,
+            "content": msg.content,
+            "timestamp": msg.timestamp.isoformat() if msg.timestamp else None,
+        }
+
+    @staticmethod
+    def _message_from_dict(msg_data: Dict[str, Any]) -> Message:
+        """Build a message from its serialized dict."""
+        # Parse timestamp if present
+        timestamp = None
+        if msg_data.get("timestamp"):
+            timestamp = datetime.fromisoformat(msg_data["timestamp"])
+
+        return Message(
+            role=msg_data["role"],
+            content=msg_data["content"],
+            timestamp=timestamp,
+        )
+
+    def _read_session(self, session_id: str) -> List[Message]:
+        """Read a session from disk (blocking)."""
         session_file = self._get_session_file(session_id)
-        if not session_file.exists():
-            return []
+        legacy_file = self._get_legacy_session_file(session_id)
 
+        # Open directly rather than checking exists() first; a missing
+        # file costs one failed open instead of a stat plus the open
         try:
-            # Use asyncio to read file asynchronously
-            loop = asyncio.get_event_loop()
-            content = await loop.run_in_executor(None, session_file.read_text)
-            data = json.loads(content)
-
-            messages = []
-            for msg_data in data.get("messages", []):
-                # Parse timestamp if present
-                timestamp = None
-                if "timestamp" in msg_data:
-                    timestamp = datetime.fromisoformat(msg_data["timestamp"])
-
-                messages.append(Message(
-                    role=msg_data["role"],
-                    content=msg_data["content"],
-                    timestamp=timestamp
-                ))
+            with session_file.open("rb") as f:
+                lines = [line for line in f if line.strip()]
+        except FileNotFoundError:
+            pass
+        else:
+            messages = [self._message_from_dict(json_loads(line)) for line in lines[:-1]]
+            if lines:
+                # A crash partway through an append leaves a torn last line;
+                # the messages before it are still intact
+                try:
+                    messages.append(self._message_from_dict(json_loads(lines[-1])))
+                except (ValueError, KeyError):
+                    logger.warning("Skipping incomplete last line in %s", session_file)
             return messages
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error reading session file {session_file}: {e}")
+
+        try:
+            data = json_loads(legacy_file.read_bytes())
+        except FileNotFoundError:
             return []
+        return [self._message_from_dict(m) for m in data.get("messages", [])]
+
+    def _write_messages(self, session_id: str, messages: List[Message]) -> None:
+        """Append messages to a session file (blocking)."""
+        session_file = self._get_session_file(session_id)
+        legacy_file = self._get_legacy_session_file(session_id)
+
+        # Migrate a legacy single-document session on first append
+        if not session_file.exists() and legacy_file.exists():
+            messages = self._read_session(session_id) + messages
+            legacy_file.unlink()
+
+        lines = "".join(
+            json_dumps(self._message_to_dict(msg)) + "\n"
+            for msg in messages
+        )
+        with session_file.open("a+b") as f:
+            self._truncate_torn_line(f)
+            f.write(lines.encode("utf-8"))
+
+    @staticmethod
+    def _truncate_torn_line(f) -> None:
+        """Drop bytes after the last newline, left by an interrupted append."""
+        size = f.seek(0, os.SEEK_END)
+        if size == 0:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b"\n":
+            return
+        f.seek(0)
+        keep = f.read().rfind(b"\n") + 1
+        logger.warning("Truncating incomplete last line in %s", f.name)
+        f.truncate(keep)
+
+    def _delete_session(self, session_id: str) -> None:
+        """Delete all files for a session (blocking)."""
+        for path in (
+            self._get_session_file(session_id),
+            self._get_legacy_session_file(session_id),
+        ):
+            path.unlink(missing_ok=True)
+
+    async def get_history(
+        self, session_id: str, limit: Optional[int] = None
+    ) -> List[Message]:
+        """Get messages for a session, optionally only the last ``limit``."""
+        cached = self._history_cache.get(session_id)
+        if cached is not None:
+            self._history_cache.move_to_end(session_id)
+            return _tail(cached, limit)
+
+        async with self._lock:
+            try:
+                messages = await asyncio.to_thread(self._read_session, session_id)
+            except (json.JSONDecodeError, IOError) as e:
+                print(f"Error reading session file {self._get_session_file(session_id)}: {e}")
+                return []
+
+            # Messages appended before the first read may still be buffered
+            messages.extend(self._pending.get(session_id, []))
+            self._history_cache[session_id] = messages
+            if len(self._history_cache) > self.cache_size:
+                self._history_cache.popitem(last=False)
+            return _tail(messages, limit)
 
     async def append_messages(self, session_id: str, messages: List[Message]) -> None:
         """Append messages to a session."""
-        session_file = self._get_session_file(session_id)
+        if not messages:
+            return
 
-        # Get existing messages
-        existing_messages = await self.get_history(session_id)
-        all_messages = existing_messages + messages
-
-        # Convert to serializable format
-        serializable_messages = []
-        for msg in all_messages:
-            msg_dict = {
-                "role": msg.role,
-                "content": msg.content,
-                "timestamp": msg.timestamp.isoformat() if msg.timestamp else None
-            }
-            serializable_messages.append(msg_dict)
-
-        data = {
-            "session_id": session_id,
-            "updated_at": datetime.now().isoformat(),
-            "messages": serializable_messages
-        }
+        cached = self._history_cache.get(session_id)
+        if cached is not None:
+            cached.extend(messages)
+            self._history_cache.move_to_end(session_id)
 
-        try:
-            # Use asyncio to write file asynchronously
-            loop = asyncio.get_event_loop()
-            json_data = json.dumps(data, indent=2, ensure_ascii=False)
-            await loop.run_in_executor(None, session_file.write_text, json_data)
-        except IOError as e:
-            print(f"Error writing session file {session_file}: {e}")
+        self._pending.setdefault(session_id, []).extend(messages)
+        self._pending_count += len(messages)
+
+        if self._pending_count >= self.flush_every:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write all buffered messages to disk."""
+        async with self._lock:
+            pending, self._pending = self._pending, {}
+            self._pending_count = 0
+
+            for session_id, messages in pending.items():
+                try:
+                    await asyncio.to_thread(self._write_messages, session_id, messages)
+                except IOError as e:
+                    print(f"Error writing session file {self._get_session_file(session_id)}: {e}")
+
+    async def close(self) -> None:
+        """Flush buffered messages and drop cached sessions."""
+        await self.flush()
+        self._history_cache.clear()
 
     async def clear_history(self, session_id: str) -> None:
         """Clear history for a session."""
-        session_file = self._get_session_file(session_id)
-        if session_file.exists():
+        self._history_cache.pop(session_id, None)
+        dropped = self._pending.pop(session_id, [])
+        self._pending_count -= len(dropped)
+
+        async with self._lock:
             try:
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(None, session_file.unlink)
+                await asyncio.to_thread(self._delete_session, session_id)
             except IOError as e:
-                print(f"Error deleting session file {session_file}: {e}")
+                print(f"Error deleting session file {self._get_session_file(session_id)}: {e}")
 
 
 class JSONStorage(StorageProvider):
-    """JSON file storage provider."""
+    """JSON file storage provider.
+
+    With ``flush_interval`` set, buffered messages are also flushed in the
+    background every ``flush_interval`` seconds, so a large ``flush_every``
+    does not leave them unwritten until ``close()``.
+    """
+
+    def __init__(
+        self,
+        storage_path: Path = None,
+        flush_every: int = 1,
+        flush_interval: Optional[float] = None,
+    ):
+        if flush_interval is not None and flush_interval <= 0:
+            raise ValueError("flush_interval must be positive")
 
-    def __init__(self, storage_path: Path = None):
         if storage_path is None:
             storage_path = config.get_storage_path()
         self.storage_path = storage_path
-        self._history_storage = None
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._history_storage: Optional[JSONHistoryStorage] = None
+        self._flush_task: Optional[asyncio.Task] = None
 
     async def initialize(self) -> None:
         """Initialize the storage provider."""
         self.storage_path.mkdir(parents=True, exist_ok=True)
-        self._history_storage = JSONHistoryStorage(self.storage_path)
+        self._history_storage = JSONHistoryStorage(
+            self.storage_path, flush_every=self.flush_every
+        )
+        if self.flush_interval is not None:
+            self._flush_task = asyncio.create_task(self._flush_periodically())
+
+    async def _flush_periodically(self) -> None:
+        """Flush buffered messages every ``flush_interval`` seconds."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self._history_storage.flush()
 
     async def close(self) -> None:
-        """Close the storage provider."""
-        # Nothing to close for file-based storage
-        pass
+        """Close the storage provider, flushing buffered messages."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        if self._history_storage is not None:
+            await self._history_storage.close()
 
     @property
     def history(self) -> HistoryStorage:
         """Get the history storage."""
         if self._history_storage is None:
             raise RuntimeError("Storage provider not initialized. Call initialize() first.")
-        return self._history_storage
\ No newline at end of file
+        return self._history_storage
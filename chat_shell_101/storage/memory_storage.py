@@ -2,7 +2,7 @@
 In-memory storage implementation.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 from .interfaces import Message, HistoryStorage, StorageProvider
 
 
@@ -12,9 +12,18 @@ class MemoryHistoryStorage(HistoryStorage):
     def __init__(self):
         self.sessions: Dict[str, List[Message]] = {}
 
-    async def get_history(self, session_id: str) -> List[Message]:
-        """Get all messages for a session."""
-        return self.sessions.get(session_id, [])
+    async def get_history(
+        self, session_id: str, limit: Optional[int] = None
+    ) -> List[Message]:
+        """Get messages for a session, optionally only the last ``limit``.
+
+        The full history is the stored list itself, so reads cost nothing
+        however often they happen.
+        """
+        messages = self.sessions.get(session_id, [])
+        if limit is not None:
+            return messages[-limit:] if limit > 0 else []
+        return messages
 
     async def append_messages(self, session_id: str, messages: List[Message]) -> None:
         """Append messages to a session."""
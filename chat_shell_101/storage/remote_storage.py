@@ -45,8 +45,10 @@ class RemoteHistoryStorage(HistoryStorage):
             await self._client.aclose()
             self._client = None
 
-    async def get_history(self, session_id: str) -> List[Message]:
-        """Get messages from remote API."""
+    async def get_history(
+        self, session_id: str, limit: Optional[int] = None
+    ) -> List[Message]:
+        """Get messages from remote API, optionally only the last ``limit``."""
         if not self._client:
             raise RuntimeError("Storage not initialized")
 
@@ -66,6 +68,8 @@ class RemoteHistoryStorage(HistoryStorage):
                     timestamp=timestamp,
                 )
             )
+        if limit is not None:
+            return messages[-limit:] if limit > 0 else []
         return messages
 
     async def append_messages(self, session_id: str, messages: List[Message]) -> None:
@@ -22,6 +22,8 @@ class SQLiteHistoryStorage(HistoryStorage):
         """Get database connection with row factory."""
         conn = sqlite3.connect(str(self.db_path))
         conn.row_factory = sqlite3.Row
+        # Safe with WAL and avoids an fsync on every commit
+        conn.execute("PRAGMA synchronous=NORMAL")
         return conn
 
     async def initialize(self) -> None:
@@ -30,6 +32,8 @@ class SQLiteHistoryStorage(HistoryStorage):
         def _init():
             conn = self._get_connection()
             try:
+                # WAL is persistent, so setting it once per database is enough
+                conn.execute("PRAGMA journal_mode=WAL")
                 conn.execute(
                     """
                     CREATE TABLE IF NOT EXISTS sessions (
@@ -64,8 +68,10 @@ class SQLiteHistoryStorage(HistoryStorage):
 
         await asyncio.to_thread(_init)
 
-    async def get_history(self, session_id: str) -> List[Message]:
-        """Get all messages for a session."""
+    async def get_history(
+        self, session_id: str, limit: Optional[int] = None
+    ) -> List[Message]:
+        """Get messages for a session, optionally only the last ``limit``."""
 
         def _get():
             conn = self._get_connection()
@@ -78,16 +84,30 @@ class SQLiteHistoryStorage(HistoryStorage):
                     return []
 
                 # Get messages
-                cursor = conn.execute(
-                    """
-                    SELECT role, content, timestamp
-                    FROM messages
-                    WHERE session_id = ?
-                    ORDER BY timestamp ASC, id ASC
-                    """,
-                    (session_id,),
-                )
-                rows = cursor.fetchall()
+                if limit is None:
+                    cursor = conn.execute(
+                        """
+                        SELECT role, content, timestamp
+                        FROM messages
+                        WHERE session_id = ?
+                        ORDER BY timestamp ASC, id ASC
+                        """,
+                        (session_id,),
+                    )
+                    rows = cursor.fetchall()
+                else:
+                    # Read only the tail, newest first, then restore order
+                    cursor = conn.execute(
+                        """
+                        SELECT role, content, timestamp
+                        FROM messages
+                        WHERE session_id = ?
+                        ORDER BY timestamp DESC, id DESC
+                        LIMIT ?
+                        """,
+                        (session_id, max(limit, 0)),
+                    )
+                    rows = cursor.fetchall()[::-1]
 
                 messages = []
                 for row in rows:
@@ -121,12 +141,12 @@ class SQLiteHistoryStorage(HistoryStorage):
                 )
 
                 # Insert messages
-                for msg in messages:
-                    conn.execute(
-                        """
-                        INSERT INTO messages (session_id, role, content, timestamp)
-                        VALUES (?, ?, ?, ?)
-                        """,
+                conn.executemany(
+                    """
+                    INSERT INTO messages (session_id, role, content, timestamp)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    [
                         (
                             session_id,
                             msg.role,
@@ -134,8 +154,10 @@ class SQLiteHistoryStorage(HistoryStorage):
                             msg.timestamp.isoformat()
                             if msg.timestamp
                             else datetime.now().isoformat(),
-                        ),
-                    )
+                        )
+                        for msg in messages
+                    ],
+                )
 
                 conn.commit()
             finally:
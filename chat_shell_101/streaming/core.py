@@ -278,11 +278,7 @@ class StreamingCore:
             context.session.mark_complete()
 
             # Emit completion event
-            complete_event = CompleteEvent(
-                offset=context.session.get_next_offset(),
-                session_id=context.session_id,
-                final_offset=context.session.current_offset - 1,
-            )
+            complete_event = self._terminal_event(context, context.session.get_next_offset())
             await self._emit_to_stream(stream_id, complete_event)
 
             # Disconnect all clients
@@ -300,12 +296,7 @@ class StreamingCore:
             context.session.mark_cancelled(reason)
 
             # Emit cancellation event
-            cancel_event = CancelledEvent(
-                offset=context.session.get_next_offset(),
-                session_id=context.session_id,
-                cancelled_at_offset=context.session.current_offset - 1,
-                reason=reason,
-            )
+            cancel_event = self._terminal_event(context, context.session.get_next_offset())
             await self._emit_to_stream(stream_id, cancel_event)
 
             # Disconnect all clients
@@ -323,12 +314,7 @@ class StreamingCore:
             context.session.mark_error(error_code, message)
 
             # Emit error event
-            error_event = ErrorEvent(
-                offset=context.session.get_next_offset(),
-                session_id=context.session_id,
-                error_code=error_code,
-                message=message,
-            )
+            error_event = self._terminal_event(context, context.session.get_next_offset())
             await self._emit_to_stream(stream_id, error_event)
 
             # Disconnect all clients
@@ -408,6 +394,66 @@ class StreamingCore:
 
             return client
 
+    async def replay_stream(
+        self,
+        stream_id: str,
+        from_offset: int = 0,
+    ) -> AsyncGenerator[str, None]:
+        """Replay a finished stream from its buffer as SSE strings.
+
+        Yields the buffered events from ``from_offset`` onwards followed by
+        the stream's terminal event.
+
+        Args:
+            stream_id: Stream to replay
+            from_offset: Offset to start from (inclusive)
+
+        Raises:
+            StreamNotFoundError: If stream not found
+            StreamingError: If the stream has not finished yet
+        """
+        context = await self.get_stream(stream_id)
+        session = context.session
+
+        if not session.is_terminal():
+            raise StreamingError(f"Stream {stream_id} is still active", stream_id)
+
+        for event in await context.buffer.get_from_offset(from_offset):
+            yield self.emitter.format_event(event)
+
+        # The terminal event was the last offset assigned
+        terminal = self._terminal_event(context, session.current_offset - 1)
+        yield self.emitter.format_event(terminal)
+
+    @staticmethod
+    def _terminal_event(context: StreamContext, offset: int) -> BaseStreamEvent:
+        """Build the terminal event of a finished stream at ``offset``.
+
+        Used both when the stream finishes and by ``replay_stream``, so a
+        resumed client sees the same event as one that stayed connected.
+        """
+        session = context.session
+        if session.status == StreamStatus.COMPLETED:
+            return CompleteEvent(
+                offset=offset,
+                session_id=context.session_id,
+                final_offset=offset,
+            )
+        if session.status == StreamStatus.CANCELLED:
+            return CancelledEvent(
+                offset=offset,
+                session_id=context.session_id,
+                cancelled_at_offset=offset,
+                reason=session.metadata.get("cancellation_reason"),
+            )
+        error_info = session.error_info or {}
+        return ErrorEvent(
+            offset=offset,
+            session_id=context.session_id,
+            error_code=error_info.get("error_code", "STREAM_ERROR"),
+            message=error_info.get("message", ""),
+        )
+
     async def disconnect_client(self, client_id: str, stream_id: str):
         """Disconnect a client from a stream."""
         await self.state.disconnect_client(client_id, stream_id)
@@ -525,7 +571,8 @@ def get_streaming_core() -> StreamingCore:
     """Get the global streaming core instance."""
     global _streaming_core
     if _streaming_core is None:
-        _streaming_core = StreamingCore()
+        # SSE ids are stream offsets so clients can resume with Last-Event-ID
+        _streaming_core = StreamingCore(emitter=SSEEmitter(use_offset_ids=True))
     return _streaming_core
 
 
@@ -3,13 +3,13 @@ SSE (Server-Sent Events) emitter for streaming responses.
 """
 
 import asyncio
-import json
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Set
 
+from ..utils import json_dumps
 from .events import BaseStreamEvent, EventType
 from .exceptions import ClientDisconnectedError, StreamingError
 
@@ -129,6 +129,10 @@ class SSEEmitter:
 
     Handles event queuing per client, connection management,
     heartbeat/keepalive mechanisms, and batch event emission.
+
+    By default the SSE ``id`` field is a global sequence number. With
+    ``use_offset_ids`` it is the event's stream offset instead, so a
+    reconnecting client's ``Last-Event-ID`` can be used to resume the stream.
     """
 
     def __init__(
@@ -136,10 +140,12 @@ class SSEEmitter:
         heartbeat_interval: float = 30.0,
         max_queue_size: int = 1000,
         enable_heartbeats: bool = True,
+        use_offset_ids: bool = False,
     ):
         self.heartbeat_interval = heartbeat_interval
         self.max_queue_size = max_queue_size
         self.enable_heartbeats = enable_heartbeats
+        self.use_offset_ids = use_offset_ids
 
         self._clients: Dict[str, ClientConnection] = {}
         self._stream_clients: Dict[str, Set[str]] = {}  # stream_id -> set of client_ids
@@ -278,6 +284,18 @@ class SSEEmitter:
         Raises:
             ClientDisconnectedError: If client is not connected
         """
+        return await self._emit_serialized(
+            client_id, event, self._serialize_payload(event), timeout
+        )
+
+    async def _emit_serialized(
+        self,
+        client_id: str,
+        event: BaseStreamEvent,
+        data: str,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """Queue an event whose payload has already been serialized."""
         async with self._lock:
             if client_id not in self._clients:
                 raise ClientDisconnectedError(f"Client {client_id} not connected")
@@ -290,7 +308,7 @@ class SSEEmitter:
             sequence = self._get_next_sequence()
 
             # Convert to SSE message with sequence
-            sse_msg = self._event_to_sse(event, sequence)
+            sse_msg = self._event_to_sse(event, sequence, data=data)
 
             # Try to queue
             try:
@@ -330,10 +348,13 @@ class SSEEmitter:
         if exclude_client:
             client_ids.discard(exclude_client)
 
+        # The payload is the same for every client, so serialize it once
+        data = self._serialize_payload(event) if client_ids else ""
+
         results = {}
         for client_id in client_ids:
             try:
-                results[client_id] = await self.emit(client_id, event)
+                results[client_id] = await self._emit_serialized(client_id, event, data)
             except ClientDisconnectedError:
                 results[client_id] = False
 
@@ -363,19 +384,45 @@ class SSEEmitter:
                 break
         return count
 
-    def _event_to_sse(self, event: BaseStreamEvent, sequence: Optional[int] = None) -> SSEMessage:
-        """Convert a stream event to SSE message."""
-        payload = event.to_sse_payload()
+    @staticmethod
+    def _serialize_payload(event: BaseStreamEvent) -> str:
+        """Serialize an event's SSE payload to JSON."""
+        return json_dumps(event.to_sse_payload())
+
+    def _event_to_sse(
+        self,
+        event: BaseStreamEvent,
+        sequence: Optional[int] = None,
+        data: Optional[str] = None,
+    ) -> SSEMessage:
+        """Convert a stream event to SSE message.
+
+        Args:
+            event: Event to convert
+            sequence: Optional sequence number used as the SSE id
+            data: Optional pre-serialized payload
+        """
+        if data is None:
+            data = self._serialize_payload(event)
 
-        # Use provided sequence or fall back to event's sequence
-        seq = sequence if sequence is not None else event.sequence
+        if self.use_offset_ids:
+            # Checkpoints share the offset of the event they precede, so they
+            # carry no id and leave the client's Last-Event-ID unchanged
+            seq = None if event.event_type == EventType.OFFSET else event.offset
+        else:
+            # Use provided sequence or fall back to event's sequence
+            seq = sequence if sequence is not None else event.sequence
 
         return SSEMessage(
             event=event.event_type.value if hasattr(event.event_type, 'value') else str(event.event_type),
-            data=json.dumps(payload),
+            data=data,
             id=str(seq) if seq is not None else None,
         )
 
+    def format_event(self, event: BaseStreamEvent) -> str:
+        """Format an event as an SSE string without queuing it."""
+        return self._event_to_sse(event).to_sse_format()
+
     async def event_generator(
         self,
         client_id: str,
@@ -3,6 +3,7 @@ Streaming state management for session tracking and recovery.
 """
 
 import asyncio
+from collections import Counter
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional, Set
@@ -96,37 +97,36 @@ class StreamSession(BaseModel):
 
     def update_checkpoint(self, offset: int, data: Dict[str, Any]):
         """Update checkpoint data for recovery."""
+        now = datetime.utcnow()
         self.checkpoint_data = {
             "offset": offset,
             "data": data,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now.isoformat(),
         }
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
 
     def mark_complete(self):
         """Mark the stream as completed."""
         self.status = StreamStatus.COMPLETED
-        self.completed_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        self.completed_at = self.updated_at = datetime.utcnow()
 
     def mark_cancelled(self, reason: Optional[str] = None):
         """Mark the stream as cancelled."""
         self.status = StreamStatus.CANCELLED
-        self.completed_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        self.completed_at = self.updated_at = datetime.utcnow()
         if reason:
             self.metadata["cancellation_reason"] = reason
 
     def mark_error(self, error_code: str, message: str, details: Optional[Dict] = None):
         """Mark the stream as errored."""
+        now = datetime.utcnow()
         self.status = StreamStatus.ERROR
-        self.completed_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        self.completed_at = self.updated_at = now
         self.error_info = {
             "error_code": error_code,
             "message": message,
             "details": details or {},
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now.isoformat(),
         }
 
     def add_client(self, client_id: str):
@@ -403,18 +403,20 @@ class StreamingState:
     async def get_stats(self) -> Dict[str, Any]:
         """Get streaming statistics."""
         async with self._lock:
-            total = len(self._streams)
-            active = sum(1 for s in self._streams.values() if s.is_active())
-            completed = sum(1 for s in self._streams.values() if s.status == StreamStatus.COMPLETED)
-            cancelled = sum(1 for s in self._streams.values() if s.status == StreamStatus.CANCELLED)
-            error = sum(1 for s in self._streams.values() if s.status == StreamStatus.ERROR)
+            # Count every status in a single pass over the streams
+            by_status = Counter(s.status for s in self._streams.values())
+            active = (
+                by_status[StreamStatus.PENDING]
+                + by_status[StreamStatus.RUNNING]
+                + by_status[StreamStatus.PAUSED]
+            )
 
             return {
-                "total_streams": total,
+                "total_streams": len(self._streams),
                 "active_streams": active,
-                "completed_streams": completed,
-                "cancelled_streams": cancelled,
-                "error_streams": error,
+                "completed_streams": by_status[StreamStatus.COMPLETED],
+                "cancelled_streams": by_status[StreamStatus.CANCELLED],
+                "error_streams": by_status[StreamStatus.ERROR],
                 "total_clients": len(self._clients),
                 "active_clients": sum(1 for c in self._clients.values() if c.is_active),
             }
@@ -4,6 +4,7 @@ File reader tool for parsing various file formats.
 
 import io
 import logging
+import stat
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 from pydantic import BaseModel, Field
@@ -78,14 +79,17 @@ class FileReaderTool(BaseTool):
         """Execute file reader."""
         file_path = Path(input_data.file_path)
 
-        # Validate path
-        if not file_path.exists():
+        # Validate path. A single stat() answers existence, type and size
+        # for the whole call.
+        try:
+            file_stat = file_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
             return ToolOutput(
                 result="",
                 error=f"File not found: {file_path}"
             )
 
-        if not file_path.is_file():
+        if not stat.S_ISREG(file_stat.st_mode):
             return ToolOutput(
                 result="",
                 error=f"Path is not a file: {file_path}"
@@ -102,19 +106,20 @@ class FileReaderTool(BaseTool):
 
         try:
             # Route to appropriate reader
+            file_size = file_stat.st_size
             if extension == '.pdf':
-                return await self._read_pdf(file_path, input_data)
+                return await self._read_pdf(file_path, input_data, file_size)
             elif extension == '.docx':
-                return await self._read_docx(file_path, input_data)
+                return await self._read_docx(file_path, input_data, file_size)
             elif extension == '.xlsx':
-                return await self._read_xlsx(file_path, input_data)
+                return await self._read_xlsx(file_path, input_data, file_size)
             elif extension == '.csv':
-                return await self._read_csv(file_path, input_data)
+                return await self._read_csv(file_path, input_data, file_size)
             elif extension == '.json':
-                return await self._read_json(file_path, input_data)
+                return await self._read_json(file_path, input_data, file_size)
             else:
                 # Text-based files
-                return await self._read_text(file_path, input_data)
+                return await self._read_text(file_path, input_data, file_size)
 
         except Exception as e:
             logger.error(f"Failed to read file {file_path}: {e}")
@@ -123,7 +128,7 @@ class FileReaderTool(BaseTool):
                 error=f"Failed to read file: {str(e)}"
             )
 
-    async def _read_text(self, file_path: Path, input_data: FileReaderInput) -> ToolOutput:
+    async def _read_text(self, file_path: Path, input_data: FileReaderInput, file_size: int) -> ToolOutput:
         """Read text-based files."""
         # Try to detect encoding if chardet is available
         try:
@@ -152,7 +157,7 @@ class FileReaderTool(BaseTool):
             words = content.split()
             metadata = FileMetadata(
                 file_name=file_path.name,
-                file_size=file_path.stat().st_size,
+                file_size=file_size,
                 file_type=f"text/{file_path.suffix.lstrip('.')}",
                 encoding=encoding,
                 line_count=len(lines),
@@ -165,7 +170,7 @@ class FileReaderTool(BaseTool):
             metadata=metadata
         )
 
-    async def _read_pdf(self, file_path: Path, input_data: FileReaderInput) -> ToolOutput:
+    async def _read_pdf(self, file_path: Path, input_data: FileReaderInput, file_size: int) -> ToolOutput:
         """Read PDF files."""
         try:
             import PyPDF2
@@ -194,7 +199,7 @@ class FileReaderTool(BaseTool):
             if input_data.extract_metadata:
                 metadata = FileMetadata(
                     file_name=file_path.name,
-                    file_size=file_path.stat().st_size,
+                    file_size=file_size,
                     file_type="application/pdf",
                     page_count=num_pages
                 )
@@ -206,7 +211,7 @@ class FileReaderTool(BaseTool):
             metadata=metadata
         )
 
-    async def _read_docx(self, file_path: Path, input_data: FileReaderInput) -> ToolOutput:
+    async def _read_docx(self, file_path: Path, input_data: FileReaderInput, file_size: int) -> ToolOutput:
         """Read Word documents."""
         try:
             import docx
@@ -230,7 +235,7 @@ class FileReaderTool(BaseTool):
         if input_data.extract_metadata:
             metadata = FileMetadata(
                 file_name=file_path.name,
-                file_size=file_path.stat().st_size,
+                file_size=file_size,
                 file_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
                 word_count=len(content.split())
             )
@@ -241,7 +246,7 @@ class FileReaderTool(BaseTool):
             metadata=metadata
         )
 
-    async def _read_xlsx(self, file_path: Path, input_data: FileReaderInput) -> ToolOutput:
+    async def _read_xlsx(self, file_path: Path, input_data: FileReaderInput, file_size: int) -> ToolOutput:
         """Read Excel files."""
         try:
             import pandas as pd
@@ -275,7 +280,7 @@ class FileReaderTool(BaseTool):
             if input_data.extract_metadata:
                 metadata = FileMetadata(
                     file_name=file_path.name,
-                    file_size=file_path.stat().st_size,
+                    file_size=file_size,
                     file_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
                 )
 
@@ -291,7 +296,7 @@ class FileReaderTool(BaseTool):
                 error=f"Failed to read Excel file: {str(e)}"
             )
 
-    async def _read_csv(self, file_path: Path, input_data: FileReaderInput) -> ToolOutput:
+    async def _read_csv(self, file_path: Path, input_data: FileReaderInput, file_size: int) -> ToolOutput:
         """Read CSV files."""
         try:
             import pandas as pd
@@ -330,7 +335,7 @@ class FileReaderTool(BaseTool):
         if input_data.extract_metadata:
             metadata = FileMetadata(
                 file_name=file_path.name,
-                file_size=file_path.stat().st_size,
+                file_size=file_size,
                 file_type="text/csv",
                 line_count=len(df)
             )
@@ -341,7 +346,7 @@ class FileReaderTool(BaseTool):
             metadata=metadata
         )
 
-    async def _read_json(self, file_path: Path, input_data: FileReaderInput) -> ToolOutput:
+    async def _read_json(self, file_path: Path, input_data: FileReaderInput, file_size: int) -> ToolOutput:
         """Read JSON files."""
         import json
 
@@ -355,7 +360,7 @@ class FileReaderTool(BaseTool):
         if input_data.extract_metadata:
             metadata = FileMetadata(
                 file_name=file_path.name,
-                file_size=file_path.stat().st_size,
+                file_size=file_size,
                 file_type="application/json"
             )
 
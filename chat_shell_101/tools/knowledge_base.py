@@ -3,6 +3,7 @@ Knowledge base tool for RAG-based knowledge retrieval.
 """
 
 import logging
+import uuid
 from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 
@@ -183,7 +184,6 @@ class KnowledgeBaseTool(BaseTool):
         kb = kb_name or self.default_kb
 
         if doc_id is None:
-            import uuid
             doc_id = str(uuid.uuid4())
 
         doc = KnowledgeDocument(
@@ -24,6 +24,9 @@ class ToolRegistry:
         self._pre_load_hooks: List[Callable[[BaseTool], None]] = []
         self._post_load_hooks: List[Callable[[BaseTool], None]] = []
         self._pre_unload_hooks: List[Callable[[BaseTool], None]] = []
+        self._langchain_tools: Optional[List[Any]] = None
+        self._tool_specs: Optional[List[Dict[str, Any]]] = None
+        self._tool_schemas: Optional[Dict[str, Dict]] = None
 
     def register(self, tool: BaseTool, allow_replace: bool = False) -> None:
         """Register a tool.
@@ -57,6 +60,9 @@ class ToolRegistry:
 
         self._tools[tool.name] = tool
         self._tool_classes[tool.name] = type(tool)
+        self._langchain_tools = None
+        self._tool_specs = None
+        self._tool_schemas = None
 
         # Run post-load hooks
         for hook in self._post_load_hooks:
@@ -90,6 +96,9 @@ class ToolRegistry:
 
         del self._tools[name]
         del self._tool_classes[name]
+        self._langchain_tools = None
+        self._tool_specs = None
+        self._tool_schemas = None
         logger.info(f"Unregistered tool: {name}")
 
     def get_tool(self, name: str) -> BaseTool:
@@ -104,9 +113,10 @@ class ToolRegistry:
         Raises:
             ToolNotFoundError: If tool is not found
         """
-        if name not in self._tools:
+        tool = self._tools.get(name)
+        if tool is None:
             raise ToolNotFoundError(name)
-        return self._tools[name]
+        return tool
 
     def has_tool(self, name: str) -> bool:
         """Check if a tool is registered.
@@ -128,11 +138,16 @@ class ToolRegistry:
         return list(self._tools.keys())
 
     def get_tool_schemas(self) -> Dict[str, Dict]:
-        """Get JSON schemas for all tools."""
-        schemas = {}
-        for name, tool in self._tools.items():
-            schemas[name] = tool.input_schema.model_json_schema()
-        return schemas
+        """Get JSON schemas for all tools.
+
+        The schemas are cached until a tool is registered or unregistered.
+        """
+        if self._tool_schemas is None:
+            self._tool_schemas = {
+                name: tool.input_schema.model_json_schema()
+                for name, tool in self._tools.items()
+            }
+        return dict(self._tool_schemas)
 
     def clear(self) -> None:
         """Clear all registered tools."""
@@ -240,33 +255,57 @@ class ToolRegistry:
         """Add a hook to run before tool unregistration."""
         self._pre_unload_hooks.append(hook)
 
+    @staticmethod
+    def _make_tool_func(tool: BaseTool) -> Callable[..., Any]:
+        """Build the async callable LangChain invokes for a tool."""
+        validate = tool.input_schema.model_validate
+        execute = tool.execute
+
+        async def tool_func(**kwargs):
+            result = await execute(validate(kwargs))
+            if result.error:
+                raise ValueError(result.error)
+            return result.result
+
+        tool_func.__name__ = tool.name
+        return tool_func
+
     def to_langchain_tools(self):
-        """Convert tools to LangChain tool format."""
-        from langchain.tools import tool as langchain_tool
-        langchain_tools = []
-
-        for current_tool in self._tools.values():
-            tool_instance = current_tool
-
-            def make_tool_func(tool):
-                async def tool_func(**kwargs):
-                    input_data = tool.input_schema(**kwargs)
-                    result = await tool.execute(input_data)
-                    if result.error:
-                        raise ValueError(result.error)
-                    return result.result
-                return tool_func
-
-            tool_func = make_tool_func(tool_instance)
-            tool_func.__name__ = tool_instance.name
-            lc_tool = langchain_tool(
-                tool_func,
-                description=tool_instance.description,
-                args_schema=tool_instance.input_schema
-            )
-            langchain_tools.append(lc_tool)
+        """Convert tools to LangChain tool format.
+
+        The converted tools are cached until a tool is registered or
+        unregistered.
+        """
+        if self._langchain_tools is None:
+            from langchain.tools import tool as langchain_tool
+
+            self._langchain_tools = [
+                langchain_tool(
+                    self._make_tool_func(tool),
+                    description=tool.description,
+                    args_schema=tool.input_schema,
+                )
+                for tool in self._tools.values()
+            ]
+
+        return list(self._langchain_tools)
+
+    def get_tool_specs(self) -> List[Dict[str, Any]]:
+        """Get OpenAI-format function specs for all tools.
+
+        Converting a tool's pydantic schema to JSON schema is the expensive
+        part of ``bind_tools``. The specs are built once and cached until a
+        tool is registered or unregistered; binding a list of ready-made
+        specs is cheap for every provider.
+        """
+        if self._tool_specs is None:
+            from langchain_core.utils.function_calling import convert_to_openai_tool
+
+            self._tool_specs = [
+                convert_to_openai_tool(lc_tool) for lc_tool in self.to_langchain_tools()
+            ]
 
-        return langchain_tools
+        return list(self._tool_specs)
 
 
 # Global tool registry instance
@@ -2,6 +2,7 @@
 Skill loading tool for dynamic skill management.
 """
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -144,7 +145,6 @@ class LoadSkillTool(BaseTool):
         logger.info(f"Loading skill {skill_name} from {source}")
 
         # Simulate loading
-        import asyncio
         await asyncio.sleep(0.1)
 
     async def _load_from_default(self, skill_name: str, config: Optional[Dict]):
@@ -158,7 +158,6 @@ class LoadSkillTool(BaseTool):
         logger.info(f"Loading skill from {skill_path}")
 
         # Placeholder for actual module loading
-        import asyncio
         await asyncio.sleep(0.1)
 
     async def _list_skills(self) -> LoadSkillOutput:
@@ -121,10 +121,13 @@ class WebSearchTool(BaseTool):
                 # Add related topics
                 for topic in data.get("RelatedTopics", [])[:num_results - len(results)]:
                     if isinstance(topic, dict) and "Text" in topic:
+                        text = topic["Text"]
+                        # One scan finds the separator and splits off the title
+                        title, sep, _ = text.partition(" - ")
                         results.append(WebSearchResult(
-                            title=topic.get("Text", "").split(" - ")[0] if " - " in topic.get("Text", "") else query,
+                            title=title if sep else query,
                             url=topic.get("FirstURL", ""),
-                            snippet=topic.get("Text", "")
+                            snippet=text
                         ))
 
             # If no results from instant answer, fallback to HTML scraping
@@ -3,7 +3,49 @@ Utility functions for Chat Shell 101.
 """
 
 import asyncio
-from typing import Any, Dict
+import json
+from typing import Any, Coroutine, Dict, TypeVar
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is an optional speedup
+    uvloop = None
+
+T = TypeVar("T")
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize an object to a compact JSON string.
+
+    Uses orjson when it is installed and falls back to the stdlib encoder.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def json_loads(data: Any) -> Any:
+    """Deserialize JSON from str or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def run_async(main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on a new event loop.
+
+    Uses uvloop's faster event loop when it is installed (uvicorn's
+    ``standard`` extra pulls it in on most platforms) and falls back to
+    ``asyncio.run``.
+    """
+    if uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)
 
 
 async def async_retry(max_retries: int = 3, delay: float = 1.0):
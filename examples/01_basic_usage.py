@@ -10,6 +10,9 @@ Prerequisites:
 """
 
 import asyncio
+from typing import Optional
+
+import httpx
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -18,20 +21,46 @@ load_dotenv()
 from chat_shell_101.agent.agent import ChatAgent
 from chat_shell_101.agent.config import AgentConfig
 
+from _concurrent import gather_in_order
+from _stream_writer import TokenWriter
+
+# Banner lines
+_BAR = "=" * 60
+_STAR = "*" * 60
+
+# One line format per stream event type, filled from the event's data
+EVENT_FORMATS = {
+    # Regular text content from the model
+    "content": "  [CONTENT] {text}\n",
+    # Model's thinking process (when show_thinking=True)
+    "thinking": "  [THINKING] {text}\n",
+    # Tool being called
+    "tool_call": "  [TOOL_CALL] {tool}({input})\n",
+    # Result from tool execution
+    "tool_result": "  [TOOL_RESULT] {result}\n",
+    # Error occurred
+    "error": "  [ERROR] {message}\n",
+}
+
+
+# One connection pool for every agent, so only the first request pays for
+# the TCP and TLS handshakes. main() creates it inside the running loop.
+http_client: Optional[httpx.AsyncClient] = None
+
+
+async def create_agent(**overrides) -> ChatAgent:
+    """Create and initialize an agent with the examples' default settings."""
+    config = AgentConfig(model="deepseek-chat", temperature=0.7, **overrides)
+    agent = ChatAgent(config, http_client=http_client)
+    await agent.initialize()
+    return agent
+
 
-async def basic_invoke_example():
+async def basic_invoke_example(agent: ChatAgent):
     """Example 1: Simple invoke - get complete response at once."""
-    print("=" * 60)
+    print(_BAR)
     print("Example 1: Basic Invoke (Non-streaming)")
-    print("=" * 60)
-
-    # Create agent with default configuration
-    config = AgentConfig(
-        model="deepseek-chat",
-        temperature=0.7,
-    )
-    agent = ChatAgent(config)
-    await agent.initialize()
+    print(_BAR)
 
     # Simple question - get full response
     messages = [
@@ -44,18 +73,11 @@ async def basic_invoke_example():
     print()
 
 
-async def streaming_example():
+async def streaming_example(agent: ChatAgent):
     """Example 2: Streaming - get tokens as they arrive."""
-    print("=" * 60)
+    print(_BAR)
     print("Example 2: Streaming Response")
-    print("=" * 60)
-
-    config = AgentConfig(
-        model="deepseek-chat",
-        temperature=0.7,
-    )
-    agent = ChatAgent(config)
-    await agent.initialize()
+    print(_BAR)
 
     messages = [
         {"role": "user", "content": "Count from 1 to 5"}
@@ -64,26 +86,21 @@ async def streaming_example():
     print("User: Count from 1 to 5")
     print("Assistant: ", end="", flush=True)
 
-    # Stream tokens as they arrive from the LLM
+    # Stream tokens as they arrive from the LLM, batching the writes
+    out = TokenWriter()
     async for event in agent.stream(messages):
         if event["type"] == "content":
-            print(event["data"]["text"], end="", flush=True)
+            out.write(event["data"]["text"])
+    out.flush()
 
     print("\n")
 
 
-async def multi_turn_conversation_example():
+async def multi_turn_conversation_example(agent: ChatAgent):
     """Example 3: Multi-turn conversation with history."""
-    print("=" * 60)
+    print(_BAR)
     print("Example 3: Multi-turn Conversation")
-    print("=" * 60)
-
-    config = AgentConfig(
-        model="deepseek-chat",
-        temperature=0.7,
-    )
-    agent = ChatAgent(config)
-    await agent.initialize()
+    print(_BAR)
 
     # Conversation with context
     messages = [
@@ -108,18 +125,14 @@ async def multi_turn_conversation_example():
 
 async def system_prompt_example():
     """Example 4: Using system prompts to customize behavior."""
-    print("=" * 60)
+    print(_BAR)
     print("Example 4: System Prompt Customization")
-    print("=" * 60)
+    print(_BAR)
 
     # Agent with custom system prompt
-    config = AgentConfig(
-        model="deepseek-chat",
-        temperature=0.7,
+    agent = await create_agent(
         system_prompt="You are a helpful coding assistant. Always provide code examples when relevant."
     )
-    agent = ChatAgent(config)
-    await agent.initialize()
 
     messages = [
         {"role": "user", "content": "How do I read a file in Python?"}
@@ -131,18 +144,11 @@ async def system_prompt_example():
     print()
 
 
-async def event_types_example():
+async def event_types_example(agent: ChatAgent):
     """Example 5: Handling different event types in streaming."""
-    print("=" * 60)
+    print(_BAR)
     print("Example 5: Understanding Event Types")
-    print("=" * 60)
-
-    config = AgentConfig(
-        model="deepseek-chat",
-        temperature=0.7,
-    )
-    agent = ChatAgent(config)
-    await agent.initialize()
+    print(_BAR)
 
     messages = [
         {"role": "user", "content": "Calculate 15 * 23"}
@@ -151,52 +157,41 @@ async def event_types_example():
     print("User: Calculate 15 * 23")
     print("Events:")
 
+    out = TokenWriter()
     async for event in agent.stream(messages, show_thinking=True):
-        event_type = event["type"]
-        data = event["data"]
-
-        if event_type == "content":
-            # Regular text content from the model
-            print(f"  [CONTENT] {data['text']}")
-
-        elif event_type == "thinking":
-            # Model's thinking process (when show_thinking=True)
-            print(f"  [THINKING] {data['text']}")
-
-        elif event_type == "tool_call":
-            # Tool being called
-            print(f"  [TOOL_CALL] {data['tool']}({data['input']})")
-
-        elif event_type == "tool_result":
-            # Result from tool execution
-            print(f"  [TOOL_RESULT] {data['result']}")
-
-        elif event_type == "error":
-            # Error occurred
-            print(f"  [ERROR] {data['message']}")
+        line = EVENT_FORMATS.get(event["type"])
+        if line is not None:
+            out.write(line.format(**event["data"]))
+    out.flush()
 
     print()
 
 
-async def temperature_comparison_example():
+async def temperature_comparison_example(agent: ChatAgent):
     """Example 6: Comparing different temperature settings."""
-    print("=" * 60)
+    print(_BAR)
     print("Example 6: Temperature Comparison")
-    print("=" * 60)
+    print(_BAR)
 
     prompt = "Describe the color blue in one creative sentence."
+    temperatures = [0.0, 0.7, 1.5]
+    messages = [{"role": "user", "content": prompt}]
 
-    for temp in [0.0, 0.7, 1.5]:
-        config = AgentConfig(
-            model="deepseek-chat",
-            temperature=temp,
-        )
-        agent = ChatAgent(config)
-        await agent.initialize()
+    async def agent_for(temp: float) -> ChatAgent:
+        # Temperature is fixed when the model is bound, so other settings
+        # need their own agent; the shared agent already uses 0.7
+        if temp == agent.config.temperature:
+            return agent
+        return await create_agent(temperature=temp)
+
+    async def ask(temp: float) -> str:
+        temp_agent = await agent_for(temp)
+        return await temp_agent.invoke(messages)
 
-        messages = [{"role": "user", "content": prompt}]
-        response = await agent.invoke(messages)
+    # The calls are independent, so send them all at once
+    responses = await asyncio.gather(*(ask(temp) for temp in temperatures))
 
+    for temp, response in zip(temperatures, responses):
         print(f"Temperature {temp}: {response}")
 
     print()
@@ -204,19 +199,29 @@ async def temperature_comparison_example():
 
 async def main():
     """Run all basic usage examples."""
+    global http_client
     print("\n")
-    print("*" * 60)
+    print(_STAR)
     print("Chat Shell 101 - Basic Usage Examples")
-    print("*" * 60)
+    print(_STAR)
     print("\n")
 
+    http_client = httpx.AsyncClient(limits=httpx.Limits(max_keepalive_connections=20))
+
     try:
-        await basic_invoke_example()
-        await streaming_example()
-        await multi_turn_conversation_example()
-        await system_prompt_example()
-        await event_types_example()
-        await temperature_comparison_example()
+        # One initialized agent is shared by every example that uses the
+        # default settings
+        agent = await create_agent()
+
+        # The examples are independent, so their LLM calls can overlap
+        await gather_in_order(
+            basic_invoke_example(agent),
+            streaming_example(agent),
+            multi_turn_conversation_example(agent),
+            system_prompt_example(),
+            event_types_example(agent),
+            temperature_comparison_example(agent),
+        )
 
     except Exception as e:
         print(f"Error running examples: {e}")
@@ -225,9 +230,12 @@ async def main():
         print("  2. Set your OPENAI_API_KEY in the .env file")
         raise
 
-    print("*" * 60)
+    finally:
+        await http_client.aclose()
+
+    print(_STAR)
     print("All examples completed!")
-    print("*" * 60)
+    print(_STAR)
 
 
 if __name__ == "__main__":
@@ -18,21 +18,21 @@ load_dotenv()
 from chat_shell_101.agent.agent import ChatAgent
 from chat_shell_101.agent.config import AgentConfig
 from chat_shell_101.tools.registry import tool_registry
-from chat_shell_101.tools.calculator import CalculatorTool
+from chat_shell_101.tools.calculator import CalculatorInput, CalculatorTool
 
+from _concurrent import enable_eager_tasks, gather_in_order
+from _stream_writer import TokenWriter
 
-async def calculator_basic_example():
+# Banner lines
+_BAR = "=" * 60
+_STAR = "*" * 60
+
+
+async def calculator_basic_example(agent: ChatAgent):
     """Example 1: Basic calculator usage through agent."""
-    print("=" * 60)
+    print(_BAR)
     print("Example 1: Calculator Tool - Basic Math")
-    print("=" * 60)
-
-    config = AgentConfig(
-        model="deepseek-chat",
-        temperature=0.7,
-    )
-    agent = ChatAgent(config)
-    await agent.initialize()
+    print(_BAR)
 
     # The agent will automatically use the calculator tool for math
     messages = [
@@ -42,31 +42,28 @@ async def calculator_basic_example():
     print("User: What is 1234 * 5678?")
     print("Assistant: ", end="", flush=True)
 
+    formats = {
+        "content": "{text}",
+        "thinking": "\n[Thinking: {text}]\n",
+        "tool_call": "\n[Using calculator: {input}]\n",
+        "tool_result": "[Result: {result}]\n",
+    }
+
+    out = TokenWriter()
     async for event in agent.stream(messages, show_thinking=True):
-        if event["type"] == "content":
-            print(event["data"]["text"], end="", flush=True)
-        elif event["type"] == "thinking":
-            print(f"\n[Thinking: {event['data']['text']}]")
-        elif event["type"] == "tool_call":
-            print(f"\n[Using calculator: {event['data']['input']}]")
-        elif event["type"] == "tool_result":
-            print(f"[Result: {event['data']['result']}]")
+        line = formats.get(event["type"])
+        if line is not None:
+            out.write(line.format(**event["data"]))
+    out.flush()
 
     print("\n")
 
 
-async def calculator_complex_example():
+async def calculator_complex_example(agent: ChatAgent):
     """Example 2: Complex calculations with multiple steps."""
-    print("=" * 60)
+    print(_BAR)
     print("Example 2: Complex Multi-step Calculation")
-    print("=" * 60)
-
-    config = AgentConfig(
-        model="deepseek-chat",
-        temperature=0.7,
-    )
-    agent = ChatAgent(config)
-    await agent.initialize()
+    print(_BAR)
 
     # Complex expression that requires multiple calculations
     messages = [
@@ -76,22 +73,27 @@ async def calculator_complex_example():
     print("User: Calculate (150 + 230) * 12 - 500 / 25")
     print("Assistant: ", end="", flush=True)
 
+    # Calls from one turn run concurrently, so match results to their
+    # call by id rather than by position
+    calls = {}
     async for event in agent.stream(messages, show_thinking=True):
         if event["type"] == "content":
             print(event["data"]["text"], end="", flush=True)
         elif event["type"] == "tool_call":
+            calls[event["data"]["tool_call_id"]] = event["data"]["input"]
             print(f"\n[Tool: {event['data']['tool']}({event['data']['input']})]")
         elif event["type"] == "tool_result":
-            print(f"[Result: {event['data']['result']}]", end=" ")
+            call_input = calls.get(event["data"]["tool_call_id"])
+            print(f"[Result of {call_input}: {event['data']['result']}]", end=" ")
 
     print("\n")
 
 
 async def direct_calculator_example():
     """Example 3: Using calculator tool directly (without agent)."""
-    print("=" * 60)
+    print(_BAR)
     print("Example 3: Direct Calculator Tool Usage")
-    print("=" * 60)
+    print(_BAR)
 
     # Create calculator instance directly
     calculator = CalculatorTool()
@@ -107,11 +109,15 @@ async def direct_calculator_example():
         "(2 + 3) * 4",
     ]
 
-    for expr in expressions:
-        from chat_shell_101.tools.calculator import CalculatorInput
-        input_data = CalculatorInput(expression=expr)
-        result = await calculator.execute(input_data)
+    # The expressions are literals, so build the inputs without validation
+    results = await asyncio.gather(
+        *(
+            calculator.execute(CalculatorInput.model_construct(expression=expr))
+            for expr in expressions
+        )
+    )
 
+    for expr, result in zip(expressions, results):
         if result.error:
             print(f"  {expr} = ERROR: {result.error}")
         else:
@@ -122,9 +128,9 @@ async def direct_calculator_example():
 
 async def tool_registry_example():
     """Example 4: Exploring the tool registry."""
-    print("=" * 60)
+    print(_BAR)
     print("Example 4: Tool Registry")
-    print("=" * 60)
+    print(_BAR)
 
     # Get the global tool registry
     registry = tool_registry
@@ -149,18 +155,11 @@ async def tool_registry_example():
     print()
 
 
-async def math_vs_no_math_example():
+async def math_vs_no_math_example(agent: ChatAgent):
     """Example 5: Comparing math vs non-math queries."""
-    print("=" * 60)
+    print(_BAR)
     print("Example 5: When Does the Agent Use Tools?")
-    print("=" * 60)
-
-    config = AgentConfig(
-        model="deepseek-chat",
-        temperature=0.7,
-    )
-    agent = ChatAgent(config)
-    await agent.initialize()
+    print(_BAR)
 
     queries = [
         "What is 999 * 888?",  # Should use calculator
@@ -169,19 +168,24 @@ async def math_vs_no_math_example():
         "What is the capital of France?",    # Should not use calculator
     ]
 
-    for query in queries:
-        print(f"\nQuery: {query}")
+    async def run_query(query: str) -> list:
+        """Stream one query and return the names of the tools it used."""
         messages = [{"role": "user", "content": query}]
 
-        tool_used = False
+        tools_used = []
         async for event in agent.stream(messages):
             if event["type"] == "tool_call":
-                tool_used = True
-                print(f"  -> Tool used: {event['data']['tool']}")
-            elif event["type"] == "content":
-                pass  # Collecting response
+                tools_used.append(event["data"]["tool"])
+        return tools_used
 
-        if not tool_used:
+    # The queries are independent, so stream them all at once
+    results = await asyncio.gather(*(run_query(query) for query in queries))
+
+    for query, tools_used in zip(queries, results):
+        print(f"\nQuery: {query}")
+        for tool in tools_used:
+            print(f"  -> Tool used: {tool}")
+        if not tools_used:
             print("  -> No tool used (direct LLM response)")
 
     print()
@@ -189,9 +193,9 @@ async def math_vs_no_math_example():
 
 async def calculator_edge_cases_example():
     """Example 6: Calculator edge cases and error handling."""
-    print("=" * 60)
+    print(_BAR)
     print("Example 6: Calculator Edge Cases")
-    print("=" * 60)
+    print(_BAR)
 
     calculator = CalculatorTool()
 
@@ -207,11 +211,14 @@ async def calculator_edge_cases_example():
         ("Modulo", "17 % 5"),
     ]
 
-    for description, expr in test_cases:
-        from chat_shell_101.tools.calculator import CalculatorInput
-        input_data = CalculatorInput(expression=expr)
-        result = await calculator.execute(input_data)
+    results = await asyncio.gather(
+        *(
+            calculator.execute(CalculatorInput.model_construct(expression=expr))
+            for _, expr in test_cases
+        )
+    )
 
+    for (description, expr), result in zip(test_cases, results):
         status = "✓" if not result.error else "✗"
         print(f"  {status} {description}: {expr}")
         if result.error:
@@ -225,18 +232,29 @@ async def calculator_edge_cases_example():
 async def main():
     """Run all tool examples."""
     print("\n")
-    print("*" * 60)
+    print(_STAR)
     print("Chat Shell 101 - Tools and Calculator Examples")
-    print("*" * 60)
+    print(_STAR)
     print("\n")
 
+    # Direct tool calls finish without waiting, so let their tasks complete
+    # as soon as they are created
+    enable_eager_tasks()
+
     try:
-        await calculator_basic_example()
-        await calculator_complex_example()
-        await direct_calculator_example()
-        await tool_registry_example()
-        await math_vs_no_math_example()
-        await calculator_edge_cases_example()
+        # One initialized agent is shared by every agent-based example
+        agent = ChatAgent(AgentConfig(model="deepseek-chat", temperature=0.7))
+        await agent.initialize()
+
+        # The examples are independent, so their LLM calls can overlap
+        await gather_in_order(
+            calculator_basic_example(agent),
+            calculator_complex_example(agent),
+            direct_calculator_example(),
+            tool_registry_example(),
+            math_vs_no_math_example(agent),
+            calculator_edge_cases_example(),
+        )
 
     except Exception as e:
         print(f"Error running examples: {e}")
@@ -245,9 +263,9 @@ async def main():
         print("  2. Set your OPENAI_API_KEY in the .env file")
         raise
 
-    print("*" * 60)
+    print(_STAR)
     print("All examples completed!")
-    print("*" * 60)
+    print(_STAR)
 
 
 if __name__ == "__main__":
@@ -12,6 +12,11 @@ Prerequisites:
 import asyncio
 import tempfile
 import shutil
+import statistics
+import time
+from collections import deque
+from pathlib import Path
+from typing import List, Optional
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -22,12 +27,85 @@ from chat_shell_101.storage.interfaces import Message
 from chat_shell_101.agent.agent import ChatAgent
 from chat_shell_101.agent.config import AgentConfig
 
+from _concurrent import enable_eager_tasks, gather_in_order
+
+# Banner lines
+_BAR = "=" * 60
+_STAR = "*" * 60
+
+# Most recent messages sent to the model verbatim as conversation context
+MAX_CONTEXT_MESSAGES = 20
+
+# Repetitions of each backend's workload in the storage comparison
+BENCH_RUNS = 5
+
+SUMMARY_PROMPT = (
+    "Summarize the conversation below in a few sentences, keeping names, "
+    "numbers and decisions. Fold in the earlier summary if one is given."
+)
+
+
+class SummaryBuffer:
+    """Conversation context as a rolling summary plus the most recent messages.
+
+    Messages pushed out of ``recent`` are folded into ``summary`` by a
+    background LLM call, so the prompt stays bounded however long the
+    conversation runs. ``recent`` holds messages already in the agent's
+    dict format, so each is converted once rather than on every turn.
+    """
+
+    def __init__(self, agent: ChatAgent, max_recent: int = MAX_CONTEXT_MESSAGES):
+        self.agent = agent
+        self.summary = ""
+        self.recent: deque = deque(maxlen=max_recent)
+        self._evicted: List[dict] = []
+        self._summarizing: Optional[asyncio.Task] = None
+
+    def extend(self, messages: List[Message]) -> None:
+        """Add messages, scheduling a summary update for any evicted ones."""
+        for msg in messages:
+            if len(self.recent) == self.recent.maxlen:
+                self._evicted.append(self.recent[0])
+            self.recent.append({"role": msg.role, "content": msg.content})
+
+        if self._evicted and (self._summarizing is None or self._summarizing.done()):
+            self._summarizing = asyncio.create_task(self._summarize())
+
+    async def _summarize(self) -> None:
+        # Loop so messages evicted while a call is in flight are not lost
+        while self._evicted:
+            evicted, self._evicted = self._evicted, []
+            transcript = "\n".join(f"{msg['role']}: {msg['content']}" for msg in evicted)
+            if self.summary:
+                transcript = f"Earlier summary: {self.summary}\n\n{transcript}"
+            self.summary = await self.agent.invoke([
+                {"role": "system", "content": SUMMARY_PROMPT},
+                {"role": "user", "content": transcript},
+            ])
+
+    def to_prompt(self, user_input: str) -> List[dict]:
+        """Build ``[system + summary, *recent, user_input]`` for the agent."""
+        system_prompt = self.agent.config.system_prompt
+        if self.summary:
+            system_prompt += f"\n\nSummary of the earlier conversation: {self.summary}"
+
+        return [
+            {"role": "system", "content": system_prompt},
+            *self.recent,
+            {"role": "user", "content": user_input},
+        ]
+
+    async def aclose(self) -> None:
+        """Wait for any in-flight summary update."""
+        if self._summarizing is not None:
+            await self._summarizing
+
 
 async def memory_storage_example():
     """Example 1: In-memory storage (non-persistent)."""
-    print("=" * 60)
+    print(_BAR)
     print("Example 1: Memory Storage (Non-persistent)")
-    print("=" * 60)
+    print(_BAR)
 
     # Create memory storage
     storage = MemoryStorage()
@@ -62,12 +140,12 @@ async def memory_storage_example():
 
 async def json_storage_example():
     """Example 2: JSON file storage (persistent)."""
-    print("=" * 60)
+    print(_BAR)
     print("Example 2: JSON File Storage (Persistent)")
-    print("=" * 60)
+    print(_BAR)
 
     # Create temporary directory for storage
-    temp_dir = tempfile.mkdtemp()
+    temp_dir = Path(tempfile.mkdtemp())
     print(f"Storage path: {temp_dir}")
 
     try:
@@ -114,13 +192,13 @@ async def json_storage_example():
 
 async def sqlite_storage_example():
     """Example 3: SQLite storage (persistent with query capabilities)."""
-    print("=" * 60)
+    print(_BAR)
     print("Example 3: SQLite Storage (Persistent + Queryable)")
-    print("=" * 60)
+    print(_BAR)
 
     # Create temporary database
-    temp_dir = tempfile.mkdtemp()
-    db_path = os.path.join(temp_dir, "chat.db")
+    temp_dir = Path(tempfile.mkdtemp())
+    db_path = temp_dir / "chat.db"
     print(f"Database path: {db_path}")
 
     try:
@@ -175,55 +253,68 @@ async def sqlite_storage_example():
 
 async def storage_with_agent_example():
     """Example 4: Using storage with agent for persistent conversations."""
-    print("=" * 60)
+    print(_BAR)
     print("Example 4: Storage + Agent Integration")
-    print("=" * 60)
+    print(_BAR)
 
     # Create temporary storage
-    temp_dir = tempfile.mkdtemp()
+    temp_dir = Path(tempfile.mkdtemp())
 
     try:
         storage = JSONStorage(storage_path=temp_dir)
-        await storage.initialize()
 
         session_id = "agent-session"
 
         # Simulate a conversation
         config = AgentConfig(model="deepseek-chat", temperature=0.7)
         agent = ChatAgent(config)
-        await agent.initialize()
+
+        # Storage and agent setup are independent, so run them together
+        await asyncio.gather(storage.initialize(), agent.initialize())
+
+        # Prompt context: a summary of older turns plus the most recent
+        # messages, kept in memory so later turns don't re-read storage
+        context = SummaryBuffer(agent)
+        context.extend(
+            await storage.history.get_history(session_id, limit=MAX_CONTEXT_MESSAGES)
+        )
 
         # First user message
         user_input = "What is 2 + 2?"
-        messages = [{"role": "user", "content": user_input}]
+        messages = context.to_prompt(user_input)
 
         print(f"User: {user_input}")
         response = await agent.invoke(messages)
         print(f"Assistant: {response}")
 
-        # Save to storage
-        await storage.history.append_messages(session_id, [
+        # Save to storage in the background; the next turn is built from
+        # the in-memory context, not re-read from storage
+        exchange = [
             Message(role="user", content=user_input),
             Message(role="assistant", content=response),
-        ])
+        ]
+        saving = asyncio.create_task(
+            storage.history.append_messages(session_id, exchange)
+        )
+        context.extend(exchange)
 
         # Second user message (with history)
         user_input2 = "Multiply that by 3"
-        history = await storage.history.get_history(session_id)
-        messages = []
-        for msg in history:
-            messages.append({"role": msg.role, "content": msg.content})
-        messages.append({"role": "user", "content": user_input2})
+        messages = context.to_prompt(user_input2)
 
         print(f"\nUser: {user_input2}")
         response2 = await agent.invoke(messages)
         print(f"Assistant: {response2}")
 
-        # Save second exchange
-        await storage.history.append_messages(session_id, [
+        # Save second exchange, after the first has been written
+        await saving
+        exchange = [
             Message(role="user", content=user_input2),
             Message(role="assistant", content=response2),
-        ])
+        ]
+        await storage.history.append_messages(session_id, exchange)
+        context.extend(exchange)
+        await context.aclose()
 
         # Show final history
         final_history = await storage.history.get_history(session_id)
@@ -241,25 +332,27 @@ async def storage_with_agent_example():
 
 async def storage_comparison_example():
     """Example 5: Comparing storage backends."""
-    print("=" * 60)
+    print(_BAR)
     print("Example 5: Storage Backend Comparison")
-    print("=" * 60)
+    print(_BAR)
 
-    temp_dir = tempfile.mkdtemp()
+    temp_dir = Path(tempfile.mkdtemp())
 
     try:
         # Test all three storage types
         storages = {
             "Memory": MemoryStorage(),
-            "JSON": JSONStorage(storage_path=temp_dir / Path("json_test")),
-            "SQLite": SQLiteStorage(db_path=temp_dir / Path("test.db")),
+            "JSON": JSONStorage(storage_path=temp_dir / "json_test"),
+            "SQLite": SQLiteStorage(db_path=temp_dir / "test.db"),
         }
 
-        for name, storage in storages.items():
-            await storage.initialize()
+        async def bench_one(storage) -> tuple:
+            """Store and read back test messages, returning (history, elapsed_ns).
 
+            The workload runs BENCH_RUNS times, each on a fresh session, and
+            the median time is reported to smooth out first-touch noise.
+            """
             # Add test messages
-            session_id = "comparison-test"
             messages = [
                 Message(role="user", content="Test message 1"),
                 Message(role="assistant", content="Test response 1"),
@@ -267,11 +360,28 @@ async def storage_comparison_example():
                 Message(role="assistant", content="Test response 2"),
             ]
 
-            start = asyncio.get_event_loop().time()
-            await storage.history.append_messages(session_id, messages)
-            history = await storage.history.get_history(session_id)
-            elapsed = asyncio.get_event_loop().time() - start
-
+            timings = []
+            for run in range(BENCH_RUNS):
+                session_id = f"comparison-test-{run}"
+                start = time.perf_counter_ns()
+                await storage.history.append_messages(session_id, messages)
+                history = await storage.history.get_history(session_id)
+                timings.append(time.perf_counter_ns() - start)
+            return history, statistics.median(timings)
+
+        # The backends use separate files, so they can be set up together
+        await asyncio.gather(*(storage.initialize() for storage in storages.values()))
+
+        # The timed loops run one after another, so no backend's timing
+        # includes time spent waiting on the others
+        results = []
+        try:
+            for storage in storages.values():
+                results.append(await bench_one(storage))
+        finally:
+            await asyncio.gather(*(storage.close() for storage in storages.values()))
+
+        for (name, storage), (history, elapsed_ns) in zip(storages.items(), results):
             # Check features
             has_list_sessions = hasattr(storage.history, "list_sessions")
 
@@ -279,9 +389,7 @@ async def storage_comparison_example():
             print(f"  - Persistent: {name != 'Memory'}")
             print(f"  - List sessions: {has_list_sessions}")
             print(f"  - Messages stored: {len(history)}")
-            print(f"  - Operation time: {elapsed:.4f}s")
-
-            await storage.close()
+            print(f"  - Operation time: {elapsed_ns / 1e6:.3f} ms (median of {BENCH_RUNS})")
 
     finally:
         shutil.rmtree(temp_dir)
@@ -291,9 +399,9 @@ async def storage_comparison_example():
 
 async def message_format_example():
     """Example 6: Understanding message format and timestamps."""
-    print("=" * 60)
+    print(_BAR)
     print("Example 6: Message Format and Metadata")
-    print("=" * 60)
+    print(_BAR)
 
     storage = MemoryStorage()
     await storage.initialize()
@@ -323,32 +431,36 @@ async def message_format_example():
     await storage.close()
 
 
-from pathlib import Path
-
-
 async def main():
     """Run all storage examples."""
     print("\n")
-    print("*" * 60)
+    print(_STAR)
     print("Chat Shell 101 - Storage Backends Examples")
-    print("*" * 60)
+    print(_STAR)
     print("\n")
 
+    # Memory storage calls finish without waiting, so let their tasks
+    # complete as soon as they are created
+    enable_eager_tasks()
+
     try:
-        await memory_storage_example()
-        await json_storage_example()
-        await sqlite_storage_example()
-        await storage_with_agent_example()
-        await storage_comparison_example()
-        await message_format_example()
+        # Each example uses its own storage, so they can run together
+        await gather_in_order(
+            memory_storage_example(),
+            json_storage_example(),
+            sqlite_storage_example(),
+            storage_with_agent_example(),
+            storage_comparison_example(),
+            message_format_example(),
+        )
 
     except Exception as e:
         print(f"Error running examples: {e}")
         raise
 
-    print("*" * 60)
+    print(_STAR)
     print("All examples completed!")
-    print("*" * 60)
+    print(_STAR)
 
 
 if __name__ == "__main__":
@@ -12,19 +12,27 @@ Prerequisites:
 import asyncio
 import random
 from datetime import datetime
-from typing import List
+from collections import deque
+from operator import methodcaller
+from typing import Deque, List
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from chat_shell_101.agent.agent import ChatAgent
 from chat_shell_101.agent.config import AgentConfig
 from chat_shell_101.tools.base import BaseTool, ToolInput, ToolOutput
 from chat_shell_101.tools.registry import tool_registry
 
+from _stream_writer import TokenWriter
+
+# Banner lines
+_BAR = "=" * 60
+_STAR = "*" * 60
+
 
 # ============================================================================
 # Example 1: Simple Custom Tool - Dice Roller
@@ -53,7 +61,11 @@ class DiceRollerTool(BaseTool):
             if input_data.count > 100:
                 return ToolOutput(result="", error="Cannot roll more than 100 dice at once")
 
-            rolls = [random.randint(1, input_data.sides) for _ in range(input_data.count)]
+            # Uses the shared global RNG, so rolls are not reproducible.
+            # choices() draws all dice in one call, avoiding randint()'s
+            # per-roll overhead.
+            faces = range(1, input_data.sides + 1)
+            rolls = random.choices(faces, k=input_data.count)
             total = sum(rolls)
 
             if input_data.count == 1:
@@ -90,12 +102,14 @@ class WeatherSimulatorTool(BaseTool):
     async def execute(self, input_data: WeatherInput) -> ToolOutput:
         """Generate simulated weather data."""
         try:
-            # Use city name to generate consistent "random" weather
-            random.seed(input_data.city.lower())
+            # Use city name to generate consistent "random" weather. A local
+            # generator leaves the global RNG alone, so concurrent calls for
+            # different cities don't disturb each other.
+            rng = random.Random(input_data.city.lower())
 
-            temp = random.randint(-10, 35)
-            condition = random.choice(self._conditions)
-            humidity = random.randint(30, 90)
+            temp = rng.randint(-10, 35)
+            condition = rng.choice(self._conditions)
+            humidity = rng.randint(30, 90)
 
             result = f"Weather in {input_data.city}:\n"
             result += f"  Temperature: {temp}°C\n"
@@ -105,13 +119,10 @@ class WeatherSimulatorTool(BaseTool):
             if input_data.include_forecast:
                 result += "\n\n3-Day Forecast:\n"
                 for day in range(1, 4):
-                    day_temp = temp + random.randint(-5, 5)
-                    day_condition = random.choice(self._conditions)
+                    day_temp = temp + rng.randint(-5, 5)
+                    day_condition = rng.choice(self._conditions)
                     result += f"  Day {day}: {day_condition}, {day_temp}°C\n"
 
-            # Reset random seed
-            random.seed()
-
             return ToolOutput(result=result)
 
         except Exception as e:
@@ -122,6 +133,12 @@ class WeatherSimulatorTool(BaseTool):
 # Example 3: Tool with List Output - Task Manager
 # ============================================================================
 
+class FixedToolOutput(ToolOutput):
+    """A ToolOutput that can't be modified, so one instance can be shared."""
+
+    model_config = ConfigDict(frozen=True)
+
+
 class TaskManagerInput(ToolInput):
     """Input for task manager tool."""
     action: str = Field(..., description="Action: 'add', 'list', or 'clear'")
@@ -129,36 +146,67 @@ class TaskManagerInput(ToolInput):
 
 
 class TaskManagerTool(BaseTool):
-    """Simple in-memory task manager."""
+    """Simple in-memory task manager holding one session's task list.
+
+    The list belongs to the tool instance rather than being selected by the
+    model's input, so a conversation can't reach another session's tasks.
+    Create one instance per session.
+    """
 
     name = "task_manager"
     description = "Manage a todo list. Actions: add (add a task), list (show all tasks), clear (remove all tasks)."
     input_schema = TaskManagerInput
 
-    # Class-level storage (persists during session)
-    _tasks: List[str] = []
+    # The oldest tasks are dropped beyond MAX_TASKS so the list can't grow
+    # without bound
+    MAX_TASKS = 100
+
+    # Fixed outputs are built once and shared; they are frozen, so a caller
+    # that modifies a result can't change it for later calls
+    _NO_TASKS = FixedToolOutput(result="No tasks in the list.")
+    _MISSING_TASK = FixedToolOutput(result="", error="Task description required for 'add' action")
+
+    def __init__(self):
+        # The task list and its numbered 'list' lines. The lines grow with
+        # each add, so listing never re-enumerates. execute() never awaits,
+        # so each call's updates are atomic on the event loop and need no lock.
+        self._tasks: Deque[str] = deque(maxlen=self.MAX_TASKS)
+        self._lines: List[str] = []
 
     async def execute(self, input_data: TaskManagerInput) -> ToolOutput:
         """Execute task management action."""
         try:
             action = input_data.action.lower()
+            tasks = self._tasks
 
             if action == "add":
                 if not input_data.task:
-                    return ToolOutput(result="", error="Task description required for 'add' action")
-                self._tasks.append(input_data.task)
-                return ToolOutput(result=f"Added task: '{input_data.task}'. Total tasks: {len(self._tasks)}")
+                    return self._MISSING_TASK
+                if len(tasks) == self.MAX_TASKS:
+                    # The oldest task drops off and every number shifts
+                    tasks.append(input_data.task)
+                    self._lines = [f"  {i}. {task}" for i, task in enumerate(tasks, 1)]
+                else:
+                    tasks.append(input_data.task)
+                    self._lines.append(f"  {len(tasks)}. {input_data.task}")
+                # The values are known-good, so skip pydantic validation
+                return ToolOutput.model_construct(
+                    result=f"Added task: '{input_data.task}'. Total tasks: {len(tasks)}"
+                )
 
             elif action == "list":
-                if not self._tasks:
-                    return ToolOutput(result="No tasks in the list.")
-                task_list = "\n".join([f"  {i+1}. {task}" for i, task in enumerate(self._tasks)])
-                return ToolOutput(result=f"Tasks ({len(self._tasks)}):\n{task_list}")
+                if not tasks:
+                    return self._NO_TASKS
+                lines = "\n".join(self._lines)
+                return ToolOutput.model_construct(
+                    result=f"Tasks ({len(tasks)}):\n{lines}"
+                )
 
             elif action == "clear":
-                count = len(self._tasks)
-                self._tasks.clear()
-                return ToolOutput(result=f"Cleared {count} tasks.")
+                count = len(tasks)
+                tasks.clear()
+                self._lines = []
+                return ToolOutput.model_construct(result=f"Cleared {count} tasks.")
 
             else:
                 return ToolOutput(result="", error=f"Unknown action: {action}. Use 'add', 'list', or 'clear'.")
@@ -176,6 +224,18 @@ class TimeToolInput(ToolInput):
     format: str = Field(default="full", description="Format: 'full', 'time', 'date', or 'iso'")
 
 
+# Formatter per requested format. Purely numeric layouts use isoformat(),
+# which builds the string directly instead of parsing a strftime pattern.
+_TIME_FORMATS = {
+    "full": methodcaller("strftime", "%A, %B %d, %Y at %I:%M:%S %p"),
+    "time": methodcaller("strftime", "%I:%M:%S %p"),
+    "date": methodcaller("strftime", "%A, %B %d, %Y"),
+    "iso": methodcaller("isoformat"),
+}
+# Same as strftime("%Y-%m-%d %H:%M:%S")
+_DEFAULT_TIME_FORMAT = methodcaller("isoformat", sep=" ", timespec="seconds")
+
+
 class TimeTool(BaseTool):
     """Get current time and date."""
 
@@ -187,20 +247,11 @@ class TimeTool(BaseTool):
         """Return current time in requested format."""
         try:
             now = datetime.now()
-            fmt = input_data.format.lower()
-
-            if fmt == "full":
-                result = now.strftime("%A, %B %d, %Y at %I:%M:%S %p")
-            elif fmt == "time":
-                result = now.strftime("%I:%M:%S %p")
-            elif fmt == "date":
-                result = now.strftime("%A, %B %d, %Y")
-            elif fmt == "iso":
-                result = now.isoformat()
-            else:
-                result = now.strftime("%Y-%m-%d %H:%M:%S")
+            formatter = _TIME_FORMATS.get(input_data.format.lower(), _DEFAULT_TIME_FORMAT)
+            result = formatter(now)
 
-            return ToolOutput(result=result)
+            # The result is always a str, so skip pydantic validation
+            return ToolOutput.model_construct(result=result)
 
         except Exception as e:
             return ToolOutput(result="", error=str(e))
@@ -212,9 +263,9 @@ class TimeTool(BaseTool):
 
 async def custom_tool_direct_usage():
     """Example 1: Using custom tools directly."""
-    print("=" * 60)
+    print(_BAR)
     print("Example 1: Direct Custom Tool Usage")
-    print("=" * 60)
+    print(_BAR)
 
     # Dice roller
     dice = DiceRollerTool()
@@ -236,9 +287,9 @@ async def custom_tool_direct_usage():
 
 async def custom_tool_with_agent():
     """Example 2: Using custom tools with the agent."""
-    print("=" * 60)
+    print(_BAR)
     print("Example 2: Custom Tools with Agent")
-    print("=" * 60)
+    print(_BAR)
 
     # Register custom tools
     tool_registry.register(DiceRollerTool())
@@ -258,27 +309,40 @@ async def custom_tool_with_agent():
         "What time is it now?",
     ]
 
-    for query in queries:
-        print(f"\nUser: {query}")
-        print("Assistant: ", end="", flush=True)
-
+    async def run_query(query: str) -> str:
+        """Stream one query and return the rendered reply."""
+        parts = []
         async for event in agent.stream([{"role": "user", "content": query}], show_thinking=True):
-            if event["type"] == "content":
-                print(event["data"]["text"], end="", flush=True)
-            elif event["type"] == "tool_call":
-                print(f"\n  [Calling: {event['data']['tool']}]")
-        print()
+            event_type, data = event["type"], event["data"]
+            if event_type == "content":
+                parts.append(data["text"])
+            elif event_type == "tool_call":
+                parts.append(f"\n  [Calling: {data['tool']}]\n")
+        return "".join(parts)
+
+    # The queries are independent, so stream them all at once; one failed
+    # request should not cancel the others
+    results = await asyncio.gather(
+        *(run_query(query) for query in queries), return_exceptions=True
+    )
+
+    for query, reply in zip(queries, results):
+        print(f"\nUser: {query}")
+        if isinstance(reply, Exception):
+            print(f"Assistant: [Error: {reply}]")
+        else:
+            print(f"Assistant: {reply}")
 
     print()
 
 
 async def task_manager_demo():
     """Example 3: Task manager with state."""
-    print("=" * 60)
+    print(_BAR)
     print("Example 3: Stateful Task Manager Tool")
-    print("=" * 60)
+    print(_BAR)
 
-    # Register task manager
+    # Register a task manager; its list belongs to this demo's session
     tool_registry.register(TaskManagerTool())
 
     config = AgentConfig(
@@ -300,9 +364,11 @@ async def task_manager_demo():
         print(f"\nUser: {user_input}")
         print("Assistant: ", end="", flush=True)
 
+        out = TokenWriter()
         async for event in agent.stream([{"role": "user", "content": user_input}]):
             if event["type"] == "content":
-                print(event["data"]["text"], end="", flush=True)
+                out.write(event["data"]["text"])
+        out.flush()
         print()
 
     print()
@@ -310,9 +376,9 @@ async def task_manager_demo():
 
 async def tool_registration_patterns():
     """Example 4: Different ways to register tools."""
-    print("=" * 60)
+    print(_BAR)
     print("Example 4: Tool Registration Patterns")
-    print("=" * 60)
+    print(_BAR)
 
     # Pattern 1: Direct registration
     tool_registry.register(DiceRollerTool())
@@ -347,9 +413,9 @@ async def tool_registration_patterns():
 
 async def error_handling_example():
     """Example 5: Tool error handling."""
-    print("=" * 60)
+    print(_BAR)
     print("Example 5: Tool Error Handling")
-    print("=" * 60)
+    print(_BAR)
 
     dice = DiceRollerTool()
 
@@ -366,15 +432,19 @@ async def error_handling_example():
         (DiceRollerInput(sides=6, count=200), "Too many dice"),
     ]
 
+    # The calls are independent, so run them all at once
+    valid_results, invalid_results = await asyncio.gather(
+        asyncio.gather(*(dice.execute(inp) for inp in valid_inputs)),
+        asyncio.gather(*(dice.execute(inp) for inp, _ in invalid_inputs)),
+    )
+
     print("Valid inputs:")
-    for inp in valid_inputs:
-        result = await dice.execute(inp)
+    for inp, result in zip(valid_inputs, valid_results):
         status = "✓" if not result.error else "✗"
         print(f"  {status} {inp.count}d{inp.sides}: {result.result or result.error}")
 
     print("\nInvalid inputs:")
-    for inp, description in invalid_inputs:
-        result = await dice.execute(inp)
+    for (inp, description), result in zip(invalid_inputs, invalid_results):
         status = "✓" if result.error else "✗"
         print(f"  {status} {description}: {result.error or result.result}")
 
@@ -384,9 +454,9 @@ async def error_handling_example():
 async def main():
     """Run all custom tool examples."""
     print("\n")
-    print("*" * 60)
+    print(_STAR)
     print("Chat Shell 101 - Custom Tools Examples")
-    print("*" * 60)
+    print(_STAR)
     print("\n")
 
     try:
@@ -398,13 +468,11 @@ async def main():
 
     except Exception as e:
         print(f"Error running examples: {e}")
-        import traceback
-        traceback.print_exc()
         raise
 
-    print("*" * 60)
+    print(_STAR)
     print("All examples completed!")
-    print("*" * 60)
+    print(_STAR)
 
 
 if __name__ == "__main__":
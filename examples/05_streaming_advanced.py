@@ -10,6 +10,7 @@ Prerequisites:
 """
 
 import asyncio
+from collections import Counter
 from typing import Optional
 from dotenv import load_dotenv
 
@@ -19,6 +20,31 @@ load_dotenv()
 from chat_shell_101.agent.agent import ChatAgent
 from chat_shell_101.agent.config import AgentConfig
 
+from _concurrent import gather_in_order
+from _stream_writer import TokenWriter
+
+# Settings shared by every example; agents only read their config, so one
+# instance can back all of them
+_DEFAULT_CONFIG = AgentConfig(model="deepseek-chat", temperature=0.7)
+
+
+# The examples never change their agent, so they share a single agent that
+# is only initialized once; the lock keeps concurrent first uses from each
+# building their own
+_AGENT_CACHE: Optional[ChatAgent] = None
+_AGENT_LOCK = asyncio.Lock()
+
+
+async def _shared_agent() -> ChatAgent:
+    """Return the shared agent, creating and initializing it on first use."""
+    global _AGENT_CACHE
+    async with _AGENT_LOCK:
+        if _AGENT_CACHE is None:
+            agent = ChatAgent(_DEFAULT_CONFIG)
+            await agent.initialize()
+            _AGENT_CACHE = agent
+        return _AGENT_CACHE
+
 
 async def basic_event_streaming():
     """Example 1: Understanding all event types in streaming."""
@@ -26,12 +52,7 @@ async def basic_event_streaming():
     print("Example 1: Complete Event Type Breakdown")
     print("=" * 60)
 
-    config = AgentConfig(
-        model="deepseek-chat",
-        temperature=0.7,
-    )
-    agent = ChatAgent(config)
-    await agent.initialize()
+    agent = await _shared_agent()
 
     messages = [
         {"role": "user", "content": "Calculate 123 * 456 and explain the result"}
@@ -39,35 +60,45 @@ async def basic_event_streaming():
 
     print("Streaming events:\n")
 
-    event_counts = {}
+    # Each event's lines are written together and flushed in larger batches
+    out = TokenWriter(flush_on_newline=False)
+    event_counts = Counter()
     async for event in agent.stream(messages, show_thinking=True):
         event_type = event["type"]
-        event_counts[event_type] = event_counts.get(event_type, 0) + 1
+        event_counts[event_type] += 1
 
         # Display event details
         if event_type == "content":
-            print(f"[CONTENT] {event['data']['text']!r}")
+            line = f"[CONTENT] {event['data']['text']!r}\n"
 
         elif event_type == "thinking":
-            print(f"[THINKING] {event['data']['text']}")
+            line = f"[THINKING] {event['data']['text']}\n"
 
         elif event_type == "tool_call":
             data = event["data"]
-            print(f"[TOOL_CALL] {data['tool']}({data['input']})")
-            print(f"            call_id: {data['tool_call_id']}")
+            line = (
+                f"[TOOL_CALL] {data['tool']}({data['input']})\n"
+                f"            call_id: {data['tool_call_id']}\n"
+            )
 
         elif event_type == "tool_result":
             data = event['data']
-            print(f"[TOOL_RESULT] {data['tool']}: {data['result']}")
+            line = f"[TOOL_RESULT] {data['tool']}: {data['result']}\n"
 
         elif event_type == "error":
-            print(f"[ERROR] {event['data']}")
+            line = f"[ERROR] {event['data']}\n"
+
+        else:
+            line = ""
 
         # Show offset if present
         if "offset" in event:
-            print(f"        (offset: {event['offset']})")
+            line += f"        (offset: {event['offset']})\n"
 
-    print(f"\nEvent summary: {event_counts}")
+        out.write(line)
+    out.flush()
+
+    print(f"\nEvent summary: {dict(event_counts)}")
     print()
 
 
@@ -77,12 +108,7 @@ async def streaming_with_cancellation():
     print("Example 2: Stream Cancellation")
     print("=" * 60)
 
-    config = AgentConfig(
-        model="deepseek-chat",
-        temperature=0.7,
-    )
-    agent = ChatAgent(config)
-    await agent.initialize()
+    agent = await _shared_agent()
 
     # Create cancellation event
     cancellation_event = asyncio.Event()
@@ -100,23 +126,27 @@ async def streaming_with_cancellation():
         print("\n[Cancelling...]")
         cancellation_event.set()
 
-    # Run stream and cancellation together
-    cancel_task = asyncio.create_task(cancel_after_delay())
-
+    # Run stream and cancellation together; the task group makes sure the
+    # timer never outlives the example
     try:
-        async for event in agent.stream(
-            messages,
-            cancellation_event=cancellation_event
-        ):
-            if event["type"] == "content":
-                print(event["data"]["text"], end="", flush=True)
+        async with asyncio.TaskGroup() as tg:
+            timer = tg.create_task(cancel_after_delay())
+            try:
+                async for event in agent.stream(
+                    messages,
+                    cancellation_event=cancellation_event
+                ):
+                    if event["type"] == "content":
+                        print(event["data"]["text"], end="", flush=True)
+            except Exception as e:
+                print(f"\n[Error: {e}]")
+
+            # The stream ended before the timer fired
+            timer.cancel()
 
     except asyncio.CancelledError:
         print("\n[Stream was cancelled]")
-    except Exception as e:
-        print(f"\n[Error: {e}]")
 
-    await cancel_task
     print()
 
 
@@ -126,12 +156,7 @@ async def streaming_with_timeout():
     print("Example 3: Stream with Timeout")
     print("=" * 60)
 
-    config = AgentConfig(
-        model="deepseek-chat",
-        temperature=0.7,
-    )
-    agent = ChatAgent(config)
-    await agent.initialize()
+    agent = await _shared_agent()
 
     messages = [
         {"role": "user", "content": "Count from 1 to 100"}
@@ -140,13 +165,18 @@ async def streaming_with_timeout():
     print("Streaming with 2-second timeout...")
     print("Output: ", end="", flush=True)
 
+    # Tokens are batched into fewer stdout writes; whatever is buffered when
+    # the timeout hits is still shown
+    out = TokenWriter()
     try:
         async with asyncio.timeout(2.0):
             async for event in agent.stream(messages):
                 if event["type"] == "content":
-                    print(event["data"]["text"], end="", flush=True)
+                    out.write(event["data"]["text"])
+        out.flush()
 
     except asyncio.TimeoutError:
+        out.flush()
         print("\n[Timeout reached]")
 
     print("\n")
@@ -158,34 +188,30 @@ async def collecting_stream_results():
     print("Example 4: Collecting Stream Results")
     print("=" * 60)
 
-    config = AgentConfig(
-        model="deepseek-chat",
-        temperature=0.7,
-    )
-    agent = ChatAgent(config)
-    await agent.initialize()
+    agent = await _shared_agent()
 
     messages = [
         {"role": "user", "content": "What is 100 factorial?"}
     ]
 
-    # Collect all events
-    events = []
+    # Keep only what is reported below; the events themselves are not needed
+    n_events = 0
     content_parts = []
     tool_calls = []
 
     async for event in agent.stream(messages, show_thinking=True):
-        events.append(event)
+        n_events += 1
 
-        if event["type"] == "content":
-            content_parts.append(event["data"]["text"])
-        elif event["type"] == "tool_call":
-            tool_calls.append(event["data"])
+        event_type, data = event["type"], event["data"]
+        if event_type == "content":
+            content_parts.append(data["text"])
+        elif event_type == "tool_call":
+            tool_calls.append(data)
 
     # Process collected data
     full_response = "".join(content_parts)
 
-    print(f"Total events collected: {len(events)}")
+    print(f"Total events collected: {n_events}")
     print(f"Content pieces: {len(content_parts)}")
     print(f"Tool calls made: {len(tool_calls)}")
     print(f"\nFull response length: {len(full_response)} characters")
@@ -211,15 +237,12 @@ async def parallel_streaming():
         "What is 10 - 3?",
     ]
 
-    async def stream_query(query: str, query_id: int) -> str:
-        """Stream a single query and return the result."""
-        config = AgentConfig(
-            model="deepseek-chat",
-            temperature=0.7,
-        )
-        agent = ChatAgent(config)
-        await agent.initialize()
+    # An agent keeps no per-stream state, so all queries can stream through
+    # the shared one and its HTTP client at the same time
+    agent = await _shared_agent()
 
+    async def stream_query(query: str, query_id: int) -> str:
+        """Stream a single query on the shared agent and return the result."""
         messages = [{"role": "user", "content": query}]
         response_parts = []
 
@@ -251,32 +274,27 @@ async def progress_tracking_streaming():
     print("Example 6: Progress Tracking")
     print("=" * 60)
 
-    config = AgentConfig(
-        model="deepseek-chat",
-        temperature=0.7,
-    )
-    agent = ChatAgent(config)
-    await agent.initialize()
+    agent = await _shared_agent()
 
     messages = [
         {"role": "user", "content": "Write a haiku about programming"}
     ]
 
+    # Bind the clock once instead of looking up the loop on every event
+    now = asyncio.get_running_loop().time
+
     # Track progress
     stats = {
         "tokens_received": 0,
         "chars_received": 0,
         "tool_calls": 0,
-        "start_time": asyncio.get_event_loop().time(),
+        "start_time": now(),
     }
 
     print("Streaming with progress tracking...")
     print("-" * 40)
 
     async for event in agent.stream(messages):
-        current_time = asyncio.get_event_loop().time()
-        elapsed = current_time - stats["start_time"]
-
         if event["type"] == "content":
             text = event["data"]["text"]
             stats["tokens_received"] += 1  # Approximate
@@ -284,6 +302,7 @@ async def progress_tracking_streaming():
 
             # Show progress every 10 tokens (approximate)
             if stats["tokens_received"] % 10 == 0:
+                elapsed = now() - stats["start_time"]
                 print(f"\rProgress: {stats['tokens_received']} tokens, "
                       f"{stats['chars_received']} chars, "
                       f"{elapsed:.2f}s elapsed", end="")
@@ -291,7 +310,7 @@ async def progress_tracking_streaming():
         elif event["type"] == "tool_call":
             stats["tool_calls"] += 1
 
-    total_time = asyncio.get_event_loop().time() - stats["start_time"]
+    total_time = now() - stats["start_time"]
 
     print(f"\n\nFinal stats:")
     print(f"  Total tokens (approx): {stats['tokens_received']}")
@@ -309,12 +328,7 @@ async def error_recovery_streaming():
     print("Example 7: Error Handling in Streaming")
     print("=" * 60)
 
-    config = AgentConfig(
-        model="deepseek-chat",
-        temperature=0.7,
-    )
-    agent = ChatAgent(config)
-    await agent.initialize()
+    agent = await _shared_agent()
 
     messages = [
         {"role": "user", "content": "What is 500 / 0?"}  # Division by zero
@@ -326,13 +340,16 @@ async def error_recovery_streaming():
     error_occurred = False
     error_details = None
 
+    out = TokenWriter()
     async for event in agent.stream(messages, show_thinking=True):
-        if event["type"] == "content":
-            print(event["data"]["text"], end="", flush=True)
-        elif event["type"] == "error":
+        event_type, data = event["type"], event["data"]
+        if event_type == "content":
+            out.write(data["text"])
+        elif event_type == "error":
             error_occurred = True
-            error_details = event["data"]
-            print(f"\n[Error occurred: {error_details.get('error_code', 'UNKNOWN')}]")
+            error_details = data
+            out.write(f"\n[Error occurred: {error_details.get('error_code', 'UNKNOWN')}]\n")
+    out.flush()
 
     if error_occurred and error_details:
         print(f"\nError details: {error_details}")
@@ -346,12 +363,7 @@ async def interactive_streaming_demo():
     print("Example 8: Interactive Streaming Display")
     print("=" * 60)
 
-    config = AgentConfig(
-        model="deepseek-chat",
-        temperature=0.7,
-    )
-    agent = ChatAgent(config)
-    await agent.initialize()
+    agent = await _shared_agent()
 
     messages = [
         {"role": "user", "content": "List 5 interesting facts about space"}
@@ -365,7 +377,17 @@ async def interactive_streaming_demo():
     print("│" + " " * 58 + "│")
 
     line_width = 56
-    current_line = "│ "
+
+    # Words of the line being built and its width, so wrapping never
+    # rebuilds a growing string
+    line_words = []
+    line_len = 0
+
+    # Whole lines go out together, one write per finished line
+    out = TokenWriter()
+
+    def write_line() -> None:
+        out.write(f"│ {' '.join(line_words)}{' ' * (line_width - line_len)}│\n")
 
     async for event in agent.stream(messages):
         if event["type"] == "content":
@@ -373,27 +395,28 @@ async def interactive_streaming_demo():
             content_buffer.append(text)
 
             # Simple word wrap
-            words = text.split(" ")
-            for word in words:
-                if len(current_line) + len(word) + 1 > line_width + 2:
-                    # Pad and print current line
-                    padding = " " * (line_width + 2 - len(current_line))
-                    print(current_line + padding + "│")
-                    current_line = "│ " + word
-                else:
-                    current_line += " " + word if current_line != "│ " else word
+            for word in text.split(" "):
+                if line_len + len(word) + 1 > line_width:
+                    write_line()
+                    line_words = [word]
+                    line_len = len(word)
+                elif line_words:
+                    line_words.append(word)
+                    line_len += len(word) + 1
+                elif word:
+                    line_words = [word]
+                    line_len = len(word)
 
         elif event["type"] == "tool_call":
-            # Pad current line
-            padding = " " * (line_width + 2 - len(current_line))
-            print(current_line + padding + "│")
-            current_line = "│ "
-            print(f"│ [Tool: {event['data']['tool']}]" + " " * (line_width - len(event['data']['tool']) - 8) + "│")
+            write_line()
+            line_words = []
+            line_len = 0
+            out.write(f"│ [Tool: {event['data']['tool']}]" + " " * (line_width - len(event['data']['tool']) - 8) + "│\n")
 
     # Print final line
-    if current_line != "│ ":
-        padding = " " * (line_width + 2 - len(current_line))
-        print(current_line + padding + "│")
+    if line_words:
+        write_line()
+    out.flush()
 
     print("│" + " " * 58 + "│")
     print("└" + "─" * 58 + "┘")
@@ -411,19 +434,20 @@ async def main():
     print("\n")
 
     try:
-        await basic_event_streaming()
-        await streaming_with_cancellation()
-        await streaming_with_timeout()
-        await collecting_stream_results()
-        await parallel_streaming()
-        await progress_tracking_streaming()
-        await error_recovery_streaming()
-        await interactive_streaming_demo()
+        # The examples are independent, so their streams can overlap
+        await gather_in_order(
+            basic_event_streaming(),
+            streaming_with_cancellation(),
+            streaming_with_timeout(),
+            collecting_stream_results(),
+            parallel_streaming(),
+            progress_tracking_streaming(),
+            error_recovery_streaming(),
+            interactive_streaming_demo(),
+        )
 
     except Exception as e:
         print(f"Error running examples: {e}")
-        import traceback
-        traceback.print_exc()
         raise
 
     print("*" * 60)
@@ -13,16 +13,18 @@ import asyncio
 import json
 import os
 import tempfile
+from dataclasses import asdict, fields, replace
 from pathlib import Path
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
-from chat_shell_101.config import Config, OpenAIConfig, StorageConfig, load_config
-from chat_shell_101.agent.agent import ChatAgent
+from chat_shell_101.config import Config, OpenAIConfig, StorageConfig, config as global_config
 from chat_shell_101.agent.config import AgentConfig
 
+from _concurrent import enable_eager_tasks, gather_in_order
+
 
 async def environment_variables_example():
     """Example 1: Configuration via environment variables."""
@@ -40,8 +42,9 @@ async def environment_variables_example():
     #   CHAT_SHELL_SHOW_THINKING=true
     #   BASE_URL=https://api.deepseek.com
 
-    # Load config (reads from environment variables)
-    config = load_config()
+    # The package builds its config from the environment once, on import;
+    # reuse it rather than loading and validating it again
+    config = global_config
 
     print("Configuration loaded from environment (.env file or shell):")
     if config.openai.api_key:
@@ -110,29 +113,32 @@ async def agent_config_example():
     print("Example 3: Agent Configuration")
     print("=" * 60)
 
-    # Create various agent configurations
+    # Presets start from one base config and override only what differs.
+    # replace() passes the other field values on as-is, so list fields such
+    # as tools stay shared with the base unless a preset passes its own list.
+    base = AgentConfig(model="gpt-4")
     configs = {
-        "Creative Writer": AgentConfig(
-            model="gpt-4",
+        "Creative Writer": replace(
+            base,
             temperature=1.2,  # High creativity
             max_tokens=2000,
             system_prompt="You are a creative writer who loves metaphors."
         ),
-        "Code Assistant": AgentConfig(
-            model="gpt-4",
+        "Code Assistant": replace(
+            base,
             temperature=0.2,  # Low randomness for code
             max_tokens=1500,
             system_prompt="You are a precise coding assistant. Provide clean, efficient code."
         ),
-        "Math Tutor": AgentConfig(
-            model="gpt-4",
+        "Math Tutor": replace(
+            base,
             temperature=0.5,
             max_tokens=1000,
             system_prompt="You are a patient math tutor who explains step by step.",
             tools=["calculator"]  # Only use calculator tool
         ),
-        "Research Assistant": AgentConfig(
-            model="gpt-4",
+        "Research Assistant": replace(
+            base,
             temperature=0.7,
             max_tokens=4000,
             max_iterations=15,  # Allow more tool calls
@@ -141,16 +147,18 @@ async def agent_config_example():
         ),
     }
 
+    # Build the whole listing and print it in one write
+    lines = []
     for name, cfg in configs.items():
-        print(f"\n{name}:")
-        print(f"  Model: {cfg.model}")
-        print(f"  Temperature: {cfg.temperature}")
-        print(f"  Max Tokens: {cfg.max_tokens}")
-        print(f"  Max Iterations: {cfg.max_iterations}")
-        print(f"  Tools: {cfg.tools if cfg.tools else 'All'}")
-        print(f"  Context Compression: {cfg.compress_context}")
-
-    print()
+        lines.append(f"\n{name}:")
+        lines.append(f"  Model: {cfg.model}")
+        lines.append(f"  Temperature: {cfg.temperature}")
+        lines.append(f"  Max Tokens: {cfg.max_tokens}")
+        lines.append(f"  Max Iterations: {cfg.max_iterations}")
+        lines.append(f"  Tools: {cfg.tools if cfg.tools else 'All'}")
+        lines.append(f"  Context Compression: {cfg.compress_context}")
+    lines.append("")
+    print("\n".join(lines))
 
 
 async def config_validation_example():
@@ -207,14 +215,14 @@ async def config_file_example():
         "custom_setting": "custom_value"
     }
 
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(config_data, f, indent=2)
-        config_file = f.name
+    # The directory and the file in it are removed on exit, so there is no
+    # manual cleanup
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config_file = Path(tmp_dir) / "config.json"
+        config_file.write_text(json.dumps(config_data, indent=2))
 
-    try:
         # Read config from file
-        with open(config_file) as f:
-            loaded_config = json.load(f)
+        loaded_config = json.loads(config_file.read_text())
 
         print(f"Loaded config from {config_file}:")
         for key, value in loaded_config.items():
@@ -230,9 +238,6 @@ async def config_file_example():
         print(f"  Model: {agent_cfg.model}")
         print(f"  Temperature: {agent_cfg.temperature}")
 
-    finally:
-        os.unlink(config_file)
-
     print()
 
 
@@ -265,7 +270,7 @@ async def runtime_config_update():
 
     # Show that dataclass fields can be modified
     print("\nDataclass fields are mutable:")
-    print(f"  Fields: {list(config.__dict__.keys())}")
+    print(f"  Fields: {[f.name for f in fields(config)]}")
 
     print()
 
@@ -332,17 +337,8 @@ async def config_serialization_example():
         max_context_tokens=4000
     )
 
-    # Convert to dict
-    config_dict = {
-        "model": original.model,
-        "temperature": original.temperature,
-        "max_tokens": original.max_tokens,
-        "max_iterations": original.max_iterations,
-        "system_prompt": original.system_prompt,
-        "tools": original.tools,
-        "compress_context": original.compress_context,
-        "max_context_tokens": original.max_context_tokens,
-    }
+    # Convert to dict; asdict() covers every field, including defaults
+    config_dict = asdict(original)
 
     print("Serialized configuration:")
     print(json.dumps(config_dict, indent=2))
@@ -350,19 +346,17 @@ async def config_serialization_example():
     # Recreate from dict
     restored = AgentConfig(**config_dict)
 
-    print("\nRestored configuration:")
-    print(f"  Model: {restored.model}")
-    print(f"  Temperature: {restored.temperature}")
-    print(f"  Tools: {restored.tools}")
+    # Verify they match; dataclasses compare field by field
+    match = original == restored
 
-    # Verify they match
-    match = all(
-        getattr(original, field) == getattr(restored, field)
-        for field in config_dict.keys()
-    )
-    print(f"\nConfigurations match: {match}")
-
-    print()
+    print("\n".join([
+        "\nRestored configuration:",
+        f"  Model: {restored.model}",
+        f"  Temperature: {restored.temperature}",
+        f"  Tools: {restored.tools}",
+        f"\nConfigurations match: {match}",
+        "",
+    ]))
 
 
 async def main():
@@ -373,20 +367,26 @@ async def main():
     print("*" * 60)
     print("\n")
 
+    # None of the examples actually wait on anything, so let each one run to
+    # completion as soon as its task is created
+    enable_eager_tasks()
+
     try:
-        await environment_variables_example()
-        await programmatic_config_example()
-        await agent_config_example()
-        await config_validation_example()
-        await config_file_example()
-        await runtime_config_update()
-        await hierarchical_config_example()
-        await config_serialization_example()
+        # The examples share no state, so they can run together
+        await gather_in_order(
+            environment_variables_example(),
+            programmatic_config_example(),
+            agent_config_example(),
+            config_validation_example(),
+            config_file_example(),
+            runtime_config_update(),
+            hierarchical_config_example(),
+            config_serialization_example(),
+            limit=8,
+        )
 
     except Exception as e:
         print(f"Error running examples: {e}")
-        import traceback
-        traceback.print_exc()
         raise
 
     print("*" * 60)
@@ -16,23 +16,32 @@ Prerequisites:
 """
 
 import asyncio
+import importlib.util
 import json
 import argparse
 from typing import Optional
 from dataclasses import dataclass
 from dotenv import load_dotenv
 
+from chat_shell_101.utils import json_loads
+
 # Load environment variables from .env file
 load_dotenv()
 
-# Optional imports - only needed for actual API calls
-try:
-    import httpx
-    HAS_HTTPX = True
-except ImportError:
-    HAS_HTTPX = False
+# Optional imports - only needed for actual API calls. httpx and h2 are
+# only checked for here and imported when a real client is created, so
+# demo runs don't pay for loading them.
+HAS_HTTPX = importlib.util.find_spec("httpx") is not None
+if not HAS_HTTPX:
     print("Note: Install httpx to make actual API calls: pip install httpx")
 
+# HTTP/2 lets concurrent requests share one TLS connection; httpx needs h2 for it
+HAS_H2 = importlib.util.find_spec("h2") is not None
+
+# Upper bound on requests in flight at once, shared by the client's
+# connection pool and the batch example
+MAX_CONCURRENT_REQUESTS = 16
+
 
 @dataclass
 class ChatSession:
@@ -44,11 +53,24 @@ class ChatSession:
 class ChatAPIClient:
     """Client for the Chat Shell 101 HTTP API."""
 
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    def __init__(self, base_url: str = "http://localhost:8000", demo: bool = False):
         self.base_url = base_url.rstrip("/")
         self.client = None
-        if HAS_HTTPX:
-            self.client = httpx.AsyncClient(base_url=self.base_url, timeout=30.0)
+        if HAS_HTTPX and not demo:
+            import httpx
+
+            # Keep idle connections open between examples, so later requests
+            # skip the connection setup
+            self.client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=30.0,
+                http2=HAS_H2,
+                limits=httpx.Limits(
+                    max_keepalive_connections=MAX_CONCURRENT_REQUESTS,
+                    max_connections=MAX_CONCURRENT_REQUESTS,
+                    keepalive_expiry=60.0,
+                ),
+            )
 
     async def health_check(self) -> dict:
         """Check if the server is running."""
@@ -56,7 +78,7 @@ class ChatAPIClient:
             return {"status": "demo_mode", "message": "httpx not installed"}
 
         response = await self.client.get("/health")
-        return response.json()
+        return json_loads(response.content)
 
     async def chat(self, message: str, session_id: Optional[str] = None) -> dict:
         """Send a chat message and get response."""
@@ -68,7 +90,7 @@ class ChatAPIClient:
             payload["session_id"] = session_id
 
         response = await self.client.post("/chat", json=payload)
-        return response.json()
+        return json_loads(response.content)
 
     async def chat_stream(self, message: str, session_id: Optional[str] = None):
         """Send a chat message and stream the response."""
@@ -81,15 +103,25 @@ class ChatAPIClient:
             payload["session_id"] = session_id
 
         async with self.client.stream("POST", "/chat/stream", json=payload) as response:
-            async for line in response.aiter_lines():
-                if line.startswith("data: "):
-                    data = line[6:]  # Remove "data: " prefix
-                    if data == "[DONE]":
-                        break
-                    try:
-                        yield json.loads(data)
-                    except json.JSONDecodeError:
-                        pass
+            # Split the raw bytes into lines ourselves, so frames are never
+            # decoded to str before parsing
+            buffer = bytearray()
+            async for chunk in response.aiter_bytes():
+                buffer += chunk
+                start = 0
+                while (end := buffer.find(b"\n", start)) != -1:
+                    line = bytes(buffer[start:end]).rstrip(b"\r")
+                    start = end + 1
+                    if line.startswith(b"data: "):
+                        data = line[6:]  # Remove "data: " prefix
+                        if data == b"[DONE]":
+                            return
+                        try:
+                            yield json_loads(data)
+                        except ValueError:
+                            # Each library's decode error subclasses ValueError
+                            pass
+                del buffer[:start]
 
     async def get_history(self, session_id: str) -> dict:
         """Get chat history for a session."""
@@ -97,7 +129,7 @@ class ChatAPIClient:
             return self._demo_response("history", {"session_id": session_id})
 
         response = await self.client.get(f"/history/{session_id}")
-        return response.json()
+        return json_loads(response.content)
 
     async def list_sessions(self) -> dict:
         """List all chat sessions."""
@@ -105,7 +137,7 @@ class ChatAPIClient:
             return self._demo_response("sessions", {})
 
         response = await self.client.get("/sessions")
-        return response.json()
+        return json_loads(response.content)
 
     async def clear_session(self, session_id: str) -> dict:
         """Clear a chat session."""
@@ -113,7 +145,7 @@ class ChatAPIClient:
             return self._demo_response("clear", {"session_id": session_id})
 
         response = await self.client.delete(f"/session/{session_id}")
-        return response.json()
+        return json_loads(response.content)
 
     def _demo_response(self, endpoint: str, params: dict) -> dict:
         """Generate demo response when httpx is not available."""
@@ -130,75 +162,86 @@ class ChatAPIClient:
             await self.client.aclose()
 
 
+# Static description of the server's endpoints
+API_STRUCTURE = {
+    "endpoints": [
+        {
+            "path": "GET /health",
+            "description": "Health check endpoint",
+            "response": {"status": "healthy", "version": "0.1.0"}
+        },
+        {
+            "path": "POST /chat",
+            "description": "Send a message and get response",
+            "request": {
+                "message": "string (required)",
+                "session_id": "string (optional)",
+                "model": "string (optional)",
+                "temperature": "float (optional)"
+            },
+            "response": {
+                "response": "string",
+                "session_id": "string",
+                "model": "string"
+            }
+        },
+        {
+            "path": "POST /chat/stream",
+            "description": "Send a message and stream response (SSE)",
+            "request": {
+                "message": "string (required)",
+                "session_id": "string (optional)"
+            },
+            "response": "Server-Sent Events stream"
+        },
+        {
+            "path": "GET /history/{session_id}",
+            "description": "Get chat history for a session",
+            "response": {
+                "session_id": "string",
+                "messages": [
+                    {"role": "user", "content": "...", "timestamp": "..."}
+                ]
+            }
+        },
+        {
+            "path": "GET /sessions",
+            "description": "List all active sessions",
+            "response": {
+                "sessions": ["session-id-1", "session-id-2"]
+            }
+        },
+        {
+            "path": "DELETE /session/{session_id}",
+            "description": "Clear a session",
+            "response": {"status": "cleared", "session_id": "..."}
+        },
+    ]
+}
+
+
+def _render_api_structure() -> str:
+    """Render API_STRUCTURE as the text printed by api_structure_demo."""
+    parts = []
+    for endpoint in API_STRUCTURE["endpoints"]:
+        parts.append(f"\n{endpoint['path']}\n  {endpoint['description']}\n")
+        if "request" in endpoint:
+            parts.append(f"  Request: {json.dumps(endpoint['request'], indent=4)}\n")
+        parts.append(f"  Response: {json.dumps(endpoint['response'], indent=4)}\n")
+    return "".join(parts)
+
+
+# The structure never changes, so it is rendered once at import
+_API_STRUCTURE_TEXT = _render_api_structure()
+
+
 async def api_structure_demo():
     """Example 1: Show API structure without making calls."""
     print("=" * 60)
     print("Example 1: API Structure Overview")
     print("=" * 60)
 
-    api_structure = {
-        "endpoints": [
-            {
-                "path": "GET /health",
-                "description": "Health check endpoint",
-                "response": {"status": "healthy", "version": "0.1.0"}
-            },
-            {
-                "path": "POST /chat",
-                "description": "Send a message and get response",
-                "request": {
-                    "message": "string (required)",
-                    "session_id": "string (optional)",
-                    "model": "string (optional)",
-                    "temperature": "float (optional)"
-                },
-                "response": {
-                    "response": "string",
-                    "session_id": "string",
-                    "model": "string"
-                }
-            },
-            {
-                "path": "POST /chat/stream",
-                "description": "Send a message and stream response (SSE)",
-                "request": {
-                    "message": "string (required)",
-                    "session_id": "string (optional)"
-                },
-                "response": "Server-Sent Events stream"
-            },
-            {
-                "path": "GET /history/{session_id}",
-                "description": "Get chat history for a session",
-                "response": {
-                    "session_id": "string",
-                    "messages": [
-                        {"role": "user", "content": "...", "timestamp": "..."}
-                    ]
-                }
-            },
-            {
-                "path": "GET /sessions",
-                "description": "List all active sessions",
-                "response": {
-                    "sessions": ["session-id-1", "session-id-2"]
-                }
-            },
-            {
-                "path": "DELETE /session/{session_id}",
-                "description": "Clear a session",
-                "response": {"status": "cleared", "session_id": "..."}
-            },
-        ]
-    }
-
-    for endpoint in api_structure["endpoints"]:
-        print(f"\n{endpoint['path']}")
-        print(f"  {endpoint['description']}")
-        if "request" in endpoint:
-            print(f"  Request: {json.dumps(endpoint['request'], indent=4)}")
-        print(f"  Response: {json.dumps(endpoint['response'], indent=4)}")
-
+    print(_API_STRUCTURE_TEXT, end="")
     print()
 
 
@@ -229,7 +272,7 @@ async def streaming_chat_example(client: ChatAPIClient):
     print("Example 3: Streaming Chat Request")
     print("=" * 60)
 
-    if not HAS_HTTPX:
+    if client.client is None:
         print("Demo mode - would stream:")
         print("  POST /chat/stream")
         print("  Body: {'message': 'Count to 5'}")
@@ -260,16 +303,14 @@ async def session_management_example(client: ChatAPIClient):
     print("Example 4: Session Management")
     print("=" * 60)
 
-    # Create a session by sending a message
-    session_id = None
-
-    response1 = await client.chat("My name is Alice", session_id)
-    session_id = response1.get("session_id")
+    # Create a session by sending a message. Only the needed fields are
+    # kept, so the full reply bodies can be freed right away.
+    session_id = (await client.chat("My name is Alice")).get("session_id")
     print(f"Created session: {session_id}")
 
     # Continue the session
-    response2 = await client.chat("What's my name?", session_id)
-    print(f"Follow-up response: {response2.get('response', 'N/A')[:100]}...")
+    reply = (await client.chat("What's my name?", session_id)).get("response", "N/A")
+    print(f"Follow-up response: {reply[:100]}...")
 
     # Get session history
     history = await client.get_history(session_id)
@@ -325,23 +366,29 @@ async def multi_session_example(client: ChatAPIClient):
     print()
 
 
+# Requests that the server should reject, with each payload's JSON text
+# rendered once for display
+ERROR_SCENARIOS = [
+    (description, payload, json.dumps(payload))
+    for description, payload in [
+        ("Empty message", {"message": ""}),
+        ("Missing message field", {}),
+        ("Invalid session", {"message": "Hello", "session_id": "nonexistent"}),
+    ]
+]
+
+
 async def error_handling_example(client: ChatAPIClient):
     """Example 6: API error handling."""
     print("=" * 60)
     print("Example 6: API Error Handling")
     print("=" * 60)
 
-    error_scenarios = [
-        ("Empty message", {"message": ""}),
-        ("Missing message field", {}),
-        ("Invalid session", {"message": "Hello", "session_id": "nonexistent"}),
-    ]
-
-    for description, payload in error_scenarios:
+    for description, payload, payload_json in ERROR_SCENARIOS:
         print(f"\nScenario: {description}")
-        print(f"  Request: {json.dumps(payload)}")
+        print(f"  Request: {payload_json}")
 
-        if not HAS_HTTPX:
+        if client.client is None:
             print("  Response: {\"demo\": true, \"error\": \"Would return HTTP 400\"}")
         else:
             try:
@@ -369,16 +416,24 @@ async def batch_requests_example(client: ChatAPIClient):
 
     print(f"Processing {len(queries)} queries in parallel...\n")
 
-    if not HAS_HTTPX:
+    if client.client is None:
         print("Demo mode - would send parallel requests:")
         for query in queries:
             print(f"  POST /chat - {query}")
         print()
         return
 
-    # Process all queries concurrently
-    tasks = [client.chat(q) for q in queries]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    # Process the queries concurrently, but never more at once than the
+    # client's connection pool can serve
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def bounded_chat(query: str) -> dict:
+        async with semaphore:
+            return await client.chat(query)
+
+    results = await asyncio.gather(
+        *(bounded_chat(q) for q in queries), return_exceptions=True
+    )
 
     for query, result in zip(queries, results):
         if isinstance(result, Exception):
@@ -415,7 +470,7 @@ async def main():
         print("Note: httpx not installed. Running in demo mode.\n")
         args.demo = True
 
-    client = ChatAPIClient(base_url=args.url)
+    client = ChatAPIClient(base_url=args.url, demo=args.demo)
 
     try:
         # Check server health (if not in demo mode)
@@ -0,0 +1,102 @@
+"""
+Helper for running independent examples concurrently.
+
+Examples are mostly waiting on the LLM, so running them at the same time
+cuts the total wall time to roughly that of the slowest one. Each example's
+printed output is captured separately and shown in the original order, so
+the console reads the same as a sequential run.
+"""
+
+import asyncio
+import io
+import sys
+from contextvars import ContextVar
+from typing import Coroutine, Optional
+
+_output: ContextVar[Optional[io.StringIO]] = ContextVar("example_output", default=None)
+
+
+class _TaskStdout:
+    """stdout proxy that writes to the current example's buffer, if any."""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text: str) -> int:
+        buffer = _output.get()
+        return (buffer if buffer is not None else self._stream).write(text)
+
+    def flush(self) -> None:
+        if _output.get() is None:
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+async def _run_captured(example: Coroutine, semaphore: asyncio.Semaphore):
+    """Run one example with its output captured in its own buffer."""
+    try:
+        await semaphore.acquire()
+    except asyncio.CancelledError:
+        # Cancelled before it started
+        example.close()
+        raise
+
+    buffer = io.StringIO()
+    _output.set(buffer)
+    try:
+        await example
+    except Exception as e:
+        return buffer.getvalue(), e
+    finally:
+        semaphore.release()
+    return buffer.getvalue(), None
+
+
+async def gather_in_order(*examples: Coroutine, limit: int = 4) -> None:
+    """Run examples concurrently and print their output in order.
+
+    Args:
+        *examples: Example coroutines to run
+        limit: Maximum number of examples running at once, to stay under
+            provider rate limits
+
+    Raises:
+        Exception: The first error raised by an example, after the output
+            of all examples before it has been printed
+    """
+    semaphore = asyncio.Semaphore(limit)
+    real_stdout = sys.stdout
+    sys.stdout = _TaskStdout(real_stdout)
+
+    try:
+        tasks = [
+            asyncio.create_task(_run_captured(example, semaphore))
+            for example in examples
+        ]
+
+        # Print each example's output as soon as all earlier ones are done
+        for task in tasks:
+            output, error = await task
+            real_stdout.write(output)
+            real_stdout.flush()
+            if error is not None:
+                for pending in tasks:
+                    pending.cancel()
+                raise error
+    finally:
+        sys.stdout = real_stdout
+
+
+def enable_eager_tasks() -> None:
+    """Start new tasks eagerly on the running loop, where supported.
+
+    With Python 3.12's eager task factory, a task runs synchronously until
+    its first real suspension, so coroutines that finish without waiting
+    (like direct tool calls) complete without an event loop round trip.
+    On older versions this does nothing.
+    """
+    factory = getattr(asyncio, "eager_task_factory", None)
+    if factory is not None:
+        asyncio.get_running_loop().set_task_factory(factory)
@@ -0,0 +1,49 @@
+"""
+Coalescing writer for streamed tokens.
+
+Printing each token with ``flush=True`` costs one write syscall per token.
+``TokenWriter`` collects tokens and flushes them once ``interval`` seconds
+have passed since the last flush, once ``max_buffer`` characters are
+pending, or (by default) on a newline.
+"""
+
+import sys
+import time
+from typing import List
+
+
+class TokenWriter:
+    """Buffer small writes to stdout and flush them in batches."""
+
+    def __init__(
+        self,
+        interval: float = 0.02,
+        max_buffer: int = 256,
+        flush_on_newline: bool = True,
+    ):
+        self.interval = interval
+        self.max_buffer = max_buffer
+        self.flush_on_newline = flush_on_newline
+        self._buffer: List[str] = []
+        self._size = 0
+        self._last_flush = time.monotonic()
+
+    def write(self, text: str) -> None:
+        """Queue text, flushing if a flush condition is met."""
+        self._buffer.append(text)
+        self._size += len(text)
+        if (
+            self._size >= self.max_buffer
+            or (self.flush_on_newline and "\n" in text)
+            or time.monotonic() - self._last_flush > self.interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write out everything buffered so far."""
+        if self._buffer:
+            sys.stdout.write("".join(self._buffer))
+            self._buffer.clear()
+            self._size = 0
+        sys.stdout.flush()
+        self._last_flush = time.monotonic()
@@ -9,6 +9,7 @@ from langgraph.checkpoint.memory import MemorySaver
 
 from chat_shell_101.agent.agent import ChatAgent, AgentState, ToolIterationLimitError
 from chat_shell_101.agent.config import AgentConfig
+from chat_shell_101.agent.prompt import PromptManager
 
 
 pytestmark = [pytest.mark.unit, pytest.mark.epic_1]
@@ -78,6 +79,20 @@ class TestChatAgentInitialization:
         assert result is agent  # Returns self
         assert agent._checkpointer is checkpointer
 
+    def test_initialization_without_model(self):
+        """Test a missing model falls back to the global default."""
+        agent = ChatAgent(AgentConfig(model=None, compress_context=False))
+
+        assert agent.prompts is not None
+
+    def test_anthropic_model_uses_cache_control(self):
+        """Test cache breakpoints are only enabled for Anthropic models."""
+        claude = ChatAgent(AgentConfig(model="claude-3-5-sonnet", compress_context=False))
+        deepseek = ChatAgent(AgentConfig(model="deepseek-chat", compress_context=False))
+
+        assert claude._uses_cache_control()
+        assert not deepseek._uses_cache_control()
+
     def test_compression_initialization(self, agent_config_with_compression):
         """Test compressor is initialized when enabled."""
         agent = ChatAgent(agent_config_with_compression)
@@ -127,6 +142,20 @@ class TestChatAgentMethods:
 
         assert agent._initialized is True
 
+    @pytest.mark.asyncio
+    async def test_initialize_passes_http_client(self, agent_config):
+        """Test that the agent's HTTP client reaches the model factory."""
+        client = object()
+        agent = ChatAgent(agent_config, http_client=client)
+
+        with patch(
+            "chat_shell_101.agent.agent.ModelFactory.create_model_from_config"
+        ) as create_model, patch.object(agent, "_build_graph", return_value=Mock()):
+            await agent.initialize()
+
+        model_config = create_model.call_args.args[0]
+        assert model_config.provider_config.http_client is client
+
     def test_build_graph_creates_compiled_graph(self, agent_config):
         """Test that _build_graph creates a compiled graph."""
         agent = ChatAgent(agent_config)
@@ -253,6 +282,42 @@ class TestToolExecution:
 
         assert result == "Success!"
 
+    @pytest.mark.asyncio
+    async def test_run_tool_calls_concurrently(self, agent_config):
+        """Test that tool calls from one turn overlap and keep call order."""
+        import asyncio
+        from chat_shell_101.tools.base import BaseTool, ToolInput, ToolOutput
+
+        started = []
+        release = asyncio.Event()
+
+        class WaitTool(BaseTool):
+            name = "wait_tool"
+            description = "Waits until released"
+            input_schema = ToolInput
+
+            async def execute(self, input_data):
+                started.append(True)
+                if len(started) == 2:
+                    release.set()
+                await release.wait()
+                return ToolOutput(result=str(len(started)))
+
+        agent = ChatAgent(agent_config)
+        agent.tools_by_name = {"wait_tool": WaitTool()}
+        calls = [
+            {"name": "wait_tool", "args": {}, "id": "call-1"},
+            {"name": "missing", "args": {}, "id": "call-2"},
+            {"name": "wait_tool", "args": {}, "id": "call-3"},
+        ]
+
+        # Would deadlock if the two wait_tool calls ran one after the other
+        messages = await asyncio.wait_for(agent._run_tool_calls(calls), timeout=1)
+
+        assert [m.tool_call_id for m in messages] == ["call-1", "call-2", "call-3"]
+        assert messages[1].status == "error"
+        assert messages[0].content == messages[2].content == "2"
+
 
 class TestStreaming:
     """Test cases for streaming functionality."""
@@ -283,3 +348,283 @@ class TestStreaming:
         result = await agent.invoke([{"role": "user", "content": "Hi"}])
 
         assert result == "Hello world"
+
+    @pytest.fixture
+    def graph_agent(self, agent_config):
+        """Create an agent whose graph runs against a given chat model."""
+
+        def _make(llm, tools=()):
+            agent = ChatAgent(agent_config)
+            agent.llm_with_tools = llm
+            agent.internal_tools = list(tools)
+            agent.tools_by_name = {tool.name: tool for tool in tools}
+            agent.graph = agent._build_graph()
+            agent._initialized = True
+            return agent
+
+        return _make
+
+    @pytest.mark.asyncio
+    async def test_stream_forwards_tokens(self, graph_agent):
+        """Test that model tokens are streamed as content events."""
+        from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+
+        llm = GenericFakeChatModel(messages=iter([AIMessage(content="Hello there world")]))
+        agent = graph_agent(llm)
+
+        events = [
+            event async for event in agent.stream([{"role": "user", "content": "Hi"}])
+        ]
+
+        texts = [e["data"]["text"] for e in events if e["type"] == "content"]
+        assert len(texts) > 1
+        assert "".join(texts) == "Hello there world"
+
+    @pytest.mark.asyncio
+    async def test_stream_runs_each_tool_once(self, graph_agent):
+        """Test that tool calls are executed once with a single follow-up."""
+        from typing import Any, List
+        from langchain_core.language_models.chat_models import BaseChatModel
+        from langchain_core.outputs import ChatGeneration, ChatResult
+        from chat_shell_101.tools.base import BaseTool, ToolInput, ToolOutput
+
+        executions = []
+
+        class CountingTool(BaseTool):
+            name = "counter"
+            description = "Counts executions"
+            input_schema = ToolInput
+
+            async def execute(self, input_data):
+                executions.append(input_data)
+                return ToolOutput(result=f"run {len(executions)}")
+
+        class ScriptedChatModel(BaseChatModel):
+            responses: List[AIMessage]
+            calls: List[Any] = []
+
+            @property
+            def _llm_type(self):
+                return "scripted"
+
+            def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+                self.calls.append(list(messages))
+                message = self.responses[len(self.calls) - 1]
+                return ChatResult(generations=[ChatGeneration(message=message)])
+
+        llm = ScriptedChatModel(responses=[
+            AIMessage(
+                content="",
+                tool_calls=[
+                    {"name": "counter", "args": {}, "id": "call-1"},
+                    {"name": "counter", "args": {}, "id": "call-2"},
+                ],
+            ),
+            AIMessage(content="Done"),
+        ])
+        agent = graph_agent(llm, [CountingTool()])
+
+        events = [
+            event async for event in agent.stream([{"role": "user", "content": "Go"}])
+        ]
+
+        assert len(executions) == 2
+        assert len(llm.calls) == 2
+        followup_input = llm.calls[1]
+        assert sum(isinstance(m, ToolMessage) for m in followup_input) == 2
+        assert sum(isinstance(m, AIMessage) for m in followup_input) == 1
+        calls = [e["data"]["tool_call_id"] for e in events if e["type"] == "tool_call"]
+        assert calls == ["call-1", "call-2"]
+        results = [e["data"]["result"] for e in events if e["type"] == "tool_result"]
+        assert results == ["run 1", "run 2"]
+        assert events[-1] == {"type": "content", "data": {"text": "Done"}, "offset": 4}
+
+    @pytest.mark.asyncio
+    async def test_stream_joins_content_blocks(self, graph_agent):
+        """Test that list-of-blocks content is streamed as plain text."""
+        from langchain_core.language_models.chat_models import BaseChatModel
+        from langchain_core.messages import AIMessageChunk
+        from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+        class BlockChatModel(BaseChatModel):
+            @property
+            def _llm_type(self):
+                return "blocks"
+
+            def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+                message = AIMessage(content=[{"type": "text", "text": "Hello"}])
+                return ChatResult(generations=[ChatGeneration(message=message)])
+
+            def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+                for text in ("Hel", "lo"):
+                    chunk = AIMessageChunk(content=[{"type": "text", "text": text, "index": 0}])
+                    if run_manager:
+                        run_manager.on_llm_new_token(text, chunk=ChatGenerationChunk(message=chunk))
+                    yield ChatGenerationChunk(message=chunk)
+
+        agent = graph_agent(BlockChatModel())
+
+        text = await agent.invoke([{"role": "user", "content": "Hi"}])
+
+        assert text == "Hello"
+
+    @pytest.mark.asyncio
+    async def test_agent_node_keeps_cached_system_message(self, graph_agent):
+        """Test that a matching system message keeps its cache_control."""
+        from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+
+        llm = GenericFakeChatModel(messages=iter([AIMessage(content="Hi")]))
+        sent = []
+        original = llm.ainvoke
+
+        async def recording_ainvoke(messages, *args, **kwargs):
+            sent.append(messages)
+            return await original(messages, *args, **kwargs)
+
+        object.__setattr__(llm, "ainvoke", recording_ainvoke)
+        agent = graph_agent(llm)
+        system = PromptManager._with_cache_control(SystemMessage(content="Be brief."))
+
+        await agent.graph.ainvoke({
+            "messages": [system, HumanMessage(content="Hello")],
+            "system_prompt": "Be brief.",
+        })
+
+        assert sent[0][0].content[-1]["cache_control"] == {"type": "ephemeral"}
+
+    @pytest.mark.asyncio
+    async def test_stream_with_checkpointer_sends_only_new_messages(self, graph_agent):
+        """Test that checkpointed history is not replayed on later turns."""
+        from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+
+        llm = GenericFakeChatModel(messages=iter([
+            AIMessage(content="First"),
+            AIMessage(content="Second"),
+        ]))
+        agent = graph_agent(llm)
+        agent.with_checkpointer(MemorySaver())
+        agent.graph = agent._build_graph()
+        config = {"configurable": {"thread_id": "t1"}}
+        history = [{"role": "user", "content": "One"}]
+
+        history.append({"role": "assistant", "content": await agent.invoke(history, thread_id="t1")})
+        history.append({"role": "user", "content": "Two"})
+        await agent.invoke(history, thread_id="t1")
+
+        state = await agent.graph.aget_state(config)
+        contents = [msg.content for msg in state.values["messages"]]
+        assert contents == ["One", "First", "Two", "Second"]
+
+    @pytest.mark.asyncio
+    async def test_stream_with_checkpointer_resets_iteration_count(self, graph_agent):
+        """Test that tool cycles are counted per turn on a checkpointed thread."""
+        from typing import Any, List
+        from langchain_core.language_models.chat_models import BaseChatModel
+        from langchain_core.outputs import ChatGeneration, ChatResult
+        from chat_shell_101.tools.base import BaseTool, ToolInput, ToolOutput
+
+        class EchoTool(BaseTool):
+            name = "echo"
+            description = "Echoes"
+            input_schema = ToolInput
+
+            async def execute(self, input_data):
+                return ToolOutput(result="ok")
+
+        class ScriptedChatModel(BaseChatModel):
+            responses: List[AIMessage]
+            calls: List[Any] = []
+
+            @property
+            def _llm_type(self):
+                return "scripted"
+
+            def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+                self.calls.append(list(messages))
+                message = self.responses[len(self.calls) - 1]
+                return ChatResult(generations=[ChatGeneration(message=message)])
+
+        def tool_turn(call_id):
+            return [
+                AIMessage(content="", tool_calls=[{"name": "echo", "args": {}, "id": call_id}]),
+                AIMessage(content="Done"),
+            ]
+
+        llm = ScriptedChatModel(responses=tool_turn("call-1") + tool_turn("call-2"))
+        agent = graph_agent(llm, [EchoTool()])
+        agent.config.max_iterations = 2
+        agent.with_checkpointer(MemorySaver())
+        agent.graph = agent._build_graph()
+        config = {"configurable": {"thread_id": "t1"}}
+
+        history = [{"role": "user", "content": "One"}]
+        history.append({"role": "assistant", "content": await agent.invoke(history, thread_id="t1")})
+        assert (await agent.graph.aget_state(config)).values["iteration_count"] == 1
+
+        history.append({"role": "user", "content": "Two"})
+        assert await agent.invoke(history, thread_id="t1") == "Done"
+        assert (await agent.graph.aget_state(config)).values["iteration_count"] == 1
+
+
+class TestMessageConversion:
+    """Test cases for cached LangChain message conversion."""
+
+    def test_converts_roles(self, agent_config):
+        """Test that dict messages are converted by role."""
+        agent = ChatAgent(agent_config)
+
+        result = agent._to_langchain_messages([
+            {"role": "system", "content": "Sys"},
+            {"role": "user", "content": "Hi"},
+            {"role": "assistant", "content": "Hello"},
+        ])
+
+        assert [type(m) for m in result] == [SystemMessage, HumanMessage, AIMessage]
+        assert [m.content for m in result] == ["Sys", "Hi", "Hello"]
+
+    def test_reuses_cached_prefix(self, agent_config):
+        """Test that a previously converted prefix is reused by reference."""
+        agent = ChatAgent(agent_config)
+        turn1 = [{"role": "user", "content": "Hi"}]
+        turn2 = turn1 + [
+            {"role": "assistant", "content": "Hello"},
+            {"role": "user", "content": "How are you?"},
+        ]
+
+        first = agent._to_langchain_messages(turn1)
+        second = agent._to_langchain_messages(turn2)
+
+        assert second[0] is first[0]
+        assert len(second) == 3
+        assert second[-1].content == "How are you?"
+
+    def test_returned_list_is_not_cached_list(self, agent_config):
+        """Test that mutating the result does not corrupt the cache."""
+        agent = ChatAgent(agent_config)
+        messages = [{"role": "user", "content": "Hi"}]
+
+        first = agent._to_langchain_messages(messages)
+        first.append(AIMessage(content="extra"))
+        second = agent._to_langchain_messages(messages)
+
+        assert len(second) == 1
+
+    def test_changed_history_is_not_reused(self, agent_config):
+        """Test that a differing prefix is converted afresh."""
+        agent = ChatAgent(agent_config)
+
+        first = agent._to_langchain_messages([{"role": "user", "content": "A"}])
+        second = agent._to_langchain_messages([{"role": "user", "content": "B"}])
+
+        assert second[0] is not first[0]
+        assert second[0].content == "B"
+
+    def test_hash_collision_is_not_reused(self, agent_config):
+        """Test that a colliding hash does not return another history."""
+        agent = ChatAgent(agent_config)
+
+        with patch("chat_shell_101.agent.agent.hash", create=True, return_value=0):
+            agent._to_langchain_messages([{"role": "user", "content": "A"}])
+            second = agent._to_langchain_messages([{"role": "user", "content": "B"}])
+
+        assert [msg.content for msg in second] == ["B"]
@@ -119,3 +119,20 @@ class TestAgentConfig:
 
         with pytest.raises(ValueError, match="checkpoint_path"):
             AgentConfig(checkpoint_type="sqlite")
+
+    def test_unknown_attribute_rejected(self):
+        """Test that slotted configs reject attributes that are not fields."""
+        config = AgentConfig()
+        assert not hasattr(config, "__dict__")
+
+        with pytest.raises(AttributeError):
+            config.temprature = 0.5
+
+    def test_config_is_serializable(self):
+        """Test that every field converts with dataclasses.asdict."""
+        from dataclasses import asdict
+
+        data = asdict(AgentConfig(tools=["calculator"]))
+
+        assert data["tools"] == ["calculator"]
+        assert "http_client" not in data
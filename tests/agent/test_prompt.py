@@ -0,0 +1,126 @@
+"""
+Tests for PromptManager - prompt prefix caching.
+"""
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from chat_shell_101.agent.prompt import PromptManager
+
+
+pytestmark = [pytest.mark.unit, pytest.mark.epic_1]
+
+
+class TestPromptManager:
+    """Test cases for PromptManager."""
+
+    def test_new_session_has_system_prefix(self):
+        """Test that a new session starts with the system prompt."""
+        prompts = PromptManager(system_prompt="Be brief.")
+
+        messages = prompts.build("s1")
+
+        assert len(messages) == 1
+        assert isinstance(messages[0], SystemMessage)
+        assert messages[0].content == "Be brief."
+
+    def test_build_appends_pending_user(self):
+        """Test that the pending user turn comes after the prefix."""
+        prompts = PromptManager(system_prompt="Be brief.")
+        prompts.append_user("s1", "Hello")
+
+        messages = prompts.build("s1")
+
+        assert isinstance(messages[-1], HumanMessage)
+        assert messages[-1].content == "Hello"
+
+    def test_commit_grows_prefix_by_reference(self):
+        """Test that committed prefix objects are reused verbatim."""
+        prompts = PromptManager(system_prompt="Be brief.")
+        prompts.append_user("s1", "Hello")
+        prompts.commit("s1", "Hi!")
+        first = prompts.build("s1")
+
+        prompts.append_user("s1", "How are you?")
+        second = prompts.build("s1")
+
+        assert len(first) == 3
+        assert isinstance(first[-1], AIMessage)
+        assert all(a is b for a, b in zip(first, second))
+        assert second[-1].content == "How are you?"
+
+    def test_commit_without_pending_is_noop(self):
+        """Test that committing without a user turn does nothing."""
+        prompts = PromptManager()
+
+        prompts.commit("s1", "orphan")
+
+        assert prompts.build("s1") == []
+
+    def test_dynamic_context_not_committed(self):
+        """Test that dynamic context is placed before the user turn only once."""
+        prompts = PromptManager()
+        prompts.append_user("s1", "Question")
+        context = [SystemMessage(content="Today is Monday.")]
+
+        messages = prompts.build("s1", dynamic_context=context)
+        prompts.commit("s1", "Answer")
+
+        assert [m.content for m in messages] == ["Today is Monday.", "Question"]
+        assert [m.content for m in prompts.build("s1")] == ["Question", "Answer"]
+
+    def test_load_history(self):
+        """Test seeding a session from stored history."""
+        prompts = PromptManager(system_prompt="Sys")
+
+        prompts.load_history(
+            "s1",
+            [
+                {"role": "user", "content": "Hi"},
+                {"role": "assistant", "content": "Hello"},
+            ],
+        )
+
+        assert [m.content for m in prompts.build("s1")] == ["Sys", "Hi", "Hello"]
+
+    def test_reset(self):
+        """Test that reset drops committed turns."""
+        prompts = PromptManager()
+        prompts.append_user("s1", "Hi")
+        prompts.commit("s1", "Hello")
+
+        prompts.reset("s1")
+
+        assert not prompts.has_session("s1")
+        assert prompts.build("s1") == []
+
+    def test_least_recently_used_session_is_dropped(self):
+        """Test that sessions beyond max_sessions are evicted LRU-first."""
+        prompts = PromptManager(max_sessions=2)
+        prompts.append_user("a", "Hi")
+        prompts.load_history("b", [{"role": "user", "content": "Old"}])
+        prompts.build("a")
+        prompts.append_user("c", "Hey")
+
+        assert prompts.has_session("a")
+        assert not prompts.has_session("b")
+        assert prompts.has_session("c")
+
+    def test_invalid_max_sessions(self):
+        """Test that max_sessions must be positive."""
+        with pytest.raises(ValueError):
+            PromptManager(max_sessions=0)
+
+    def test_cache_control_marks_last_prefix_message(self):
+        """Test that cache control marks a copy of the last prefix message."""
+        prompts = PromptManager(system_prompt="Sys", cache_control=True)
+        prompts.append_user("s1", "Hi")
+
+        messages = prompts.build("s1")
+        prefix = prompts.get_session("s1").prefix_messages
+
+        assert messages[0].content == [
+            {"type": "text", "text": "Sys", "cache_control": {"type": "ephemeral"}}
+        ]
+        assert prefix[0].content == "Sys"
+        assert messages[-1].content == "Hi"
@@ -0,0 +1,30 @@
+"""
+Tests for the cached API clock.
+"""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from chat_shell_101.api import clock
+from chat_shell_101.api.clock import now_cached
+
+
+@pytest.mark.epic_4
+@pytest.mark.unit
+class TestCachedClock:
+    """Test now_cached."""
+
+    def test_returns_current_time(self):
+        """Test that the cached time is close to the current time."""
+        assert abs((now_cached() - datetime.now()).total_seconds()) < 1
+
+    def test_reuses_time_within_interval(self):
+        """Test that the time is reused until the interval has passed."""
+        with patch.object(clock.time, "monotonic", return_value=1e9):
+            cached = now_cached()
+            assert now_cached() is cached
+
+        with patch.object(clock.time, "monotonic", return_value=1e9 + clock.CLOCK_INTERVAL):
+            assert now_cached() is not cached
@@ -42,6 +42,23 @@ class TestChatSchemas:
         assert request.temperature == 0.7
         assert request.stream is True  # default
 
+    def test_chat_request_to_agent_messages(self):
+        """Test converting request messages to the agent's dict format."""
+        request = ChatRequest(
+            messages=[
+                {"role": "system", "content": "Be brief."},
+                ChatMessage(role=MessageRole.USER, content="Hello"),
+            ],
+        )
+
+        messages = request.to_agent_messages()
+
+        assert messages == [
+            {"role": "system", "content": "Be brief."},
+            {"role": "user", "content": "Hello"},
+        ]
+        assert type(messages[1]["role"]) is str
+
     def test_chat_request_defaults(self):
         """Test ChatRequest default values."""
         request = ChatRequest(
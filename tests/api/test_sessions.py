@@ -0,0 +1,79 @@
+"""
+Tests for bounded session tracking.
+"""
+
+import pytest
+
+from chat_shell_101.api import sessions as sessions_module
+from chat_shell_101.api.sessions import SessionStore
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Replace the monotonic clock with a controllable one."""
+    now = [1000.0]
+    monkeypatch.setattr(sessions_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.mark.epic_4
+@pytest.mark.unit
+class TestSessionStore:
+    """Test SessionStore eviction and status handling."""
+
+    def test_set_and_get(self):
+        """Test storing and retrieving a session."""
+        store = SessionStore()
+        store["sub-1"] = {"session_id": "s1", "status": "running"}
+
+        assert "sub-1" in store
+        assert store["sub-1"]["session_id"] == "s1"
+        assert len(store) == 1
+        assert store.get("missing") is None
+
+    def test_evicts_oldest_over_maxsize(self):
+        """Test that the oldest running session is evicted first."""
+        store = SessionStore(maxsize=2)
+        for i in range(3):
+            store[f"sub-{i}"] = {"status": "running"}
+
+        assert "sub-0" not in store
+        assert list(store) == ["sub-1", "sub-2"]
+
+    def test_expires_after_ttl(self, fake_clock):
+        """Test that running sessions expire after the TTL."""
+        store = SessionStore(ttl=10.0)
+        store["sub-1"] = {"status": "running"}
+
+        fake_clock[0] += 11.0
+
+        assert store.get("sub-1") is None
+        assert len(store) == 0
+
+    def test_terminal_status_moves_to_completed(self):
+        """Test that finished sessions leave the active count but stay readable."""
+        store = SessionStore()
+        store["sub-1"] = {"status": "running"}
+
+        store.set_status("sub-1", "cancelled", cancellation_reason="user")
+
+        assert len(store) == 0
+        assert store["sub-1"]["status"] == "cancelled"
+        assert store["sub-1"]["cancellation_reason"] == "user"
+
+    def test_completed_ring_is_bounded(self):
+        """Test that only the most recent finished sessions are kept."""
+        store = SessionStore(completed_size=2)
+        for i in range(3):
+            store[f"sub-{i}"] = {"status": "completed"}
+
+        assert "sub-0" not in store
+        assert "sub-1" in store
+        assert "sub-2" in store
+
+    def test_set_status_unknown_raises(self):
+        """Test that updating an unknown session raises KeyError."""
+        store = SessionStore()
+
+        with pytest.raises(KeyError):
+            store.set_status("missing", "cancelled")
@@ -140,6 +140,23 @@ class TestModelFactoryFromConfig:
         llm = ModelFactory.create_model_from_config(config)
         assert llm is not None
 
+    @pytest.mark.asyncio
+    async def test_create_from_config_shares_http_client(self):
+        """Test that a provided HTTP client is used by the OpenAI model."""
+        import httpx
+        from chat_shell_101.models.config import ProviderConfig
+
+        async with httpx.AsyncClient() as client:
+            config = ModelConfig(
+                provider="openai",
+                model="gpt-4",
+                provider_config=ProviderConfig(api_key="test-key", http_client=client),
+            )
+
+            llm = ModelFactory.create_model_from_config(config)
+
+            assert llm.http_async_client is client
+
     def test_create_from_config_auto_detect_provider(self):
         """Test that provider is auto-detected from model name."""
         config = ModelConfig(model="claude-3-opus-20240229")  # No provider specified
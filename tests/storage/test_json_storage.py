@@ -0,0 +1,245 @@
+"""
+Tests for JSON storage implementation.
+"""
+
+import asyncio
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from chat_shell_101.storage.json_storage import JSONHistoryStorage, JSONStorage
+from chat_shell_101.storage.interfaces import Message
+
+
+@pytest.fixture
+async def temp_storage_path():
+    """Create a temporary storage directory."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest.fixture
+async def json_history_storage(temp_storage_path):
+    """Create JSON history storage."""
+    return JSONHistoryStorage(temp_storage_path)
+
+
+@pytest.mark.epic_6
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestJSONHistoryStorage:
+    """Test JSON history storage implementation."""
+
+    async def test_append_and_get_messages(self, json_history_storage):
+        """Test appending and retrieving messages."""
+        session_id = "test-session-1"
+        messages = [
+            Message(role="user", content="Hello"),
+            Message(role="assistant", content="Hi there!"),
+        ]
+
+        await json_history_storage.append_messages(session_id, messages)
+        retrieved = await json_history_storage.get_history(session_id)
+
+        assert len(retrieved) == 2
+        assert retrieved[0].role == "user"
+        assert retrieved[0].content == "Hello"
+        assert retrieved[1].role == "assistant"
+        assert retrieved[1].content == "Hi there!"
+
+    async def test_get_history_limit(self, json_history_storage):
+        """Test that limit returns only the most recent messages in order."""
+        session_id = "test-limit"
+        await json_history_storage.append_messages(
+            session_id,
+            [Message(role="user", content=str(i)) for i in range(5)],
+        )
+
+        recent = await json_history_storage.get_history(session_id, limit=2)
+
+        assert [m.content for m in recent] == ["3", "4"]
+
+    async def test_get_history_empty_session(self, json_history_storage):
+        """Test getting history for non-existent session."""
+        history = await json_history_storage.get_history("non-existent")
+        assert history == []
+
+    async def test_append_only_writes_new_lines(self, json_history_storage):
+        """Test that each append adds one line per message."""
+        session_id = "test-append"
+
+        await json_history_storage.append_messages(
+            session_id, [Message(role="user", content="First")]
+        )
+        await json_history_storage.append_messages(
+            session_id, [Message(role="assistant", content="Second")]
+        )
+
+        lines = json_history_storage._get_session_file(session_id).read_text().splitlines()
+        assert [json.loads(line)["content"] for line in lines] == ["First", "Second"]
+
+    async def test_history_survives_new_instance(self, temp_storage_path):
+        """Test that a fresh instance reads messages written to disk."""
+        writer = JSONHistoryStorage(temp_storage_path)
+        await writer.append_messages(
+            "persisted", [Message(role="user", content="Saved")]
+        )
+
+        reader = JSONHistoryStorage(temp_storage_path)
+        history = await reader.get_history("persisted")
+
+        assert [m.content for m in history] == ["Saved"]
+
+    async def test_flush_every_buffers_writes(self, temp_storage_path):
+        """Test that writes are deferred until flush_every is reached."""
+        storage = JSONHistoryStorage(temp_storage_path, flush_every=3)
+        session_file = storage._get_session_file("buffered")
+
+        await storage.append_messages("buffered", [Message(role="user", content="1")])
+        assert not session_file.exists()
+        assert len(await storage.get_history("buffered")) == 1
+
+        await storage.append_messages(
+            "buffered",
+            [Message(role="assistant", content="2"), Message(role="user", content="3")],
+        )
+        assert len(session_file.read_text().splitlines()) == 3
+        assert len(await storage.get_history("buffered")) == 3
+
+    async def test_clear_history(self, json_history_storage):
+        """Test clearing history for a session."""
+        session_id = "test-session-clear"
+
+        await json_history_storage.append_messages(
+            session_id, [Message(role="user", content="Test message")]
+        )
+        await json_history_storage.clear_history(session_id)
+
+        history = await json_history_storage.get_history(session_id)
+        assert history == []
+        assert not json_history_storage._get_session_file(session_id).exists()
+
+    async def test_torn_last_line_is_skipped(self, temp_storage_path, caplog):
+        """Test that a partial final line does not hide the whole session."""
+        writer = JSONHistoryStorage(temp_storage_path)
+        await writer.append_messages("torn", [Message(role="user", content="Kept")])
+        session_file = writer._get_session_file("torn")
+        with session_file.open("a", encoding="utf-8") as f:
+            f.write('{"role": "assistant", "cont')
+
+        history = await JSONHistoryStorage(temp_storage_path).get_history("torn")
+
+        assert [m.content for m in history] == ["Kept"]
+        assert "incomplete last line" in caplog.text
+
+    async def test_append_after_torn_line(self, temp_storage_path):
+        """Test that appending drops a partial final line first."""
+        writer = JSONHistoryStorage(temp_storage_path)
+        await writer.append_messages("torn", [Message(role="user", content="Kept")])
+        with writer._get_session_file("torn").open("a", encoding="utf-8") as f:
+            f.write('{"role": "assistant", "cont')
+
+        await writer.append_messages("torn", [Message(role="assistant", content="Next")])
+
+        history = await JSONHistoryStorage(temp_storage_path).get_history("torn")
+        assert [m.content for m in history] == ["Kept", "Next"]
+
+    async def test_cache_evicts_least_recently_used(self, temp_storage_path):
+        """Test that only cache_size sessions are kept in memory."""
+        storage = JSONHistoryStorage(temp_storage_path, cache_size=2)
+        for session_id in ("a", "b", "c"):
+            await storage.append_messages(session_id, [Message(role="user", content=session_id)])
+        await storage.get_history("a")
+        await storage.get_history("b")
+        await storage.get_history("a")
+        await storage.get_history("c")
+
+        assert list(storage._history_cache) == ["a", "c"]
+        assert [m.content for m in await storage.get_history("b")] == ["b"]
+
+    async def test_invalid_cache_size(self, temp_storage_path):
+        """Test that cache_size must be positive."""
+        with pytest.raises(ValueError):
+            JSONHistoryStorage(temp_storage_path, cache_size=0)
+
+    async def test_reads_and_migrates_legacy_file(self, json_history_storage):
+        """Test that single-document session files are still readable."""
+        legacy_file = json_history_storage._get_legacy_session_file("legacy")
+        legacy_file.write_text(json.dumps({
+            "session_id": "legacy",
+            "messages": [{"role": "user", "content": "Old", "timestamp": None}],
+        }))
+
+        assert [m.content for m in await json_history_storage.get_history("legacy")] == ["Old"]
+
+        await json_history_storage.append_messages(
+            "legacy", [Message(role="assistant", content="New")]
+        )
+
+        assert not legacy_file.exists()
+        reloaded = await JSONHistoryStorage(
+            json_history_storage.storage_path
+        ).get_history("legacy")
+        assert [m.content for m in reloaded] == ["Old", "New"]
+
+
+@pytest.mark.epic_6
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestJSONStorage:
+    """Test JSON storage provider implementation."""
+
+    async def test_close_flushes_buffer(self, temp_storage_path):
+        """Test that closing the provider writes buffered messages."""
+        storage = JSONStorage(temp_storage_path, flush_every=100)
+        await storage.initialize()
+
+        await storage.history.append_messages(
+            "closing", [Message(role="user", content="Pending")]
+        )
+        await storage.close()
+
+        history = await JSONHistoryStorage(temp_storage_path).get_history("closing")
+        assert [m.content for m in history] == ["Pending"]
+
+    async def test_close_drops_cached_sessions(self, temp_storage_path):
+        """Test that closing the provider releases the history cache."""
+        storage = JSONStorage(temp_storage_path)
+        await storage.initialize()
+        await storage.history.append_messages("cached", [Message(role="user", content="Hi")])
+        await storage.history.get_history("cached")
+
+        await storage.close()
+
+        assert storage.history._history_cache == {}
+
+    async def test_flush_interval_writes_in_background(self, temp_storage_path):
+        """Test that buffered messages are flushed on the interval."""
+        storage = JSONStorage(temp_storage_path, flush_every=100, flush_interval=0.01)
+        await storage.initialize()
+
+        try:
+            await storage.history.append_messages(
+                "periodic", [Message(role="user", content="Pending")]
+            )
+            session_file = storage.history._get_session_file("periodic")
+            assert not session_file.exists()
+
+            await asyncio.sleep(0.1)
+            assert len(session_file.read_text().splitlines()) == 1
+        finally:
+            await storage.close()
+
+    async def test_invalid_flush_interval(self, temp_storage_path):
+        """Test that a non-positive flush_interval is rejected."""
+        with pytest.raises(ValueError, match="flush_interval"):
+            JSONStorage(temp_storage_path, flush_interval=0)
+
+    async def test_history_property_before_initialize(self, temp_storage_path):
+        """Test that accessing history before initialize raises error."""
+        storage = JSONStorage(temp_storage_path)
+
+        with pytest.raises(RuntimeError, match="not initialized"):
+            _ = storage.history
@@ -58,6 +58,17 @@ class TestSQLiteHistoryStorage:
         assert "sessions" in tables
         assert "messages" in tables
 
+    async def test_initialize_enables_wal(self, temp_db_path):
+        """Test that initialization switches the database to WAL mode."""
+        storage = SQLiteHistoryStorage(temp_db_path)
+        await storage.initialize()
+
+        conn = storage._get_connection()
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        conn.close()
+
+        assert journal_mode == "wal"
+
     async def test_append_and_get_messages(self, sqlite_history_storage):
         """Test appending and retrieving messages."""
         session_id = "test-session-1"
@@ -75,6 +86,18 @@ class TestSQLiteHistoryStorage:
         assert retrieved[1].role == "assistant"
         assert retrieved[1].content == "Hi there!"
 
+    async def test_get_history_limit(self, sqlite_history_storage):
+        """Test that limit returns only the most recent messages in order."""
+        session_id = "test-limit"
+        await sqlite_history_storage.append_messages(
+            session_id,
+            [Message(role="user", content=str(i)) for i in range(5)],
+        )
+
+        recent = await sqlite_history_storage.get_history(session_id, limit=2)
+
+        assert [m.content for m in recent] == ["3", "4"]
+
     async def test_get_history_empty_session(self, sqlite_history_storage):
         """Test getting history for non-existent session."""
         history = await sqlite_history_storage.get_history("non-existent")
@@ -4,6 +4,7 @@ Tests for streaming core module.
 
 import pytest
 import asyncio
+import json
 from typing import AsyncGenerator
 
 from chat_shell_101.streaming.core import (
@@ -24,6 +25,7 @@ from chat_shell_101.streaming.exceptions import (
     StreamNotFoundError,
     StreamAlreadyExistsError,
     StreamCompletedError,
+    StreamingError,
 )
 
 # Mark all tests in this module as Epic 5 tests
@@ -278,6 +280,68 @@ class TestStreamingCore:
         assert info["can_recover"] is True
         assert "buffer_coverage" in info
 
+    @pytest.mark.asyncio
+    async def test_replay_finished_stream(self, core):
+        """Test replaying a finished stream from an offset."""
+        config = StreamConfig(emit_checkpoints=False)
+        await core.create_stream("stream-1", "session-1", config=config)
+
+        async def event_generator(ctx: StreamContext) -> AsyncGenerator[ChunkEvent, None]:
+            for i in range(3):
+                yield ChunkEvent(offset=0, session_id="test", text=f"Message {i}")
+
+        await core.start_stream("stream-1", event_generator)
+        await wait_for_stream_status(core, "stream-1", "completed")
+
+        replayed = [sse async for sse in core.replay_stream("stream-1", from_offset=1)]
+
+        assert len(replayed) == 3
+        assert "Message 1" in replayed[0]
+        assert "Message 2" in replayed[1]
+        assert replayed[2].startswith("event: complete")
+
+    @pytest.mark.asyncio
+    async def test_replay_terminal_event_matches_live(self, core):
+        """Test that a replayed terminal event equals the one sent live."""
+        config = StreamConfig(emit_checkpoints=False)
+        await core.create_stream("stream-1", "session-1", config=config)
+        live = []
+        emit = core._emit_to_stream
+
+        async def record(stream_id, event):
+            live.append(event)
+            await emit(stream_id, event)
+
+        core._emit_to_stream = record
+
+        async def event_generator(ctx: StreamContext) -> AsyncGenerator[ChunkEvent, None]:
+            for i in range(3):
+                yield ChunkEvent(offset=0, session_id="test", text=f"Message {i}")
+
+        await core.start_stream("stream-1", event_generator)
+        await wait_for_stream_status(core, "stream-1", "completed")
+
+        live_complete = next(e for e in live if isinstance(e, CompleteEvent))
+        replayed = [sse async for sse in core.replay_stream("stream-1")]
+
+        def payload(sse: str) -> dict:
+            data = next(line for line in sse.splitlines() if line.startswith("data: "))
+            fields = json.loads(data[len("data: "):])
+            fields.pop("timestamp", None)
+            return fields
+
+        assert live_complete.final_offset == live_complete.offset
+        assert payload(replayed[-1]) == payload(core.emitter.format_event(live_complete))
+
+    @pytest.mark.asyncio
+    async def test_replay_active_stream_raises(self, core):
+        """Test that replaying a stream that is still running raises error."""
+        await core.create_stream("stream-1", "session-1")
+
+        with pytest.raises(StreamingError):
+            async for _ in core.replay_stream("stream-1"):
+                pass
+
     @pytest.mark.asyncio
     async def test_get_stats(self, core):
         """Test getting streaming statistics."""
@@ -4,6 +4,7 @@ Tests for SSE emitter module.
 
 import pytest
 import asyncio
+import json
 from datetime import datetime, timedelta
 
 from chat_shell_101.streaming.emitter import (
@@ -12,7 +13,7 @@ from chat_shell_101.streaming.emitter import (
     SSEMessage,
     ConnectionState,
 )
-from chat_shell_101.streaming.events import ChunkEvent, EventType
+from chat_shell_101.streaming.events import ChunkEvent, EventType, StreamOffsetEvent
 from chat_shell_101.streaming.exceptions import ClientDisconnectedError
 
 
@@ -238,6 +239,20 @@ class TestSSEEmitter:
         assert msg1.id == "1"
         assert msg2.id == "2"
 
+    @pytest.mark.asyncio
+    async def test_offset_ids(self):
+        """Test that offset ids use the stream offset and skip checkpoints."""
+        emitter = SSEEmitter(enable_heartbeats=False, use_offset_ids=True)
+        client = await emitter.register_client(stream_id="stream-1", client_id="client-1")
+
+        await emitter.emit("client-1", StreamOffsetEvent(offset=7, session_id="test"))
+        await emitter.emit("client-1", ChunkEvent(offset=7, session_id="test", text="Hello"))
+
+        assert client.queue.get_nowait().id is None
+        assert client.queue.get_nowait().id == "7"
+
+        await emitter.close()
+
     @pytest.mark.asyncio
     async def test_emit_to_stream(self, emitter):
         """Test emitting to all clients on a stream."""
@@ -253,6 +268,22 @@ class TestSSEEmitter:
         assert results["client-2"] is True
         assert "client-3" not in results
 
+    @pytest.mark.asyncio
+    async def test_emit_to_stream_shares_payload(self, emitter):
+        """Test that a stream event is serialized once for all clients."""
+        client1 = await emitter.register_client(stream_id="stream-1", client_id="client-1")
+        client2 = await emitter.register_client(stream_id="stream-1", client_id="client-2")
+
+        event = ChunkEvent(offset=0, session_id="test", text="Hello")
+
+        await emitter.emit_to_stream("stream-1", event)
+
+        msg1 = client1.queue.get_nowait()
+        msg2 = client2.queue.get_nowait()
+        assert msg1.data is msg2.data
+        assert json.loads(msg1.data)["data"]["text"] == "Hello"
+        assert msg1.id != msg2.id
+
     @pytest.mark.asyncio
     async def test_emit_batch(self, emitter):
         """Test emitting batch of events."""
@@ -47,6 +47,28 @@ class TestFileReaderTool:
         assert result.error is not None or result.result == ""
         assert "not found" in result.error.lower() or "File not found" in result.error
 
+    @pytest.mark.asyncio
+    async def test_read_directory_returns_error(self, tool, temp_dir):
+        """Test reading a directory returns a not-a-file error."""
+        dir_path = temp_dir / "notes.txt"
+        dir_path.mkdir()
+
+        input_data = FileReaderInput(file_path=str(dir_path))
+        result = await tool.execute(input_data)
+
+        assert "not a file" in result.error.lower()
+
+    @pytest.mark.asyncio
+    async def test_text_metadata_file_size(self, tool, temp_dir):
+        """Test text metadata reports the file's size on disk."""
+        file_path = temp_dir / "test.txt"
+        file_path.write_text("Hello, World!")
+
+        input_data = FileReaderInput(file_path=str(file_path))
+        result = await tool.execute(input_data)
+
+        assert result.metadata.file_size == file_path.stat().st_size
+
     @pytest.mark.asyncio
     async def test_read_unsupported_file(self, tool, temp_dir):
         """Test reading unsupported file type returns error."""
@@ -0,0 +1,100 @@
+"""
+Tests for ToolRegistry LangChain conversion.
+"""
+
+import pytest
+from pydantic import Field
+
+from chat_shell_101.tools.base import BaseTool, ToolInput, ToolOutput
+from chat_shell_101.tools.calculator import CalculatorTool
+from chat_shell_101.tools.registry import ToolRegistry
+
+
+pytestmark = [pytest.mark.unit, pytest.mark.epic_1]
+
+
+class EchoInput(ToolInput):
+    """Input for EchoTool."""
+
+    text: str = Field(..., description="Text to echo")
+
+
+class EchoTool(BaseTool):
+    """Tool that returns its input."""
+
+    name = "echo"
+    description = "Echo text back"
+    input_schema = EchoInput
+
+    async def execute(self, input_data: EchoInput) -> ToolOutput:
+        return ToolOutput(result=input_data.text)
+
+
+class TestToLangchainTools:
+    """Test cases for ToolRegistry.to_langchain_tools."""
+
+    @pytest.mark.asyncio
+    async def test_each_wrapper_calls_its_own_tool(self):
+        """Test that wrappers are bound to their own tool, not the last one."""
+        registry = ToolRegistry()
+        registry.register(CalculatorTool())
+        registry.register(EchoTool())
+
+        tools = {t.name: t for t in registry.to_langchain_tools()}
+
+        assert await tools["calculator"].ainvoke({"expression": "2 + 3"}) == "5"
+        assert await tools["echo"].ainvoke({"text": "hi"}) == "hi"
+
+    def test_conversion_is_cached(self):
+        """Test that repeated conversions reuse the same tool objects."""
+        registry = ToolRegistry()
+        registry.register(CalculatorTool())
+
+        first = registry.to_langchain_tools()
+        second = registry.to_langchain_tools()
+
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+
+    def test_register_invalidates_cache(self):
+        """Test that registering or unregistering rebuilds the tools."""
+        registry = ToolRegistry()
+        registry.register(CalculatorTool())
+        registry.to_langchain_tools()
+
+        registry.register(EchoTool())
+        assert [t.name for t in registry.to_langchain_tools()] == ["calculator", "echo"]
+
+        registry.unregister("calculator")
+        assert [t.name for t in registry.to_langchain_tools()] == ["echo"]
+
+    def test_tool_specs_are_cached(self):
+        """Test that tool specs are built once and rebuilt on register."""
+        registry = ToolRegistry()
+        registry.register(CalculatorTool())
+
+        first = registry.get_tool_specs()
+        second = registry.get_tool_specs()
+
+        assert first[0] is second[0]
+        assert first[0]["function"]["name"] == "calculator"
+        assert "expression" in first[0]["function"]["parameters"]["properties"]
+
+        registry.register(EchoTool())
+        assert [s["function"]["name"] for s in registry.get_tool_specs()] == [
+            "calculator",
+            "echo",
+        ]
+
+    def test_tool_schemas_are_cached(self):
+        """Test that input schemas are built once and rebuilt on register."""
+        registry = ToolRegistry()
+        registry.register(CalculatorTool())
+
+        first = registry.get_tool_schemas()
+        second = registry.get_tool_schemas()
+
+        assert first["calculator"] is second["calculator"]
+
+        registry.register(EchoTool())
+        assert set(registry.get_tool_schemas()) == {"calculator", "echo"}